@@ -0,0 +1,234 @@
+"""
+Cold vs. Warm Cache and HTTP Conditional-Request Probe
+DevOps Lab - Section E
+
+/api/disciplines, /api/universities/stats (four aggregations per call)
+and /api/universities/top return data that hardly ever changes, yet
+every call is computed and sent again in full. For each endpoint this
+probe measures:
+
+- cold:   the first call of the run (on an already open connection)
+- warm:   the median of the repeated calls that follow
+- floor:  an unknown route answered with 404, i.e. network + framework
+          cost without any database work
+
+and checks the caching headers (ETag, Last-Modified, Cache-Control,
+Expires) and whether a conditional request (If-None-Match /
+If-Modified-Since) is answered with 304 Not Modified.
+
+From these it estimates, per repeated call, what a correct caching
+setup would save:
+
+- revalidation: a 304 instead of the full body (bytes; only transfer
+  time, because Express builds the body before computing the ETag)
+- freshness:    Cache-Control max-age lets the browser skip the request
+  entirely (the full warm latency and body)
+- server cache: memoising the result leaves only the floor latency
+
+Usage:
+    python cache_probe.py --backend-url http://localhost:5000 --repeats 10
+
+Author: DevOps Lab Project
+"""
+
+import argparse
+import re
+import time
+
+from http_client import PooledHttpClient
+from perf_report import format_bytes, format_ms, median, print_section, write_html_report, write_text_report
+from test_university_app import BACKEND_URL
+
+
+DEFAULT_REPEATS = 10
+ENDPOINTS = (
+    '/api/disciplines',
+    '/api/universities/stats',
+    '/api/universities/top',
+    '/api/universities',
+    '/api/universities/ranking',
+)
+FLOOR_PATH = '/api/__cache_probe_floor__'    # Any unknown route: 404 from the router
+CACHE_HEADERS = ('ETag', 'Last-Modified', 'Cache-Control', 'Expires')
+
+
+def timed_get(client, url, headers=None):
+    """(response, seconds including the whole body, body bytes)"""
+    start = time.perf_counter()
+    response = client.get(url, headers=headers or {})
+    content = response.content
+    return response, time.perf_counter() - start, len(content)
+
+
+def max_age(cache_control):
+    """Browser freshness lifetime in seconds; private still allows the browser cache"""
+    if not cache_control:
+        return None
+    if re.search(r"no-store|no-cache", cache_control):
+        return 0
+    match = re.search(r"(?:s-)?max-age=(\d+)", cache_control)
+    return int(match.group(1)) if match else None
+
+
+class CacheProbeResult:
+    """Measurements and header checks for one endpoint"""
+
+    def __init__(self, path):
+        self.path = path
+        self.status = None
+        self.cold = None
+        self.warm = []
+        self.size = None
+        self.headers = {}
+        self.etag_stable = None
+        self.conditional_status = None
+        self.conditional_latency = []
+        self.conditional_size = None
+        self.modified_since_status = None
+
+    @property
+    def warm_latency(self):
+        return median(self.warm)
+
+    @property
+    def revalidates(self):
+        return self.conditional_status == 304 or self.modified_since_status == 304
+
+    @property
+    def fresh_for(self):
+        return max_age(self.headers.get('Cache-Control'))
+
+    def savings(self, floor):
+        """Per repeated call: (revalidation, freshness, server cache) as (seconds, bytes) pairs"""
+        warm = self.warm_latency or 0
+        conditional = median(self.conditional_latency)
+        if self.revalidates and conditional is not None:
+            revalidation = (max(0.0, warm - conditional), self.size - (self.conditional_size or 0))
+        else:
+            # Estimate: transfer of the body is what a 304 would avoid
+            revalidation = (None, self.size)
+        freshness = (warm, self.size)
+        server_cache = (max(0.0, warm - floor) if floor is not None else None, 0)
+        return revalidation, freshness, server_cache
+
+
+def probe_endpoint(client, backend_url, path, repeats):
+    url = f"{backend_url}{path}"
+    result = CacheProbeResult(path)
+    response, result.cold, result.size = timed_get(client, url)
+    result.status = response.status_code
+    result.headers = {name: response.headers.get(name) for name in CACHE_HEADERS if response.headers.get(name)}
+    etags = {response.headers.get('ETag')}
+    for _ in range(repeats):
+        response, latency, _ = timed_get(client, url)
+        result.warm.append(latency)
+        etags.add(response.headers.get('ETag'))
+    if result.headers.get('ETag'):
+        result.etag_stable = len(etags) == 1
+        for _ in range(repeats):
+            response, latency, size = timed_get(client, url, {'If-None-Match': result.headers['ETag']})
+            result.conditional_status = response.status_code
+            result.conditional_latency.append(latency)
+            result.conditional_size = size
+    if result.headers.get('Last-Modified'):
+        response, _, _ = timed_get(client, url, {'If-Modified-Since': result.headers['Last-Modified']})
+        result.modified_since_status = response.status_code
+    return result
+
+
+def measure_floor(client, backend_url, repeats):
+    timed_get(client, f"{backend_url}{FLOOR_PATH}")
+    return median([timed_get(client, f"{backend_url}{FLOOR_PATH}")[1] for _ in range(repeats)])
+
+
+def _yes(value):
+    return "✅" if value else "❌"
+
+
+def build_sections(results, floor, repeats):
+    rows = [[r.path, r.status, format_ms(r.cold), format_ms(r.warm_latency),
+             f"{r.cold / r.warm_latency:.1f}x" if r.warm_latency else "N/A", format_ms(floor),
+             format_bytes(r.size)] for r in results]
+    sections = [{'title': "Cold vs. Warm Latency",
+                 'headers': ["Endpoint", "Status", "Cold (1st call)", f"Warm (p50 of {repeats})", "Cold/Warm",
+                             "Floor (404)", "Body"],
+                 'rows': rows,
+                 'notes': ["Floor = an unknown route answered by the router: network + Express, no database work"]}]
+
+    rows = []
+    for r in results:
+        conditional = r.conditional_status if r.conditional_status is not None else "not sent"
+        rows.append([r.path] + [_yes(r.headers.get(h)) for h in CACHE_HEADERS] +
+                    [r.headers.get('Cache-Control', '-'),
+                     "N/A" if r.etag_stable is None else _yes(r.etag_stable),
+                     conditional, format_ms(median(r.conditional_latency)),
+                     "OK" if r.revalidates else "FAIL"])
+    notes = []
+    if any(r.revalidates for r in results):
+        notes.append("A 304 still costs a full server round trip: Express computes the ETag from the "
+                     "finished body, so the database work is done either way")
+    if not any(r.fresh_for for r in results):
+        notes.append("No endpoint sets Cache-Control max-age, so browsers must revalidate (or refetch) "
+                     "on every use")
+    sections.append({'title': "HTTP Caching Support",
+                     'headers': ["Endpoint"] + list(CACHE_HEADERS) +
+                                ["Cache-Control Value", "ETag Stable", "If-None-Match", "304 Latency",
+                                 "Conditional"],
+                     'rows': rows, 'notes': notes})
+
+    rows = []
+    for r in results:
+        revalidation, freshness, server_cache = r.savings(floor)
+        rows.append([r.path,
+                     f"{format_bytes(revalidation[1])}" +
+                     (f", {format_ms(revalidation[0])}" if revalidation[0] is not None else " (needs ETag/304)"),
+                     f"{format_bytes(freshness[1])}, {format_ms(freshness[0])}",
+                     format_ms(server_cache[0])])
+    sections.append({'title': "Estimated Savings per Repeated Call",
+                     'headers': ["Endpoint", "Revalidation (304)", "Freshness (max-age)", "Server-Side Cache"],
+                     'rows': rows,
+                     'notes': ["Revalidation: bytes and time saved when a conditional request gets a 304",
+                               "Freshness: a response still within max-age is served by the browser with no request",
+                               "Server-side cache: warm latency minus the floor, i.e. the database work per call"]})
+    return sections
+
+
+def generate_reports(results, floor, repeats, meta, basename="cache-probe-report"):
+    sections = build_sections(results, floor, repeats)
+    for section in sections:
+        print_section(section)
+    bytes_saved = sum(r.size for r in results if r.size)
+    cards = [
+        ("Endpoints", len(results)),
+        ("Revalidate (304)", f"{sum(1 for r in results if r.revalidates)}/{len(results)}"),
+        ("With max-age", f"{sum(1 for r in results if r.fresh_for)}/{len(results)}"),
+        ("max-age Saves per Round", format_bytes(bytes_saved)),
+    ]
+    write_text_report(f"{basename}.txt", "Cache Probe Report", meta, sections)
+    write_html_report(f"{basename}.html", "Cache Probe Report",
+                      "University Finder API - Cold/Warm Latency and HTTP Caching", meta, cards, sections)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold/warm latency and HTTP caching probe")
+    parser.add_argument("--backend-url", default=BACKEND_URL)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="warm and conditional calls per endpoint")
+    parser.add_argument("--endpoints", nargs="+", default=list(ENDPOINTS))
+    args = parser.parse_args()
+    backend_url = args.backend_url.rstrip('/')
+    repeats = max(1, args.repeats)
+
+    print("=" * 70)
+    print("🗃️ CACHE & CONDITIONAL-REQUEST PROBE")
+    print("=" * 70)
+    print(f"📍 Backend URL: {backend_url}\n")
+    with PooledHttpClient(timeout=60) as client:
+        # Opens the keep-alive connection, so "cold" below is the server's first call, not TCP setup
+        floor = measure_floor(client, backend_url, repeats)
+        results = []
+        for path in args.endpoints:
+            result = probe_endpoint(client, backend_url, path, repeats)
+            results.append(result)
+            print(f"   {path:<28} cold {format_ms(result.cold):>9}  warm {format_ms(result.warm_latency):>9}  "
+                  f"{'304 ✅' if result.revalidates else 'no 304 ❌'}")
+    generate_reports(results, floor, repeats, [("Backend URL", backend_url), ("Repeats", repeats)])
@@ -0,0 +1,514 @@
+"""
+Capacity Finder for the University Finder API
+DevOps Lab - Section E
+
+The replica count in kubernetes/backend-deployment.yaml is a guess. This
+tool measures how much load one backend can take, per endpoint:
+
+1. Ramp: an open-loop schedule raises the offered load following a
+   profile, and every stage is recorded in its own window:
+   - step:   start rate, +step every stage, up to the max rate
+   - linear: the same range, rising continuously
+   - spike:  bursts of rising height, each followed by a stage at the
+             start rate to check that latency recovers
+   The ramp stops early once latency measured from the intended send
+   time passes --abort-latency (the server is clearly saturated).
+2. Knee: the first stage where throughput no longer follows the offered
+   load (< 90%), or where p99 jumps to 3x the best p99 seen so far, past
+   half the SLO p99, while throughput stops rising over the stage before.
+3. Search: a binary search of constant-rate runs between the last stage
+   that met the p99 SLO and the first that did not, to confirm the
+   maximum sustainable RPS.
+
+The SLO comes from the endpoint's p99_ms and error_rate in
+performance-budgets.json, or from --slo-p99. Divided by --replicas (the
+number of instances behind --backend-url) this gives one "max RPS per
+replica" figure per endpoint, saved to capacity.json for sizing the
+deployment and its autoscaling.
+
+Usage:
+    python capacity_finder.py --backend-url http://localhost:5000 --profile step --max-rate 300
+    python capacity_finder.py --endpoints Search --profile spike --slo-p99 500
+
+Author: DevOps Lab Project
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from load_generator import OpenLoopLoadGenerator, SCENARIOS, send_request
+from perf_budgets import DEFAULT_BUDGETS_PATH, load_budgets
+from perf_report import format_ms, print_section, svg_chart, write_html_report, write_text_report
+from test_university_app import BACKEND_URL
+
+
+PROFILES = ('step', 'linear', 'spike')
+DEFAULT_START_RATE = 5.0        # Requests per second
+DEFAULT_STEP_RATE = 5.0
+DEFAULT_MAX_RATE = 200.0
+DEFAULT_STAGE = 10.0            # Seconds per stage (and per analysis window)
+DEFAULT_CONFIRM_DURATION = 20.0 # Seconds per constant-rate search run
+DEFAULT_SEARCH_STEPS = 4
+DEFAULT_MAX_IN_FLIGHT = 200
+DEFAULT_SLO_P99_MS = 1000       # When the budgets file has no p99 for the endpoint
+DEFAULT_ABORT_LATENCY = 10.0    # Seconds behind schedule that end the ramp
+MIN_EFFICIENCY = 0.9            # Achieved / offered below this = not keeping up
+KNEE_LATENCY_FACTOR = 3.0       # p99 this many times the best p99 so far = knee
+KNEE_SLO_FRACTION = 0.5         # ... but only once p99 is past this share of the SLO p99
+RECOVERY_FACTOR = 1.5           # Base-stage p99 after a spike vs. the first base stage
+SEARCH_PRECISION = 0.05         # Stop searching when the bracket is within 5%
+DEPLOYMENT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir,
+                               'kubernetes', 'backend-deployment.yaml')
+DEFAULT_OUTPUT = 'capacity.json'
+
+
+class RampProfile:
+    """Offered rate over time for a step, linear or spike ramp"""
+
+    def __init__(self, kind='step', start=DEFAULT_START_RATE, step=DEFAULT_STEP_RATE,
+                 peak=DEFAULT_MAX_RATE, stage=DEFAULT_STAGE):
+        if kind not in PROFILES:
+            raise ValueError(f"Unknown ramp profile '{kind}' (expected one of {', '.join(PROFILES)})")
+        self.kind = kind
+        self.start = start
+        self.step = step
+        self.peak = max(peak, start)
+        self.stage = stage
+        self.levels = int(math.ceil((self.peak - start) / step)) + 1 if step > 0 else 1
+
+    @property
+    def stages(self):
+        # Spikes alternate with base-rate stages: base, spike, base, spike, ..., base
+        return self.levels * 2 + 1 if self.kind == 'spike' else self.levels
+
+    @property
+    def duration(self):
+        return self.stages * self.stage
+
+    def phase(self, index):
+        if self.kind == 'spike':
+            return 'spike' if index % 2 else 'base'
+        return self.kind
+
+    def rate(self, t):
+        index = int(t // self.stage)
+        if self.kind == 'linear':
+            return self.start + (self.peak - self.start) * t / self.duration
+        if self.kind == 'spike':
+            return min(self.peak, self.start + self.step * (index // 2 + 1)) if index % 2 else self.start
+        return min(self.peak, self.start + self.step * index)
+
+    def arrivals(self):
+        """Intended send offsets (seconds from the start) for the whole ramp"""
+        t = 0.0
+        while t < self.duration:
+            yield t
+            t += 1.0 / self.rate(t)
+
+    def describe(self):
+        return (f"{self.kind}: {self.start:g} -> {self.peak:g} req/s, "
+                f"+{self.step:g} per {'spike' if self.kind == 'spike' else 'stage'}, {self.stage:g}s stages")
+
+
+class RampLoadGenerator(OpenLoopLoadGenerator):
+    """
+    Open-loop generator following a RampProfile for one scenario.
+
+    Once any response arrives more than abort_latency after its intended
+    send time, no further requests are sent; queued ones are dropped.
+    """
+
+    def __init__(self, backend_url, profile, scenario, max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+                 abort_latency=DEFAULT_ABORT_LATENCY):
+        super().__init__(backend_url, rate=profile.start, duration=profile.duration,
+                         max_in_flight=max_in_flight, scenarios=[scenario], window=profile.stage)
+        self.profile = profile
+        self.schedule = list(profile.arrivals())
+        self.abort_latency = abort_latency
+        self.aborted_at = None
+
+    def _send(self, scenario):
+        if self.aborted_at is not None:
+            return None
+        return send_request(self.client, self.backend_url, scenario)
+
+    async def _fire(self, scenario, intended, executor):
+        loop = asyncio.get_running_loop()
+        sent = await loop.run_in_executor(executor, self._send, scenario)
+        if sent is None:
+            return      # Dropped after the abort
+        sent_at, latency, ok, size = sent
+        completed = sent_at + latency
+        self.max_send_lag = max(self.max_send_lag, sent_at - intended)
+        self.results.record(scenario['name'], latency, ok, size, corrected=completed - intended,
+                            at=completed - self.started)
+        if completed - intended > self.abort_latency and self.aborted_at is None:
+            self.aborted_at = intended - self.started
+
+    async def _run(self):
+        tasks = []
+        start = self.started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            for offset in self.schedule:
+                if self.aborted_at is not None:
+                    break
+                delay = start + offset - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                tasks.append(asyncio.ensure_future(self._fire(self.scenarios[0], start + offset, executor)))
+            await asyncio.gather(*tasks)
+        self.results.elapsed = time.perf_counter() - start
+
+    def offered(self, index):
+        """Scheduled requests per second in one stage"""
+        low, high = index * self.profile.stage, (index + 1) * self.profile.stage
+        return sum(1 for offset in self.schedule if low <= offset < high) / self.profile.stage
+
+
+class Level:
+    """Offered vs. achieved load and latency at one load level"""
+
+    def __init__(self, offered, achieved, requests, errors, p50, p99, phase='step', label=None):
+        self.offered = offered
+        self.achieved = achieved
+        self.requests = requests
+        self.errors = errors
+        self.p50 = p50
+        self.p99 = p99
+        self.phase = phase
+        self.label = label
+        self.note = ""
+
+    @property
+    def error_rate(self):
+        return self.errors / self.requests if self.requests else 0.0
+
+    @property
+    def efficiency(self):
+        return self.achieved / self.offered if self.offered else 0.0
+
+    def meets(self, slo):
+        return (self.requests > 0 and self.p99 is not None and self.p99 <= slo['p99'] and
+                self.error_rate <= slo['error_rate'] and self.efficiency >= MIN_EFFICIENCY)
+
+
+def ramp_levels(generator):
+    """One Level per stage up to (and including) the stage where the ramp aborted"""
+    profile = generator.profile
+    last = profile.stages - 1
+    if generator.aborted_at is not None:
+        last = min(last, int(generator.aborted_at // profile.stage))
+    levels = []
+    for index in range(last + 1):
+        stats = generator.results.windows.get(index)
+        count = stats.count if stats else 0
+        pcts = stats.percentiles((50, 99), corrected=True) if stats else {50: None, 99: None}
+        levels.append(Level(generator.offered(index), count / profile.stage, count, stats.errors if stats else 0,
+                            pcts[50], pcts[99], profile.phase(index),
+                            f"{index * profile.stage:g}-{(index + 1) * profile.stage:g}s"))
+    return levels
+
+
+def find_knee(levels, slo):
+    """
+    Index of the first level where throughput stops following the offered
+    load, or where p99 jumps while throughput stops rising. A jump at
+    latencies well inside the SLO is noise, not saturation.
+    """
+    best_p99 = previous = None
+    for index, level in enumerate(levels):
+        if level.phase == 'base' or not level.offered:
+            continue
+        if level.efficiency < MIN_EFFICIENCY or level.p99 is None:
+            return index
+        jumped = (best_p99 is not None and level.p99 > KNEE_LATENCY_FACTOR * best_p99 and
+                  level.p99 >= KNEE_SLO_FRACTION * slo['p99'])
+        if jumped and previous is not None and level.achieved <= previous.achieved:
+            return index
+        best_p99 = level.p99 if best_p99 is None else min(best_p99, level.p99)
+        previous = level
+    return None
+
+
+def check_recovery(levels):
+    """Mark each base stage that follows a spike as recovered or not"""
+    bases = [level for level in levels if level.phase == 'base' and level.p99 is not None]
+    if not bases:
+        return
+    for level in bases[1:]:
+        recovered = level.p99 <= RECOVERY_FACTOR * bases[0].p99 and level.efficiency >= MIN_EFFICIENCY
+        level.note = "recovered" if recovered else "FAIL: not recovered"
+
+
+def run_constant(backend_url, scenario, rate, duration, max_in_flight):
+    """One constant-rate open-loop run, summarised as a Level"""
+    generator = OpenLoopLoadGenerator(backend_url, rate=rate, duration=duration,
+                                      max_in_flight=max_in_flight, scenarios=[scenario])
+    results = generator.run(verbose=False)
+    stats = results.endpoints[scenario['name']]
+    pcts = stats.percentiles((50, 99), corrected=True)
+    return Level(rate, stats.count / max(results.elapsed, duration), stats.count, stats.errors,
+                 pcts[50], pcts[99], 'search', f"{rate:.1f} req/s for {duration:g}s")
+
+
+def search_max_rps(backend_url, scenario, levels, slo, duration, steps, max_in_flight):
+    """
+    Binary search between the last ramp level that met the SLO and the
+    first that did not. Returns (max_rps, confirmed, saturated, runs).
+    """
+    ramp = [level for level in levels if level.phase != 'base']
+    low, high = 0.0, None
+    for level in ramp:
+        if level.meets(slo):
+            low = level.offered
+        else:
+            high = level.offered
+            break
+    if high is None:
+        return low, False, False, []
+
+    runs, confirmed = [], False
+    for _ in range(steps):
+        if high - low <= SEARCH_PRECISION * high:
+            break
+        middle = round((low + high) / 2, 1)
+        run = run_constant(backend_url, scenario, middle, duration, max_in_flight)
+        run.note = "PASS" if run.meets(slo) else "FAIL"
+        runs.append(run)
+        print(f"      search {middle:>7.1f} req/s  p99 {format_ms(run.p99):>9}  "
+              f"{run.efficiency * 100:5.1f}% delivered  {run.note}")
+        if run.note == "PASS":
+            low, confirmed = middle, True
+        else:
+            high = middle
+    if not confirmed and low > 0:
+        run = run_constant(backend_url, scenario, low, duration, max_in_flight)
+        run.note = "PASS" if run.meets(slo) else "FAIL"
+        runs.append(run)
+        confirmed = run.note == "PASS"
+    return low, confirmed, True, runs
+
+
+class EndpointCapacity:
+    """Ramp, knee and search results for one scenario"""
+
+    def __init__(self, scenario, slo):
+        self.scenario = scenario
+        self.slo = slo
+        self.levels = []
+        self.knee = None
+        self.max_rps = None
+        self.confirmed = False
+        self.saturated = False
+        self.search_runs = []
+        self.aborted = False
+
+    @property
+    def knee_level(self):
+        return self.levels[self.knee] if self.knee is not None else None
+
+    @property
+    def peak_throughput(self):
+        return max((level.achieved for level in self.levels), default=0.0)
+
+
+def endpoint_slo(budgets, path, slo_p99_ms=None):
+    """p99 (seconds) and error rate (0-1) the endpoint has to meet"""
+    budget = ((budgets or {}).get('endpoints') or {}).get(path, {})
+    p99_ms = slo_p99_ms or budget.get('p99_ms') or DEFAULT_SLO_P99_MS
+    return {'p99': p99_ms / 1000, 'error_rate': budget.get('error_rate', 0.0),
+            'source': "--slo-p99" if slo_p99_ms else ("budget" if budget.get('p99_ms') else "default")}
+
+
+def find_capacity(backend_url, scenario, profile, slo, confirm_duration=DEFAULT_CONFIRM_DURATION,
+                  steps=DEFAULT_SEARCH_STEPS, max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+                  abort_latency=DEFAULT_ABORT_LATENCY):
+    capacity = EndpointCapacity(scenario, slo)
+    print(f"\n🎯 {scenario['name']} ({scenario['path']}) - SLO p99 {format_ms(slo['p99'])}")
+    generator = RampLoadGenerator(backend_url, profile, scenario, max_in_flight, abort_latency)
+    generator.run(verbose=False)
+    capacity.aborted = generator.aborted_at is not None
+    capacity.levels = ramp_levels(generator)
+    check_recovery(capacity.levels)
+    capacity.knee = find_knee(capacity.levels, slo)
+    for index, level in enumerate(capacity.levels):
+        if index == capacity.knee:
+            level.note = "knee"
+        elif level.phase != 'base' and not level.note:
+            level.note = "" if level.meets(slo) else "SLO missed"
+        print(f"   {level.label:>10} {level.phase:<6} offered {level.offered:7.1f}  achieved {level.achieved:7.1f}  "
+              f"p99 {format_ms(level.p99):>9}  {level.note}")
+    if capacity.aborted:
+        print(f"   ⏹ Ramp stopped at {generator.aborted_at:.0f}s: responses over {abort_latency:g}s behind schedule")
+
+    capacity.max_rps, capacity.confirmed, capacity.saturated, capacity.search_runs = search_max_rps(
+        backend_url, scenario, capacity.levels, slo, confirm_duration, steps, max_in_flight)
+    return capacity
+
+
+def deployment_replicas(path=DEPLOYMENT_PATH):
+    """replicas: from the backend Deployment manifest, or None"""
+    if not path or not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        match = re.search(r"^\s*replicas:\s*(\d+)", f.read(), re.M)
+    return int(match.group(1)) if match else None
+
+
+def _max_rps_text(capacity):
+    if capacity.max_rps is None:
+        return "N/A"
+    text = f"{capacity.max_rps:.1f}"
+    if not capacity.saturated:
+        return f">= {text} (not saturated)"
+    return text if capacity.confirmed else f"{text} (unconfirmed)"
+
+
+def build_sections(capacities, replicas, deployed):
+    rows = []
+    for capacity in capacities:
+        for level in capacity.levels:
+            rows.append([capacity.scenario['name'], level.label, level.phase, f"{level.offered:.1f}",
+                         f"{level.achieved:.1f}", f"{level.efficiency * 100:.0f}%", format_ms(level.p50),
+                         format_ms(level.p99), f"{level.error_rate * 100:.1f}%", level.note])
+    throughput_series = [{'name': c.scenario['name'],
+                          'points': [(level.offered, level.achieved) for level in c.levels if level.phase != 'base']}
+                         for c in capacities]
+    peak = max((level.offered for c in capacities for level in c.levels), default=0)
+    throughput_series.append({'name': "ideal (achieved = offered)", 'line': True, 'colour': '#999',
+                              'points': [(0, 0), (peak, peak)]})
+    sections = [{'title': "Ramp",
+                 'headers': ["Endpoint", "Stage", "Phase", "Offered", "Achieved", "Delivered", "p50", "p99",
+                             "Errors", "Note"],
+                 'rows': rows,
+                 'notes': ["Latency is measured from each request's intended send time",
+                           f"Knee: delivered < {MIN_EFFICIENCY:.0%} of offered, or p99 > "
+                           f"{KNEE_LATENCY_FACTOR:g}x the best p99 so far"],
+                 'html': svg_chart(throughput_series, "offered (req/s)", "achieved (req/s)")}]
+
+    rows = []
+    for capacity in capacities:
+        for run in capacity.search_runs:
+            rows.append([capacity.scenario['name'], f"{run.offered:.1f}", f"{run.achieved:.1f}",
+                         format_ms(run.p50), format_ms(run.p99), f"{run.error_rate * 100:.1f}%", run.note])
+    latency_series = [{'name': c.scenario['name'],
+                       'points': [(level.offered, level.p99 * 1000) for level in c.levels + c.search_runs
+                                  if level.phase != 'base' and level.p99 is not None]}
+                      for c in capacities]
+    sections.append({'title': "SLO Search",
+                     'headers': ["Endpoint", "Offered", "Achieved", "p50", "p99", "Errors", "Verdict"],
+                     'rows': rows,
+                     'notes': ["Constant-rate runs bisecting the last ramp stage within the SLO and the first "
+                               "one outside it"],
+                     'html': svg_chart(latency_series, "offered (req/s)", "p99 latency (ms)")})
+
+    rows, notes = [], []
+    for capacity in capacities:
+        knee = capacity.knee_level
+        per_replica = capacity.max_rps / replicas if capacity.max_rps is not None else None
+        rows.append([capacity.scenario['name'], capacity.scenario['path'],
+                     f"{format_ms(capacity.slo['p99'])} ({capacity.slo['source']})",
+                     f"{knee.offered:.1f}" if knee else "not reached", f"{capacity.peak_throughput:.1f}",
+                     _max_rps_text(capacity), f"{per_replica:.1f}" if per_replica is not None else "N/A",
+                     f"{per_replica * deployed:.1f}" if per_replica is not None and deployed else "N/A"])
+    measured = [c for c in capacities if c.max_rps]
+    if measured:
+        weakest = min(measured, key=lambda c: c.max_rps)
+        notes.append(f"Weakest endpoint: {weakest.scenario['name']} at {weakest.max_rps / replicas:.1f} req/s "
+                     f"per replica - size replicas and autoscaling for its share of traffic")
+    if any(not c.saturated for c in capacities):
+        notes.append("'not saturated': the ramp never missed the SLO; raise --max-rate to find the limit")
+    sections.append({'title': "Capacity",
+                     'headers': ["Endpoint", "Path", "SLO p99", "Knee (req/s)", "Peak Throughput", "Max RPS",
+                                 "Per Replica", f"Deployment ({deployed or '?'} replicas)"],
+                     'rows': rows, 'notes': notes})
+    return sections
+
+
+def save_capacity(capacities, replicas, profile, path=DEFAULT_OUTPUT):
+    data = {'profile': profile.describe(), 'replicas_measured': replicas, 'endpoints': {}}
+    for capacity in capacities:
+        data['endpoints'][capacity.scenario['path']] = {
+            'name': capacity.scenario['name'],
+            'slo_p99_ms': capacity.slo['p99'] * 1000,
+            'knee_rps': capacity.knee_level.offered if capacity.knee_level else None,
+            'peak_throughput': capacity.peak_throughput,
+            'max_rps': capacity.max_rps,
+            'max_rps_per_replica': capacity.max_rps / replicas if capacity.max_rps is not None else None,
+            'confirmed': capacity.confirmed,
+            'saturated': capacity.saturated,
+        }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    print(f"📄 Capacity figures saved to: {path}")
+
+
+def generate_reports(capacities, replicas, deployed, meta, basename="capacity-report"):
+    sections = build_sections(capacities, replicas, deployed)
+    for section in sections:
+        print_section(section)
+    measured = [c.max_rps / replicas for c in capacities if c.max_rps]
+    cards = [
+        ("Endpoints", len(capacities)),
+        ("Lowest Max RPS / Replica", f"{min(measured):.1f}" if measured else "N/A"),
+        ("Knees Found", sum(1 for c in capacities if c.knee is not None)),
+        ("Deployment Replicas", deployed or "?"),
+    ]
+    write_text_report(f"{basename}.txt", "Capacity Report", meta, sections)
+    write_html_report(f"{basename}.html", "Capacity Report",
+                      "University Finder API - Maximum Sustainable Load", meta, cards, sections)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find the maximum sustainable request rate per endpoint")
+    parser.add_argument("--backend-url", default=BACKEND_URL)
+    parser.add_argument("--endpoints", nargs="+", help="scenario names or paths (default: all load scenarios)")
+    parser.add_argument("--profile", choices=PROFILES, default='step')
+    parser.add_argument("--start-rate", type=float, default=DEFAULT_START_RATE, help="req/s of the first stage")
+    parser.add_argument("--step-rate", type=float, default=DEFAULT_STEP_RATE, help="req/s added per stage")
+    parser.add_argument("--max-rate", type=float, default=DEFAULT_MAX_RATE, help="highest req/s of the ramp")
+    parser.add_argument("--stage", type=float, default=DEFAULT_STAGE, help="seconds per stage")
+    parser.add_argument("--slo-p99", type=float, help="p99 SLO in ms (default: p99_ms from the budgets file)")
+    parser.add_argument("--budgets", default=DEFAULT_BUDGETS_PATH)
+    parser.add_argument("--confirm-duration", type=float, default=DEFAULT_CONFIRM_DURATION,
+                        help="seconds per constant-rate search run")
+    parser.add_argument("--search-steps", type=int, default=DEFAULT_SEARCH_STEPS)
+    parser.add_argument("--max-in-flight", type=int, default=DEFAULT_MAX_IN_FLIGHT)
+    parser.add_argument("--abort-latency", type=float, default=DEFAULT_ABORT_LATENCY,
+                        help="stop the ramp once responses are this many seconds behind schedule")
+    parser.add_argument("--replicas", type=int, default=1, help="backend instances behind --backend-url")
+    parser.add_argument("--deployment", default=DEPLOYMENT_PATH, help="Deployment manifest to read replicas from")
+    parser.add_argument("--output", default=DEFAULT_OUTPUT, help="JSON file for the capacity figures")
+    args = parser.parse_args()
+    backend_url = args.backend_url.rstrip('/')
+
+    scenarios = [s for s in SCENARIOS if not args.endpoints or s['name'] in args.endpoints or
+                 s['path'] in args.endpoints]
+    if not scenarios:
+        parser.error(f"No scenario matches {args.endpoints}; choose from {[s['name'] for s in SCENARIOS]}")
+    ramp = RampProfile(args.profile, args.start_rate, args.step_rate, args.max_rate, args.stage)
+    budgets = load_budgets(args.budgets)
+    deployed_replicas = deployment_replicas(args.deployment)
+    replica_count = max(1, args.replicas)
+
+    print("=" * 70)
+    print("📈 CAPACITY FINDER")
+    print("=" * 70)
+    print(f"📍 Backend URL: {backend_url} ({replica_count} replica{'s' if replica_count > 1 else ''})")
+    print(f"🪜 Ramp: {ramp.describe()} (up to {ramp.duration:g}s per endpoint)")
+    results = [find_capacity(backend_url, s, ramp, endpoint_slo(budgets, s['path'], args.slo_p99),
+                             args.confirm_duration, max(0, args.search_steps), max(1, args.max_in_flight),
+                             args.abort_latency)
+               for s in scenarios]
+
+    meta = [("Backend URL", backend_url), ("Ramp", ramp.describe()),
+            ("Replicas Measured", replica_count), ("Deployment Replicas", deployed_replicas or "unknown"),
+            ("Search", f"{args.search_steps} steps x {args.confirm_duration:g}s")]
+    generate_reports(results, replica_count, deployed_replicas, meta)
+    save_capacity(results, replica_count, ramp, args.output)
@@ -0,0 +1,280 @@
+"""
+Compression Negotiation Benchmark for the JSON API
+DevOps Lab - Section E
+
+backendsample/src/server.js only installs express.json() and cors(), so
+no response is compressed and every SPA visitor downloads
+/api/universities as plain JSON. This benchmark requests each endpoint
+with Accept-Encoding identity, gzip and br and records:
+
+- bytes on the wire and the Content-Encoding the server chose
+- server time (Server-Timing when present, otherwise time to headers)
+- transfer time, and client decompress + JSON decode time
+
+For responses that arrive uncompressed it compresses the body locally
+(gzip level 6 and brotli quality 4, the usual on-the-fly settings) to
+show what the server could send and what compressing would cost it.
+The bandwidth saved is projected from the request rates of a
+load_generator.py run (load-test-report-histograms.json) or from --rps.
+Those are the load test's own rates, not real visitor traffic.
+
+brotli is optional (pip install brotli); without it, br is still
+requested but cannot be decoded or estimated locally.
+
+Usage:
+    python compression_benchmark.py --backend-url http://localhost:5000 --repeats 5
+
+Author: DevOps Lab Project
+"""
+
+import argparse
+import gzip
+import json
+import os
+import time
+import zlib
+
+import requests
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from http_client import PooledHttpClient
+from load_generator import SOAK_SCENARIOS
+from perf_report import (format_bytes, format_ms, median, print_section, server_time, write_html_report,
+                         write_text_report)
+from test_university_app import BACKEND_URL
+
+
+DEFAULT_REPEATS = 5
+DEFAULT_RPS = 1.0                                   # Per endpoint, when no load run is available
+DEFAULT_RATES_PATH = 'load-test-report-histograms.json'
+ENCODINGS = ('identity', 'gzip', 'br')
+GZIP_LEVEL = 6          # zlib / compression middleware default
+BROTLI_QUALITY = 4      # Typical quality for on-the-fly brotli
+SECONDS_PER_DAY = 86400
+ENDPOINTS = (
+    '/api/universities',
+    '/api/universities/search?query=NUST',
+    '/api/disciplines',
+    '/api/universities/top',
+    '/api/universities/stats',
+    '/api/universities/ranking',
+)
+# zlib.error and brotli.error derive from neither ValueError nor OSError
+DECODE_ERRORS = (zlib.error,) + ((brotli.error,) if brotli else ())
+
+
+def decompress(body, encoding):
+    """Undo a Content-Encoding; None when the codec is not available"""
+    if encoding in (None, '', 'identity'):
+        return body
+    if encoding == 'gzip':
+        return gzip.decompress(body)
+    if encoding == 'deflate':
+        return zlib.decompress(body)
+    if encoding == 'br':
+        return brotli.decompress(body) if brotli else None
+    return None
+
+
+def compress_locally(body):
+    """{encoding: (compressed size, seconds to compress)} for the codecs available here"""
+    estimates = {}
+    start = time.perf_counter()
+    estimates['gzip'] = (len(gzip.compress(body, GZIP_LEVEL)), time.perf_counter() - start)
+    if brotli:
+        start = time.perf_counter()
+        estimates['br'] = (len(brotli.compress(body, quality=BROTLI_QUALITY)), time.perf_counter() - start)
+    return estimates
+
+
+def load_test_rates(path):
+    """Requests per second per endpoint path generated by a load_generator run (its histograms file)"""
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    elapsed = data.get('elapsed') or 0
+    if elapsed <= 0:
+        return {}
+    # The soak mix is the regular mix plus Ranking, so it covers either kind of run
+    paths = {s['name']: s['path'] for s in SOAK_SCENARIOS}
+    return {paths.get(name, name): endpoint['histogram']['total_count'] / elapsed
+            for name, endpoint in data.get('endpoints', {}).items()}
+
+
+class EncodingResult:
+    """Median measurements of one endpoint requested with one Accept-Encoding"""
+
+    def __init__(self, endpoint, accept):
+        self.endpoint = endpoint
+        self.accept = accept
+        self.content_encoding = None
+        self.wire_bytes = None
+        self.body_bytes = None
+        self.ttfb, self.server, self.transfer, self.decode = [], [], [], []
+        self.body = None
+        self.errors = 0
+        self.last_error = None
+
+    @property
+    def compressed(self):
+        return self.content_encoding not in (None, '', 'identity')
+
+
+def measure(client, url, accept, endpoint, repeats):
+    result = EncodingResult(endpoint, accept)
+    for attempt in range(repeats + 1):
+        start = time.perf_counter()
+        try:
+            with client.get(url, headers={'Accept-Encoding': accept}, stream=True) as response:
+                ttfb = time.perf_counter() - start
+                wire = response.raw.read(decode_content=False)
+                transfer = time.perf_counter() - start - ttfb
+                encoding = response.headers.get('Content-Encoding')
+            if response.status_code != 200:
+                raise ValueError(f"HTTP {response.status_code}")
+            decode_start = time.perf_counter()
+            body = decompress(wire, encoding)
+            if body is not None:
+                json.loads(body)
+            decode = time.perf_counter() - decode_start if body is not None else None
+        except (requests.RequestException, ValueError, OSError) + DECODE_ERRORS as e:
+            # Error pages and broken bodies are not valid samples
+            if attempt:
+                result.errors += 1
+                result.last_error = str(e) if str(e).startswith("HTTP ") else type(e).__name__
+            continue
+        if attempt == 0:
+            continue    # Warm-up
+        result.ttfb.append(ttfb)
+        result.server.append(server_time(response.headers))
+        result.transfer.append(transfer)
+        result.decode.append(decode)
+        result.content_encoding = encoding or 'identity'
+        result.wire_bytes = len(wire)
+        result.body_bytes = len(body) if body is not None else None
+        result.body = body
+    return result
+
+
+def run_benchmark(client, backend_url, endpoints, repeats):
+    results = {}
+    for endpoint in endpoints:
+        results[endpoint] = [measure(client, f"{backend_url}{endpoint}", accept, endpoint, repeats)
+                             for accept in ENCODINGS]
+        summary = ", ".join(f"{r.accept}: {format_bytes(r.wire_bytes)} ({r.content_encoding})"
+                            for r in results[endpoint])
+        print(f"   {endpoint:<40} {summary}")
+    return results
+
+
+def build_sections(results, rates, default_rps):
+    rows = []
+    for endpoint, measured in results.items():
+        for r in measured:
+            rows.append([endpoint, r.accept, r.content_encoding or "-", format_bytes(r.wire_bytes),
+                         format_ms(median(r.server) if any(v is not None for v in r.server) else median(r.ttfb)),
+                         format_ms(median(r.transfer)), format_ms(median(r.decode)),
+                         f"{r.errors} ({r.last_error})" if r.errors else 0])
+    has_server = any(v is not None for measured in results.values() for r in measured for v in r.server)
+    notes = [] if has_server else ["No Server-Timing header: TTFB includes network latency"]
+    failed = sum(r.errors for measured in results.values() for r in measured)
+    if failed:
+        notes.append(f"❌ {failed} responses were errors (non-200, invalid body or connection failure) "
+                     f"and were left out")
+    sections = [{'title': "Negotiated Responses",
+                 'headers': ["Endpoint", "Accept-Encoding", "Content-Encoding", "On Wire",
+                             "Server" if has_server else "TTFB", "Transfer", "Decompress + Decode", "Errors"],
+                 'rows': rows, 'notes': notes}]
+
+    rows, notes, daily_total = [], [], 0
+    uncompressed = []
+    for endpoint, measured in results.items():
+        identity = measured[0]
+        if identity.wire_bytes is None:
+            continue    # No valid uncompressed response to compare against
+        best = min((r for r in measured if r.compressed), key=lambda r: r.wire_bytes, default=None)
+        path = endpoint.split('?', 1)[0]
+        rps = rates.get(path, default_rps)
+        if best is not None:
+            saved, how = identity.wire_bytes - best.wire_bytes, f"served {best.content_encoding}"
+            cost = "-"
+        elif identity.body:
+            uncompressed.append(endpoint)
+            estimates = compress_locally(identity.body)
+            codec = min(estimates, key=lambda c: estimates[c][0])
+            size, seconds = estimates[codec]
+            saved, how = identity.wire_bytes - size, f"estimated {codec}"
+            cost = format_ms(seconds)
+        else:
+            continue
+        daily = saved * rps * SECONDS_PER_DAY
+        daily_total += daily
+        rows.append([endpoint, format_bytes(identity.wire_bytes), how, format_bytes(identity.wire_bytes - saved),
+                     f"{saved / identity.wire_bytes * 100:.0f}%" if identity.wire_bytes else "N/A", cost,
+                     f"{rps:.2f}", format_bytes(daily), format_bytes(daily * 30)])
+    if uncompressed:
+        notes.append(f"❌ Sent uncompressed even when gzip/br were offered: {', '.join(uncompressed)}")
+        notes.append("app.use(compression()) before the routes would negotiate gzip (and br with a "
+                     "brotli-capable middleware)")
+    else:
+        notes.append("✅ Every endpoint honoured Accept-Encoding")
+    if rates:
+        notes.append(f"Projected saving at the load test's request rates (not real visitors): "
+                     f"{format_bytes(daily_total)}/day, {format_bytes(daily_total * 30)}/month")
+    else:
+        notes.append(f"Projected saving at an assumed {default_rps} req/s per endpoint: "
+                     f"{format_bytes(daily_total)}/day, {format_bytes(daily_total * 30)}/month")
+    if not brotli:
+        notes.append("brotli is not installed here: br responses are not decoded and br is not estimated")
+    sections.append({'title': "Compression Savings",
+                     'headers': ["Endpoint", "Identity", "Compression", "Compressed", "Saved", "Compress CPU",
+                                 "Req/s", "Saved/day", "Saved/month"],
+                     'rows': rows, 'notes': notes})
+    return sections, uncompressed, daily_total
+
+
+def generate_reports(results, rates, default_rps, meta, basename="compression-report"):
+    sections, uncompressed, daily_total = build_sections(results, rates, default_rps)
+    for section in sections:
+        print_section(section)
+    cards = [
+        ("Endpoints", len(results)),
+        ("Uncompressed", len(uncompressed)),
+        ("Saved / Day", format_bytes(daily_total)),
+        ("Saved / Month", format_bytes(daily_total * 30)),
+    ]
+    write_text_report(f"{basename}.txt", "Compression Report", meta, sections)
+    write_html_report(f"{basename}.html", "Compression Report",
+                      "University Finder API - Accept-Encoding Negotiation", meta, cards, sections)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compression negotiation benchmark for the JSON API")
+    parser.add_argument("--backend-url", default=BACKEND_URL)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="requests per endpoint and encoding")
+    parser.add_argument("--endpoints", nargs="+", default=list(ENDPOINTS))
+    parser.add_argument("--rates-from", default=DEFAULT_RATES_PATH,
+                        help="load_generator histograms file whose requests/s per endpoint drive the projection")
+    parser.add_argument("--rps", type=float, default=DEFAULT_RPS,
+                        help="requests/s assumed for endpoints without a load-test rate")
+    args = parser.parse_args()
+    backend_url = args.backend_url.rstrip('/')
+    rates = load_test_rates(args.rates_from)
+
+    print("=" * 70)
+    print("🗜️ COMPRESSION NEGOTIATION BENCHMARK")
+    print("=" * 70)
+    print(f"📍 Backend URL: {backend_url}")
+    print(f"📈 Request rates: {'load test in ' + args.rates_from if rates else f'{args.rps} req/s per endpoint'}\n")
+    with PooledHttpClient(timeout=60) as client:
+        benchmark = run_benchmark(client, backend_url, args.endpoints, max(1, args.repeats))
+    meta = [("Backend URL", backend_url), ("Repeats", args.repeats),
+            ("Request Rates", f"from load test ({args.rates_from}), not real visitors" if rates
+             else f"{args.rps} req/s per endpoint"),
+            ("Brotli", "available" if brotli else "not installed")]
+    generate_reports(benchmark, rates, args.rps, meta)
@@ -0,0 +1,204 @@
+"""
+Warm WebDriver Pool for the Selenium Suite
+DevOps Lab - Section E
+
+Launching Chrome is the slowest part of a short smoke run. This module
+provides:
+
+- create_driver(): a headless-by-default Chrome factory
+- DriverPool:      pre-launches N browsers (in parallel) and hands them
+                   out to tests. When a test is done the browser is reset
+                   (cookies, site storage and HTTP cache cleared, window
+                   size restored) instead of being restarted.
+
+The pool times every cold start (browser launch) and every warm start
+(reset of a pooled browser) so the report can show the savings.
+
+Author: DevOps Lab Project
+"""
+
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+
+from network_capture import enable_network_capture
+
+
+# Driver defaults
+DEFAULT_WINDOW_SIZE = (1920, 1080)
+DEFAULT_IMPLICIT_WAIT = 15      # Seconds
+ACQUIRE_TIMEOUT = 300           # Seconds to wait for a free browser
+
+CLEARED_STORAGE = "local_storage,session_storage,indexeddb,cache_storage,service_workers"
+
+
+def create_driver(headless=True, window_size=DEFAULT_WINDOW_SIZE,
+                  implicit_wait=DEFAULT_IMPLICIT_WAIT, capture_network=True):
+    """Launch a Chrome WebDriver (headless unless asked otherwise)"""
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument('--headless=new')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument(f'--window-size={window_size[0]},{window_size[1]}')
+    if not headless:
+        chrome_options.add_argument('--start-maximized')
+    if capture_network:
+        # DevTools Network events in the performance log, read by network_capture
+        enable_network_capture(chrome_options)
+
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.implicitly_wait(implicit_wait)
+    return driver
+
+
+def reset_driver(driver, origins=(), window_size=DEFAULT_WINDOW_SIZE):
+    """
+    Return a browser to a clean state without restarting it.
+
+    Clears all cookies, the HTTP cache and the site storage of each origin
+    through the DevTools protocol, then parks the tab on about:blank with
+    the default window size.
+    """
+    try:
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        for origin in origins:
+            driver.execute_cdp_cmd("Storage.clearDataForOrigin",
+                                   {"origin": origin, "storageTypes": CLEARED_STORAGE})
+    except WebDriverException:
+        # Not a Chromium driver: fall back to what WebDriver itself can clear
+        driver.delete_all_cookies()
+        driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+    driver.get("about:blank")
+    driver.set_window_size(*window_size)
+
+
+class DriverPool:
+    """
+    Fixed-size pool of pre-launched browsers.
+
+    Use acquire()/release() or the session() context manager. Released
+    browsers are reset and reused; they are only quit by close().
+    """
+
+    def __init__(self, size=1, headless=True, origins=(), prelaunch=True,
+                 window_size=DEFAULT_WINDOW_SIZE):
+        self.size = size
+        self.headless = headless
+        self.origins = tuple(origins)
+        self.window_size = window_size
+        self.cold_starts = []       # Seconds per browser launch
+        self.warm_starts = []       # Seconds per reset of a pooled browser
+        self.acquisitions = 0
+        self._available = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+        if prelaunch:
+            self.prelaunch()
+
+    def _launch(self):
+        start = time.perf_counter()
+        driver = create_driver(headless=self.headless, window_size=self.window_size)
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.cold_starts.append(elapsed)
+            self._drivers.append(driver)
+        return driver
+
+    def prelaunch(self):
+        """Start every browser up front, in parallel"""
+        missing = self.size - len(self._drivers)
+        if missing <= 0:
+            return
+        print(f"\n🔧 Launching {missing} Chrome WebDriver(s) "
+              f"({'headless' if self.headless else 'headed'})...")
+        with ThreadPoolExecutor(max_workers=missing) as executor:
+            for driver in executor.map(lambda _: self._launch(), range(missing)):
+                self._available.put(driver)
+        print(f"✅ Browser pool ready (cold start avg {self.average(self.cold_starts):.2f}s)\n")
+
+    def acquire(self):
+        """Take a clean browser from the pool (launching one if the pool is still filling)"""
+        with self._lock:
+            self.acquisitions += 1
+        try:
+            return self._available.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_launch = len(self._drivers) < self.size
+            if can_launch:
+                return self._launch()
+            return self._available.get(timeout=ACQUIRE_TIMEOUT)
+
+    def release(self, driver):
+        """Reset the browser and make it available again"""
+        start = time.perf_counter()
+        try:
+            reset_driver(driver, self.origins, self.window_size)
+        except WebDriverException:
+            # A browser that cannot be reset is replaced with a fresh one
+            self._discard(driver)
+            driver = self._launch()
+        else:
+            with self._lock:
+                self.warm_starts.append(time.perf_counter() - start)
+        self._available.put(driver)
+
+    def _discard(self, driver):
+        with self._lock:
+            if driver in self._drivers:
+                self._drivers.remove(driver)
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    @contextmanager
+    def session(self):
+        driver = self.acquire()
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    @staticmethod
+    def average(samples):
+        return sum(samples) / len(samples) if samples else 0.0
+
+    def startup_summary(self):
+        """Cold vs. warm start numbers for reports"""
+        cold = self.average(self.cold_starts)
+        warm = self.average(self.warm_starts)
+        # Hand-outs served by an already-used browser instead of a new launch
+        reuses = max(0, self.acquisitions - len(self.cold_starts))
+        return {
+            'pool_size': self.size,
+            'cold_starts': len(self.cold_starts),
+            'cold_avg': cold,
+            'warm_starts': reuses,
+            'warm_avg': warm,
+            'saved': max(0.0, (cold - warm) * reuses),
+        }
+
+    def close(self):
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except WebDriverException:
+                pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
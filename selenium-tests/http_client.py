@@ -0,0 +1,146 @@
+"""
+Pooled HTTP Client for the University Finder Test Harness
+DevOps Lab - Section E
+
+A single keep-alive requests.Session shared by every API check, so that
+response times measure the server rather than TCP connection setup.
+The client also counts how many requests had to open a new connection
+and how many reused one from the pool.
+
+Author: DevOps Lab Project
+"""
+
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+# Pool defaults
+DEFAULT_POOL_CONNECTIONS = 10   # Number of per-host pools to keep
+DEFAULT_POOL_MAXSIZE = 10       # Connections kept alive per host
+DEFAULT_TIMEOUT = 10            # Seconds
+
+
+class ConnectionStats:
+    """Thread-safe counters for requests and newly opened connections"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def record_new_connection(self):
+        with self._lock:
+            self.new_connections += 1
+
+    @property
+    def reused_connections(self):
+        """Requests served over a connection that was already open"""
+        return max(0, self.requests - self.new_connections)
+
+    @property
+    def reuse_rate(self):
+        return (self.reused_connections / self.requests * 100) if self.requests else 0.0
+
+    def summary(self):
+        return (f"{self.requests} requests, {self.new_connections} new connections, "
+                f"{self.reused_connections} reused ({self.reuse_rate:.1f}% reuse)")
+
+
+def _counting_pool_class(base_class, stats):
+    """
+    Build a urllib3 pool class that reports every TCP connect to stats.
+
+    urllib3 recycles connection objects and reconnects them lazily when the
+    server has closed the socket, so the count is taken in connect() rather
+    than when the pool creates a connection object.
+    """
+
+    class CountingConnection(base_class.ConnectionCls):
+        def connect(self):
+            stats.record_new_connection()
+            return super().connect()
+
+    class CountingConnectionPool(base_class):
+        ConnectionCls = CountingConnection
+
+    return CountingConnectionPool
+
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools count the connections they open"""
+
+    def __init__(self, stats, **kwargs):
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self.stats),
+            "https": _counting_pool_class(HTTPSConnectionPool, self.stats),
+        }
+
+
+class PooledHttpClient:
+    """
+    Keep-alive HTTP client with a bounded connection pool per host.
+
+    pool_connections: number of distinct hosts whose pools are kept
+    pool_maxsize:     connections kept open per host
+    pool_block:       wait for a free connection instead of opening extra
+                      ones beyond pool_maxsize (enforces the per-host limit)
+    keep_alive:       when False every request asks the server to close
+                      the connection, which is useful as a comparison run
+    """
+
+    def __init__(self, pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE, pool_block=True,
+                 keep_alive=True, timeout=DEFAULT_TIMEOUT):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.stats = ConnectionStats()
+
+        self.session = requests.Session()
+        adapter = CountingHTTPAdapter(
+            self.stats,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=0
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        if not keep_alive:
+            self.session.headers["Connection"] = "close"
+
+    def request(self, method, url, **kwargs):
+        """Send a request through the shared pool"""
+        kwargs.setdefault("timeout", self.timeout)
+        self.stats.record_request()
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def describe(self):
+        """One-line description of the pool configuration"""
+        return (f"pool_connections={self.pool_connections}, pool_maxsize={self.pool_maxsize}, "
+                f"block={self.pool_block}, keep_alive={self.keep_alive}")
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
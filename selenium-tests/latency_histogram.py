@@ -0,0 +1,244 @@
+"""
+Latency Histogram for the University Finder Test Harness
+DevOps Lab - Section E
+
+A compact HDR-style histogram for recording response times:
+
+- Fixed memory: counts live in one array('Q') whose size depends only on
+  the trackable range and precision, never on the number of samples.
+- Log-linear buckets: each power-of-two range is split into linear
+  sub-buckets, so every recorded value keeps the requested number of
+  significant digits (2 digits = at most ~1% error).
+- Mergeable: histograms with the same settings can be added together,
+  so results from different runs, threads or processes combine exactly.
+- Serializable: encode() produces a short base64 string of the counts,
+  and to_dict()/from_dict() wrap it in JSON-friendly metadata.
+
+Values are recorded in seconds and stored as integer microseconds.
+A histogram is not thread-safe; give each thread its own and merge them.
+
+Author: DevOps Lab Project
+"""
+
+import base64
+import math
+import zlib
+from array import array
+
+
+# Histogram defaults
+DEFAULT_LOWEST_US = 1                  # 1 microsecond
+DEFAULT_HIGHEST_US = 60 * 1000 * 1000  # 60 seconds
+DEFAULT_SIGNIFICANT_FIGURES = 2
+MICROSECONDS = 1_000_000
+
+
+class LatencyHistogram:
+    """Log-linear, array-backed latency histogram"""
+
+    def __init__(self, lowest_us=DEFAULT_LOWEST_US, highest_us=DEFAULT_HIGHEST_US,
+                 significant_figures=DEFAULT_SIGNIFICANT_FIGURES):
+        if lowest_us < 1 or highest_us < 2 * lowest_us:
+            raise ValueError("highest_us must be at least twice lowest_us (lowest_us >= 1)")
+        if not 1 <= significant_figures <= 5:
+            raise ValueError("significant_figures must be between 1 and 5")
+
+        self.lowest_us = lowest_us
+        self.highest_us = highest_us
+        self.significant_figures = significant_figures
+
+        # Bucket layout (same scheme as HdrHistogram)
+        largest_single_unit = 2 * 10 ** significant_figures
+        self._sub_bucket_count_magnitude = int(math.ceil(math.log2(largest_single_unit)))
+        self._sub_bucket_half_count_magnitude = self._sub_bucket_count_magnitude - 1
+        self._unit_magnitude = int(math.floor(math.log2(lowest_us)))
+        self._sub_bucket_count = 1 << self._sub_bucket_count_magnitude
+        self._sub_bucket_half_count = self._sub_bucket_count // 2
+        self._sub_bucket_mask = (self._sub_bucket_count - 1) << self._unit_magnitude
+
+        smallest_untrackable = self._sub_bucket_count << self._unit_magnitude
+        bucket_count = 1
+        while smallest_untrackable <= highest_us:
+            smallest_untrackable <<= 1
+            bucket_count += 1
+        self._bucket_count = bucket_count
+
+        self.counts = array('Q', [0]) * ((bucket_count + 1) * self._sub_bucket_half_count)
+        self.total_count = 0
+        self.min_us = None
+        self.max_us = 0
+        self.sum_us = 0
+
+    # ------------------------------------------------------------------
+    # Index arithmetic
+    # ------------------------------------------------------------------
+
+    def _counts_index(self, value):
+        bucket = (value | self._sub_bucket_mask).bit_length() - self._unit_magnitude - \
+            (self._sub_bucket_half_count_magnitude + 1)
+        sub_bucket = value >> (bucket + self._unit_magnitude)
+        bucket_base = (bucket + 1) << self._sub_bucket_half_count_magnitude
+        return bucket_base + (sub_bucket - self._sub_bucket_half_count)
+
+    def _value_range(self, index):
+        """Lowest and highest value that land in counts[index]"""
+        bucket = (index >> self._sub_bucket_half_count_magnitude) - 1
+        sub_bucket = (index & (self._sub_bucket_half_count - 1)) + self._sub_bucket_half_count
+        if bucket < 0:
+            sub_bucket -= self._sub_bucket_half_count
+            bucket = 0
+        lowest = sub_bucket << (bucket + self._unit_magnitude)
+        width = 1 << (bucket + self._unit_magnitude)
+        return lowest, lowest + width - 1
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(self, seconds, count=1):
+        """Record a latency given in seconds"""
+        self.record_us(int(round(seconds * MICROSECONDS)), count)
+
+    def record_us(self, value, count=1):
+        """Record a latency given in integer microseconds"""
+        value = max(0, value)
+        # Out-of-range values are clamped into the top bucket; max keeps the truth
+        self.counts[self._counts_index(min(value, self.highest_us))] += count
+        self.total_count += count
+        self.sum_us += value * count
+        self.max_us = max(self.max_us, value)
+        self.min_us = value if self.min_us is None else min(self.min_us, value)
+
+    def merge(self, other):
+        """Add another histogram's counts into this one"""
+        if not self.is_compatible(other):
+            raise ValueError("Cannot merge histograms with different range or precision")
+        for index, count in enumerate(other.counts):
+            if count:
+                self.counts[index] += count
+        self.total_count += other.total_count
+        self.sum_us += other.sum_us
+        self.max_us = max(self.max_us, other.max_us)
+        if other.min_us is not None:
+            self.min_us = other.min_us if self.min_us is None else min(self.min_us, other.min_us)
+        return self
+
+    def is_compatible(self, other):
+        return (self.lowest_us, self.highest_us, self.significant_figures) == \
+            (other.lowest_us, other.highest_us, other.significant_figures)
+
+    def copy(self):
+        return LatencyHistogram(self.lowest_us, self.highest_us, self.significant_figures).merge(self)
+
+    def reset(self):
+        for index in range(len(self.counts)):
+            self.counts[index] = 0
+        self.total_count = 0
+        self.min_us = None
+        self.max_us = 0
+        self.sum_us = 0
+
+    # ------------------------------------------------------------------
+    # Queries (all results in seconds)
+    # ------------------------------------------------------------------
+
+    @property
+    def count(self):
+        return self.total_count
+
+    @property
+    def min(self):
+        return None if self.min_us is None else self.min_us / MICROSECONDS
+
+    @property
+    def max(self):
+        return self.max_us / MICROSECONDS if self.total_count else None
+
+    @property
+    def mean(self):
+        return self.sum_us / self.total_count / MICROSECONDS if self.total_count else None
+
+    def value_at_percentile(self, pct):
+        """Latency (seconds) at or below which pct percent of samples fall"""
+        if not self.total_count:
+            return None
+        target = max(1, int(math.ceil(pct / 100 * self.total_count)))
+        if target >= self.total_count:
+            return self.max
+        running = 0
+        for index, count in enumerate(self.counts):
+            running += count
+            if running >= target:
+                # Report the top of the bucket, capped at the true maximum
+                return min(self._value_range(index)[1], self.max_us) / MICROSECONDS
+        return self.max
+
+    def percentiles(self, pcts):
+        return {p: self.value_at_percentile(p) for p in pcts}
+
+    def count_between(self, low_seconds, high_seconds):
+        """Number of samples between two latencies (inclusive, bucket precision)"""
+        low = int(round(low_seconds * MICROSECONDS))
+        high = int(round(high_seconds * MICROSECONDS))
+        total = 0
+        for index, count in enumerate(self.counts):
+            if count:
+                lowest, highest = self._value_range(index)
+                if highest >= low and lowest <= high:
+                    total += count
+        return total
+
+    def iter_buckets(self):
+        """Yield (lowest_seconds, highest_seconds, count) for non-empty buckets"""
+        for index, count in enumerate(self.counts):
+            if count:
+                lowest, highest = self._value_range(index)
+                yield lowest / MICROSECONDS, highest / MICROSECONDS, count
+
+    @property
+    def memory_bytes(self):
+        return self.counts.itemsize * len(self.counts)
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    def encode(self):
+        """Compact base64 string of the zlib-compressed counts array"""
+        return base64.b64encode(zlib.compress(self.counts.tobytes())).decode('ascii')
+
+    def to_dict(self):
+        return {
+            'lowest_us': self.lowest_us,
+            'highest_us': self.highest_us,
+            'significant_figures': self.significant_figures,
+            'total_count': self.total_count,
+            'min_us': self.min_us,
+            'max_us': self.max_us,
+            'sum_us': self.sum_us,
+            'counts': self.encode(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls(data['lowest_us'], data['highest_us'], data['significant_figures'])
+        counts = array('Q')
+        counts.frombytes(zlib.decompress(base64.b64decode(data['counts'])))
+        if len(counts) != len(histogram.counts):
+            raise ValueError("Encoded counts do not match the histogram layout")
+        histogram.counts = counts
+        histogram.total_count = data['total_count']
+        histogram.min_us = data['min_us']
+        histogram.max_us = data['max_us']
+        histogram.sum_us = data['sum_us']
+        return histogram
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        self.__dict__.update(LatencyHistogram.from_dict(state).__dict__)
+
+    def __repr__(self):
+        return (f"LatencyHistogram(count={self.total_count}, "
+                f"p50={self.value_at_percentile(50)}, max={self.max})")
@@ -0,0 +1,781 @@
+"""
+Load Generator for University Finder API
+DevOps Lab - Section E
+
+Turns the API checks from test_university_app.py into load scenarios.
+Closed-loop mode runs N virtual users for a fixed duration: each user
+sends a request, waits for the response, "thinks" for a while and then
+sends the next one.
+
+Open-loop mode sends requests at a constant arrival rate no matter how
+long responses take. Latency is measured both from the moment each
+request was *scheduled* to go out (coordinated-omission corrected) and
+from the moment it was actually sent (uncorrected). When the server
+stalls, the uncorrected numbers hide the queueing delay that real users
+would see; the corrected ones do not.
+
+A single Python process cannot generate much load because of the GIL.
+With --processes N the load is split across N worker processes, each
+running its own event loop. A coordinator releases all workers at the
+same moment, then merges their per-endpoint histograms into one report.
+
+Soak mode (--soak) holds the same steady mixed load for much longer
+(an hour by default) and adds the unbounded /api/universities/ranking
+call to the mix. Latencies are also bucketed into per-minute windows,
+and least-squares trend lines are fitted over the window p50, p99,
+throughput and error rate after a warm-up. A slow leak in the Node
+process (exhausted connection pool, growing heap) shows up as latency
+drifting up or throughput decaying across the run. The HTML report
+charts the windows, and the run exits non-zero when a trend is flagged.
+
+The report shows throughput, error rate and latency percentiles per
+endpoint. Use it to size the replica count in
+kubernetes/backend-deployment.yaml, e.g. against a local stack:
+
+    docker-compose up -d backend
+    python load_generator.py --backend-url http://localhost:5000 --users 20 --duration 60
+    python load_generator.py --soak --mode open --rate 20 --duration 7200
+
+Author: DevOps Lab Project
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty
+
+import requests
+
+from http_client import PooledHttpClient, ConnectionStats
+from latency_histogram import LatencyHistogram
+from perf_report import (format_ms, format_bytes, linear_fit, print_section, svg_chart, write_text_report,
+                         write_html_report)
+from results_store import DEFAULT_HISTORY_PATH, ResultsStore
+from test_university_app import BACKEND_URL, FRONTEND_URL
+
+
+# Load defaults
+DEFAULT_USERS = 10
+DEFAULT_DURATION = 30       # Seconds
+DEFAULT_THINK_TIME = 1.0    # Mean seconds between a response and the next request
+DEFAULT_RATE = 20.0         # Open-loop arrivals per second
+DEFAULT_MAX_IN_FLIGHT = 100 # Open-loop worker threads (outstanding requests)
+WORKER_START_TIMEOUT = 60   # Seconds to wait for every worker process to be ready
+WORKER_POLL_INTERVAL = 5    # Seconds between liveness checks while waiting for results
+PERCENTILES = (50, 90, 95, 99)
+
+# Soak defaults
+DEFAULT_SOAK_DURATION = 3600  # Seconds
+DEFAULT_WINDOW = 60           # Seconds per soak window
+DEFAULT_SOAK_WARMUP = 1       # Leading windows left out of the trend fit
+DEFAULT_MAX_DRIFT = 20.0      # % change over the run that counts as degradation
+MIN_TREND_R = 0.5             # |r| below this is noise, not a trend
+MAX_ERROR_DRIFT = 1.0         # Percentage points of error-rate growth over the run
+
+# Scenarios mirror the checks in AutomatedTestSuite
+SCENARIOS = [
+    {'name': 'Universities', 'path': '/api/universities', 'params': {}},
+    {'name': 'Search', 'path': '/api/universities/search', 'params': {'query': 'NUST'}},
+    {'name': 'Disciplines', 'path': '/api/disciplines', 'params': {}},
+    {'name': 'Top Universities', 'path': '/api/universities/top', 'params': {}},
+]
+
+# Soak mix adds the unbounded ranking query (whole collection per call)
+SOAK_SCENARIOS = SCENARIOS + [
+    {'name': 'Ranking', 'path': '/api/universities/ranking', 'params': {}},
+]
+
+
+class EndpointStats:
+    """Latency histograms and error counts for one endpoint"""
+
+    def __init__(self, name):
+        self.name = name
+        self.histogram = LatencyHistogram()
+        # Open-loop only: latency measured from the intended send time
+        self.corrected_histogram = LatencyHistogram()
+        # Failed requests only (also counted above), so history can keep them apart
+        self.error_histogram = LatencyHistogram()
+        self.corrected_error_histogram = LatencyHistogram()
+        self.errors = 0
+        self.bytes_received = 0
+
+    @property
+    def count(self):
+        return self.histogram.count
+
+    @property
+    def error_rate(self):
+        return (self.errors / self.count * 100) if self.count else 0.0
+
+    def record(self, latency, ok, size=0, corrected=None):
+        self.histogram.record(latency)
+        if corrected is not None:
+            self.corrected_histogram.record(corrected)
+        self.bytes_received += size
+        if not ok:
+            self.errors += 1
+            self.error_histogram.record(latency)
+            if corrected is not None:
+                self.corrected_error_histogram.record(corrected)
+
+    def merge(self, other):
+        """Fold another run's statistics for the same endpoint into this one"""
+        self.histogram.merge(other.histogram)
+        self.corrected_histogram.merge(other.corrected_histogram)
+        self.error_histogram.merge(other.error_histogram)
+        self.corrected_error_histogram.merge(other.corrected_error_histogram)
+        self.errors += other.errors
+        self.bytes_received += other.bytes_received
+        return self
+
+    def percentiles(self, pcts=PERCENTILES, corrected=False):
+        histogram = self.corrected_histogram if corrected else self.histogram
+        return histogram.percentiles(pcts)
+
+
+class LoadResults:
+    """Per-endpoint statistics for one load run"""
+
+    def __init__(self, names=(), window=None):
+        # Pre-register names so reports list endpoints in scenario order
+        self.endpoints = {name: EndpointStats(name) for name in names}
+        self.elapsed = 0.0
+        # Soak runs: all endpoints together per time window, keyed by window index
+        self.window = window
+        self.windows = {}
+
+    def record(self, name, latency, ok, size=0, corrected=None, at=None):
+        """at: seconds since the start of the run at which the response completed"""
+        if name not in self.endpoints:
+            self.endpoints[name] = EndpointStats(name)
+        self.endpoints[name].record(latency, ok, size, corrected)
+        if self.window and at is not None:
+            index = int(at // self.window)
+            if index not in self.windows:
+                self.windows[index] = EndpointStats(f"window {index}")
+            self.windows[index].record(latency, ok, size, corrected)
+
+    def merge(self, other):
+        """Fold another LoadResults (e.g. from a worker process) into this one"""
+        for name, stats in other.endpoints.items():
+            if name not in self.endpoints:
+                self.endpoints[name] = EndpointStats(name)
+            self.endpoints[name].merge(stats)
+        # Workers are released together, so window indexes line up
+        self.window = self.window or other.window
+        for index, stats in other.windows.items():
+            if index not in self.windows:
+                self.windows[index] = EndpointStats(stats.name)
+            self.windows[index].merge(stats)
+        # Workers run side by side, so the merged run lasts as long as the slowest
+        self.elapsed = max(self.elapsed, other.elapsed)
+        return self
+
+    @property
+    def has_corrected(self):
+        return any(s.corrected_histogram.count for s in self.endpoints.values())
+
+    @property
+    def total_requests(self):
+        return sum(s.count for s in self.endpoints.values())
+
+    @property
+    def total_errors(self):
+        return sum(s.errors for s in self.endpoints.values())
+
+    def throughput(self, stats=None):
+        """Requests per second, overall or for one endpoint"""
+        count = stats.count if stats else self.total_requests
+        return count / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def send_request(client, backend_url, scenario):
+    """Send one scenario request and return (sent_at, latency, ok, size)"""
+    start = time.perf_counter()
+    try:
+        response = client.get(f"{backend_url}{scenario['path']}", params=scenario['params'])
+        size = len(response.content)
+        ok = response.status_code < 400
+    except requests.RequestException:
+        size = 0
+        ok = False
+    return start, time.perf_counter() - start, ok, size
+
+
+class ClosedLoopLoadGenerator:
+    """N virtual users, each looping request -> response -> think time"""
+
+    def __init__(self, backend_url=BACKEND_URL, users=DEFAULT_USERS,
+                 duration=DEFAULT_DURATION, think_time=DEFAULT_THINK_TIME,
+                 scenarios=SCENARIOS, window=None):
+        self.backend_url = backend_url.rstrip('/')
+        self.users = users
+        self.duration = duration
+        self.think_time = think_time
+        self.scenarios = scenarios
+        self.window = window
+        self.results = LoadResults((s['name'] for s in scenarios), window)
+        self.started = None
+        # One keep-alive connection per virtual user
+        self.client = PooledHttpClient(pool_maxsize=users)
+
+    def _think(self):
+        """Think time is jittered +/-50% so users don't march in lockstep"""
+        return random.uniform(0.5, 1.5) * self.think_time if self.think_time > 0 else 0
+
+    async def _virtual_user(self, user_id, deadline, executor):
+        loop = asyncio.get_running_loop()
+        step = user_id
+        while time.monotonic() < deadline:
+            scenario = self.scenarios[step % len(self.scenarios)]
+            step += 1
+            _, latency, ok, size = await loop.run_in_executor(
+                executor, send_request, self.client, self.backend_url, scenario)
+            self.results.record(scenario['name'], latency, ok, size, at=time.monotonic() - self.started)
+            await asyncio.sleep(self._think())
+
+    async def _run(self):
+        start = self.started = time.monotonic()
+        deadline = start + self.duration
+        with ThreadPoolExecutor(max_workers=self.users) as executor:
+            await asyncio.gather(*(self._virtual_user(i, deadline, executor)
+                                   for i in range(self.users)))
+        self.results.elapsed = time.monotonic() - start
+
+    def run(self, verbose=True):
+        """Run the load and return LoadResults"""
+        if verbose:
+            print("=" * 70)
+            print("CLOSED-LOOP LOAD TEST")
+            print("=" * 70)
+            print(f"📍 Backend URL: {self.backend_url}")
+            print(f"👥 Virtual users: {self.users}")
+            print(f"⏱️ Duration: {self.duration}s, think time: {self.think_time}s\n")
+        try:
+            asyncio.run(self._run())
+        finally:
+            self.client.close()
+        return self.results
+
+    def describe(self):
+        return [
+            ("Mode", "closed-loop"),
+            ("Backend URL", self.backend_url),
+            ("Virtual Users", self.users),
+            ("Duration", f"{self.duration}s"),
+            ("Think Time", f"{self.think_time}s"),
+        ] + ([("Window", f"{self.window}s")] if self.window else []) + [
+            ("Connections", self.client.stats.summary()),
+        ]
+
+
+class OpenLoopLoadGenerator:
+    """
+    Constant-arrival-rate scheduler.
+
+    Request i is due at start + i / rate. It is handed to a worker thread at
+    that moment whether or not earlier requests have completed. If all
+    workers are busy it waits in the executor queue, and that wait counts
+    towards the corrected latency, just as it would for a real user.
+    """
+
+    def __init__(self, backend_url=BACKEND_URL, rate=DEFAULT_RATE,
+                 duration=DEFAULT_DURATION, max_in_flight=DEFAULT_MAX_IN_FLIGHT,
+                 scenarios=SCENARIOS, start_offset=0.0, window=None):
+        self.backend_url = backend_url.rstrip('/')
+        self.rate = rate
+        # Delay before the first arrival; lets parallel workers interleave their schedules
+        self.start_offset = start_offset
+        self.duration = duration
+        self.max_in_flight = max_in_flight
+        self.scenarios = scenarios
+        self.window = window
+        self.results = LoadResults((s['name'] for s in scenarios), window)
+        self.started = None
+        self.client = PooledHttpClient(pool_maxsize=max_in_flight)
+        self.max_send_lag = 0.0
+
+    async def _fire(self, scenario, intended, executor):
+        loop = asyncio.get_running_loop()
+        sent_at, latency, ok, size = await loop.run_in_executor(
+            executor, send_request, self.client, self.backend_url, scenario)
+        completed = sent_at + latency
+        self.max_send_lag = max(self.max_send_lag, sent_at - intended)
+        self.results.record(scenario['name'], latency, ok, size, corrected=completed - intended,
+                            at=completed - self.started)
+
+    async def _run(self):
+        total = int(self.rate * self.duration)
+        interval = 1.0 / self.rate
+        tasks = []
+        # Window times count from the unshifted start, shared by every worker
+        self.started = time.perf_counter()
+        start = self.started + self.start_offset
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            for i in range(total):
+                intended = start + i * interval
+                delay = intended - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                scenario = self.scenarios[i % len(self.scenarios)]
+                tasks.append(asyncio.ensure_future(self._fire(scenario, intended, executor)))
+            await asyncio.gather(*tasks)
+        self.results.elapsed = time.perf_counter() - start
+
+    def run(self, verbose=True):
+        """Run the load and return LoadResults"""
+        if verbose:
+            print("=" * 70)
+            print("OPEN-LOOP LOAD TEST (constant arrival rate)")
+            print("=" * 70)
+            print(f"📍 Backend URL: {self.backend_url}")
+            print(f"🎯 Target rate: {self.rate} req/s")
+            print(f"⏱️ Duration: {self.duration}s, max in flight: {self.max_in_flight}\n")
+        try:
+            asyncio.run(self._run())
+        finally:
+            self.client.close()
+        return self.results
+
+    def describe(self):
+        return [
+            ("Mode", "open-loop"),
+            ("Backend URL", self.backend_url),
+            ("Target Rate", f"{self.rate} req/s"),
+            ("Duration", f"{self.duration}s"),
+            ("Max In Flight", self.max_in_flight),
+            ("Max Send Lag", format_ms(self.max_send_lag)),
+        ] + ([("Window", f"{self.window}s")] if self.window else []) + [
+            ("Connections", self.client.stats.summary()),
+        ]
+
+
+def build_generator(mode, **kwargs):
+    """Create a closed- or open-loop generator from keyword settings"""
+    if mode == "open":
+        return OpenLoopLoadGenerator(**kwargs)
+    return ClosedLoopLoadGenerator(**kwargs)
+
+
+def _load_worker(worker_id, mode, kwargs, barrier, queue):
+    """Worker process: build a generator, wait for the start signal, run, report back"""
+    try:
+        generator = build_generator(mode, **kwargs)
+        barrier.wait(WORKER_START_TIMEOUT)
+        results = generator.run(verbose=False)
+        stats = generator.client.stats
+        queue.put((worker_id, results, stats.requests, stats.new_connections, None))
+    except Exception as e:
+        queue.put((worker_id, None, 0, 0, f"{type(e).__name__}: {e}"))
+
+
+class MultiProcessLoadCoordinator:
+    """
+    Fan a closed- or open-loop load out over several processes.
+
+    Closed loop: virtual users are divided between the workers.
+    Open loop: the arrival rate is divided between the workers and each
+    worker's schedule is shifted by worker_id / rate, so the combined
+    arrivals stay evenly spaced at the full target rate.
+    """
+
+    def __init__(self, mode="closed", processes=None, **kwargs):
+        self.mode = mode
+        self.kwargs = kwargs
+        processes = processes or os.cpu_count() or 1
+        if mode == "closed":
+            processes = min(processes, kwargs.get('users', DEFAULT_USERS))
+        self.processes = max(1, processes)
+        self.scenarios = kwargs.get('scenarios', SCENARIOS)
+        self.client_stats = ConnectionStats()
+        self.worker_errors = []
+
+    def _worker_kwargs(self, worker_id):
+        kwargs = dict(self.kwargs)
+        if self.mode == "open":
+            rate = kwargs.get('rate', DEFAULT_RATE)
+            kwargs['rate'] = rate / self.processes
+            kwargs['start_offset'] = worker_id / rate
+            kwargs['max_in_flight'] = max(1, math.ceil(
+                kwargs.get('max_in_flight', DEFAULT_MAX_IN_FLIGHT) / self.processes))
+        else:
+            users = kwargs.get('users', DEFAULT_USERS)
+            kwargs['users'] = users // self.processes + (1 if worker_id < users % self.processes else 0)
+        return kwargs
+
+    def run(self):
+        """Start every worker at the same moment and return merged LoadResults"""
+        print("=" * 70)
+        print(f"MULTI-PROCESS LOAD TEST ({self.mode}-loop, {self.processes} processes)")
+        print("=" * 70)
+        for key, value in self.kwargs.items():
+            if key != 'scenarios':
+                print(f"   {key}: {value}")
+        print()
+
+        # The coordinator is the last party at the barrier, so workers are
+        # released together once every one of them has finished starting up
+        barrier = multiprocessing.Barrier(self.processes + 1)
+        queue = multiprocessing.Queue()
+        workers = [
+            multiprocessing.Process(target=_load_worker,
+                                    args=(i, self.mode, self._worker_kwargs(i), barrier, queue))
+            for i in range(self.processes)
+        ]
+        for worker in workers:
+            worker.start()
+
+        merged = LoadResults(s['name'] for s in self.scenarios)
+        try:
+            barrier.wait(WORKER_START_TIMEOUT)
+            print(f"🚀 {self.processes} workers started")
+        except threading.BrokenBarrierError:
+            print("⚠ Not every worker reached the start barrier")
+
+        # Drain the queue before joining so workers never block on a full pipe.
+        # A worker killed by a signal or the OOM killer never reports back, so
+        # poll with a timeout and give up on workers that have exited
+        pending = set(range(self.processes))
+        while pending:
+            try:
+                worker_id, results, requests_sent, new_connections, error = queue.get(timeout=WORKER_POLL_INTERVAL)
+            except Empty:
+                # A worker flushes its result before exiting, so a worker that
+                # is gone after a quiet poll interval is never going to report
+                for i in sorted(pending):
+                    if not workers[i].is_alive():
+                        pending.discard(i)
+                        self._record_missing(i, workers[i].exitcode)
+                continue
+            pending.discard(worker_id)
+            if error:
+                self.worker_errors.append(f"worker {worker_id}: {error}")
+                print(f"❌ Worker {worker_id} failed: {error}")
+                continue
+            merged.merge(results)
+            self.client_stats.requests += requests_sent
+            self.client_stats.new_connections += new_connections
+        for worker in workers:
+            worker.join()
+        return merged
+
+    def _record_missing(self, worker_id, exitcode):
+        error = f"exited with code {exitcode} without reporting results"
+        self.worker_errors.append(f"worker {worker_id}: {error}")
+        print(f"❌ Worker {worker_id} {error}")
+
+    def describe(self):
+        meta = [("Mode", f"{self.mode}-loop, {self.processes} processes")]
+        for key, value in self.kwargs.items():
+            if key != 'scenarios':
+                meta.append((key.replace('_', ' ').title(), value))
+        meta.append(("Connections", self.client_stats.summary()))
+        if self.worker_errors:
+            meta.append(("Worker Errors", "; ".join(self.worker_errors)))
+        return meta
+
+
+def build_sections(results):
+    """Per-endpoint throughput / error rate / latency percentile table"""
+    headers = ["Endpoint", "Requests", "RPS", "Errors", "Error %"] + \
+              [f"p{p}" for p in PERCENTILES] + ["Max", "Avg Size"]
+    rows = []
+    for stats in results.endpoints.values():
+        pcts = stats.percentiles()
+        avg_size = stats.bytes_received / stats.count if stats.count else 0
+        rows.append([stats.name, stats.count, f"{results.throughput(stats):.2f}", stats.errors,
+                     f"{stats.error_rate:.1f}%"] + [format_ms(pcts[p]) for p in PERCENTILES] +
+                    [format_ms(stats.histogram.max), format_bytes(avg_size)])
+    sections = [{'title': "Per-Endpoint Results", 'headers': headers, 'rows': rows}]
+
+    if results.has_corrected:
+        headers = ["Endpoint"] + [f"p{p} {kind}" for p in PERCENTILES for kind in ("corr", "uncorr")] + \
+                  ["Max corr"]
+        rows = []
+        for stats in results.endpoints.values():
+            corrected = stats.percentiles(corrected=True)
+            uncorrected = stats.percentiles()
+            row = [stats.name]
+            for p in PERCENTILES:
+                row += [format_ms(corrected[p]), format_ms(uncorrected[p])]
+            rows.append(row + [format_ms(stats.corrected_histogram.max)])
+        sections.append({
+            'title': "Coordinated-Omission Corrected Latency",
+            'headers': headers,
+            'rows': rows,
+            'notes': [
+                "corr = measured from each request's intended send time (what users experience)",
+                "uncorr = measured from the actual send time (service time only)",
+            ]
+        })
+    return sections
+
+
+def soak_windows(results):
+    """
+    (index, stats) of every complete window, in time order. A window in
+    which no response completed is still listed, with empty stats.
+    """
+    # The last open-loop arrival is one interval short of the duration, hence the 5% slack
+    complete = int(results.elapsed / results.window + 0.05) if results.window else 0
+    return [(index, results.windows.get(index) or EndpointStats(f"window {index}")) for index in range(complete)]
+
+
+def stalled_windows(results, warmup=DEFAULT_SOAK_WARMUP):
+    """Indexes of the complete windows after the warm-up in which no response completed"""
+    return [index for index, stats in soak_windows(results) if index >= warmup and not stats.count]
+
+
+def soak_trends(results, warmup=DEFAULT_SOAK_WARMUP, max_drift=DEFAULT_MAX_DRIFT):
+    """
+    Least-squares trend of p50, p99, throughput and error rate over the
+    complete windows after the warm-up. Drift is the change of the fitted
+    line from the first to the last window; a trend is flagged when it
+    moves the wrong way by more than max_drift % with |r| >= MIN_TREND_R.
+    An empty (stalled) window counts as 0 req/s and has no latency.
+    """
+    windows = [(index, stats) for index, stats in soak_windows(results) if index >= warmup]
+    minutes = results.window / 60
+    corrected = results.has_corrected
+    metrics = (
+        ('p50', lambda s: s.percentiles((50,), corrected)[50] * 1000 if s.count else None, 1),
+        ('p99', lambda s: s.percentiles((99,), corrected)[99] * 1000 if s.count else None, 1),
+        ('throughput', lambda s: s.count / results.window, -1),
+        ('error rate', lambda s: s.error_rate if s.count else None, 1),
+    )
+    trends = {}
+    for name, value, worse in metrics:
+        points = [((index + 0.5) * minutes, value(stats)) for index, stats in windows]
+        points = [point for point in points if point[1] is not None]
+        trend = {'points': points, 'fit': linear_fit(points), 'drift': None, 'degraded': False}
+        if trend['fit']:
+            intercept, slope, r = trend['fit']
+            trend['start'] = intercept + slope * points[0][0]
+            trend['end'] = intercept + slope * points[-1][0]
+            change = trend['end'] - trend['start']
+            if name == 'error rate':
+                # Usually starts at 0%, so judged in percentage points
+                trend['degraded'] = change > MAX_ERROR_DRIFT and r >= MIN_TREND_R
+            elif trend['start'] > 0:
+                trend['drift'] = change / trend['start'] * 100
+                trend['degraded'] = trend['drift'] * worse > max_drift and r * worse >= MIN_TREND_R
+        trends[name] = trend
+    return trends
+
+
+def _clock(seconds):
+    return f"{int(seconds // 60)}:{int(seconds % 60):02d}"
+
+
+def build_soak_sections(results, warmup=DEFAULT_SOAK_WARMUP, max_drift=DEFAULT_MAX_DRIFT):
+    """Per-window table and trend verdicts; returns (sections, degraded metric names)"""
+    corrected = results.has_corrected
+    complete = dict(soak_windows(results))
+    stalled = stalled_windows(results, warmup)
+    rows = []
+    for index in sorted(set(complete) | set(results.windows)):
+        stats = complete.get(index) or results.windows[index]
+        pcts = stats.percentiles((50, 99), corrected)
+        if index < warmup:
+            note = "warm-up"
+        elif index not in complete:
+            note = "partial"
+        else:
+            note = "STALL: no responses" if index in stalled else ""
+        rows.append([f"{_clock(index * results.window)}-{_clock((index + 1) * results.window)}", stats.count,
+                     f"{stats.count / results.window:.2f}", f"{stats.error_rate:.1f}%",
+                     format_ms(pcts[50]), format_ms(pcts[99]),
+                     format_ms((stats.corrected_histogram if corrected else stats.histogram).max), note])
+
+    trends = soak_trends(results, warmup, max_drift)
+    latency_series = []
+    for name, colour in (('p50', '#2196F3'), ('p99', '#f44336')):
+        trend = trends[name]
+        latency_series.append({'name': name, 'points': trend['points'], 'colour': colour})
+        if trend['fit']:
+            latency_series.append({'name': f"{name} trend", 'line': True, 'colour': colour,
+                                   'points': [(trend['points'][0][0], trend['start']),
+                                              (trend['points'][-1][0], trend['end'])]})
+    sections = [{'title': "Soak Windows",
+                 'headers': ["Window (m:ss)", "Requests", "RPS", "Errors", "p50", "p99", "Max", "Note"],
+                 'rows': rows,
+                 'notes': [f"{results.window:g}s windows, all endpoints together" +
+                           (", latency from the intended send time" if corrected else ""),
+                           "Warm-up and partial windows are left out of the trend fit"],
+                 'html': svg_chart(latency_series, "minutes since start", "latency (ms)")}]
+
+    rows, degraded = [], []
+    for name, trend in trends.items():
+        if not trend['fit']:
+            rows.append([name, "N/A", "N/A", "N/A", "N/A", "N/A", "too few windows"])
+            continue
+        unit = "%" if name == 'error rate' else (" rps" if name == 'throughput' else "ms")
+        intercept, slope, r = trend['fit']
+        if trend['degraded']:
+            degraded.append(name)
+        rows.append([name, f"{trend['start']:.2f}{unit}", f"{trend['end']:.2f}{unit}",
+                     f"{slope * 60:+.3f}{unit}/h",
+                     f"{trend['drift']:+.1f}%" if trend['drift'] is not None else "-", f"{r:.2f}",
+                     "FAIL" if trend['degraded'] else "OK"])
+    throughput = trends['throughput']
+    throughput_series = [{'name': "throughput", 'points': throughput['points'], 'colour': '#4CAF50'}]
+    if throughput['fit']:
+        throughput_series.append({'name': "trend", 'line': True, 'colour': '#333',
+                                  'points': [(throughput['points'][0][0], throughput['start']),
+                                             (throughput['points'][-1][0], throughput['end'])]})
+    notes = [f"Flagged when the fitted line drifts the wrong way by more than {max_drift:g}% "
+             f"(error rate: {MAX_ERROR_DRIFT:g} points) with |r| >= {MIN_TREND_R}"]
+    if degraded:
+        notes.append(f"❌ Steady degradation in: {', '.join(degraded)} - look for leaks in the Node process")
+    if stalled:
+        notes.append(f"❌ No response completed in {len(stalled)} window(s) starting at "
+                     f"{', '.join(_clock(index * results.window) for index in stalled)} - the server stalled")
+        degraded.append("stalls")
+    if not degraded and all(t['fit'] for t in trends.values()):
+        notes.append("✅ No steady degradation over the run")
+    sections.append({'title': "Soak Trend",
+                     'headers': ["Metric", "Fitted Start", "Fitted End", "Slope", "Drift", "r", "Verdict"],
+                     'rows': rows, 'notes': notes,
+                     'html': svg_chart(throughput_series, "minutes since start", "throughput (req/s)")})
+    return sections, degraded
+
+
+def generate_reports(generator, results, basename="load-test-report", max_drift=DEFAULT_MAX_DRIFT):
+    """Print the results and save text + HTML reports; returns the degraded soak metrics"""
+    sections = build_sections(results)
+    degraded = []
+    if results.windows:
+        soak_sections, degraded = build_soak_sections(results, max_drift=max_drift)
+        sections += soak_sections
+    for section in sections:
+        print_section(section)
+
+    error_rate = (results.total_errors / results.total_requests * 100) if results.total_requests else 0
+    cards = [
+        ("Requests", results.total_requests),
+        ("Throughput", f"{results.throughput():.1f} rps"),
+        ("Error Rate", f"{error_rate:.2f}%"),
+        ("Elapsed", f"{results.elapsed:.1f}s"),
+    ]
+    if results.windows:
+        cards.append(("Soak Verdict", f"FAIL ({', '.join(degraded)})" if degraded else "OK"))
+    print(f"\n📊 Total: {results.total_requests} requests, {results.throughput():.1f} rps, "
+          f"{error_rate:.2f}% errors\n")
+    meta = generator.describe()
+    write_text_report(f"{basename}.txt", "Load Test Report", meta, sections)
+    write_html_report(f"{basename}.html", "Load Test Report",
+                      "University Finder API - Load Generation", meta, cards, sections)
+    save_histograms(results, f"{basename}-histograms.json")
+    return degraded
+
+
+def save_histograms(results, path):
+    """Save per-endpoint histograms so separate runs can be merged later"""
+    data = {}
+    for stats in results.endpoints.values():
+        data[stats.name] = {
+            'histogram': stats.histogram.to_dict(),
+            'corrected_histogram': stats.corrected_histogram.to_dict(),
+            'error_histogram': stats.error_histogram.to_dict(),
+            'corrected_error_histogram': stats.corrected_error_histogram.to_dict(),
+            'errors': stats.errors,
+            'bytes_received': stats.bytes_received,
+        }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'elapsed': results.elapsed, 'endpoints': data}, f, indent=2)
+    print(f"📄 Latency histograms saved to: {path}")
+
+
+def save_history(results, suite, backend_url, scenarios=SCENARIOS, path=DEFAULT_HISTORY_PATH):
+    """
+    Append the run to the results store, one row per histogram bucket.
+
+    Successes and failures go in separate rows so failed requests never
+    count as ok samples. Open-loop runs store the coordinated-omission
+    corrected latencies.
+    """
+    paths = {s['name']: s['path'] for s in scenarios}
+    samples = []
+    for stats in results.endpoints.values():
+        if stats.corrected_histogram.count:
+            histogram, errors = stats.corrected_histogram, stats.corrected_error_histogram
+        else:
+            histogram, errors = stats.histogram, stats.error_histogram
+        path_name = paths.get(stats.name, stats.name)
+        failed = {(lowest, highest): count for lowest, highest, count in errors.iter_buckets()}
+        for lowest, highest, count in histogram.iter_buckets():
+            succeeded = count - failed.get((lowest, highest), 0)
+            if succeeded:
+                samples.append((path_name, (lowest + highest) / 2, succeeded, True))
+        for (lowest, highest), count in failed.items():
+            samples.append((path_name, (lowest + highest) / 2, count, False))
+    with ResultsStore(path) as store:
+        run_id = store.record_run(suite, samples, FRONTEND_URL, backend_url)
+    print(f"🗄️ Run #{run_id} saved to history: {path}")
+    return run_id
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="University Finder API load generator")
+    parser.add_argument("--backend-url", default=BACKEND_URL)
+    parser.add_argument("--mode", choices=["closed", "open"], default="closed",
+                        help="closed: virtual users with think time, open: constant arrival rate")
+    parser.add_argument("--users", type=int, default=DEFAULT_USERS, help="number of virtual users")
+    parser.add_argument("--duration", type=float,
+                        help=f"seconds to run (default {DEFAULT_DURATION}, {DEFAULT_SOAK_DURATION} with --soak)")
+    parser.add_argument("--think-time", type=float, default=DEFAULT_THINK_TIME,
+                        help="mean think time between requests per user (seconds)")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE,
+                        help="open-loop arrival rate (requests per second)")
+    parser.add_argument("--max-in-flight", type=int, default=DEFAULT_MAX_IN_FLIGHT,
+                        help="open-loop cap on outstanding requests")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="worker processes, one event loop each (0 = one per CPU core)")
+    parser.add_argument("--soak", action="store_true",
+                        help="long steady run with per-window trend analysis (adds the ranking query)")
+    parser.add_argument("--window", type=float, default=DEFAULT_WINDOW, help="soak window length (seconds)")
+    parser.add_argument("--max-drift", type=float, default=DEFAULT_MAX_DRIFT,
+                        help="soak: %% change over the run that counts as degradation")
+    parser.add_argument("--history", default=DEFAULT_HISTORY_PATH,
+                        help="SQLite results history to append to (\"\" to skip)")
+    args = parser.parse_args()
+    duration = args.duration or (DEFAULT_SOAK_DURATION if args.soak else DEFAULT_DURATION)
+
+    if args.mode == "open":
+        settings = dict(
+            backend_url=args.backend_url,
+            rate=args.rate,
+            duration=duration,
+            max_in_flight=max(1, args.max_in_flight)
+        )
+    else:
+        settings = dict(
+            backend_url=args.backend_url,
+            users=max(1, args.users),
+            duration=duration,
+            think_time=args.think_time
+        )
+
+    if args.soak:
+        settings.update(scenarios=SOAK_SCENARIOS, window=args.window)
+
+    if args.processes == 1:
+        generator = build_generator(args.mode, **settings)
+    else:
+        generator = MultiProcessLoadCoordinator(args.mode, args.processes or None, **settings)
+    results = generator.run()
+    degraded_metrics = generate_reports(generator, results, max_drift=args.max_drift)
+    if args.history:
+        suite = f"{'soak' if args.soak else 'load'}-{args.mode}"
+        save_history(results, suite, args.backend_url.rstrip('/'), settings.get('scenarios', SCENARIOS),
+                     path=args.history)
+    if degraded_metrics:
+        raise SystemExit(1)
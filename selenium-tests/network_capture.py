@@ -0,0 +1,306 @@
+"""
+Network Waterfall Capture for the Selenium Suite
+DevOps Lab - Section E
+
+Records every request a page makes, using the Chrome DevTools protocol
+Network.* events that chromedriver writes to its "performance" log
+(enabled by driver_pool.create_driver). For the page currently loaded it
+rebuilds the request list - URL, method, resource type, status, transfer
+size, start/duration, cache status and initiator - and flags wasteful
+API traffic:
+
+- repeated:   the same URL was requested more than once by one page
+- overfetch:  an API response carried many records but only a few of
+              them appear on the page
+- large:      an API response is bigger than LARGE_API_RESPONSE_BYTES
+- sequential: the page's API calls never overlapped, so each one waited
+              for the previous one
+
+Author: DevOps Lab Project
+"""
+
+import html
+import json
+import threading
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.common.by import By
+
+from perf_report import format_bytes
+
+
+LARGE_API_RESPONSE_BYTES = 100 * 1024
+OVERFETCH_RECORDS = 50          # Responses with more records than this are checked
+OVERFETCH_DISPLAYED_RATIO = 0.25  # ... and flagged if fewer than 25% are on screen
+API_PATH_PREFIX = '/api/'
+
+
+def enable_network_capture(options):
+    """Ask chromedriver to log DevTools Network events (call before launch)"""
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return options
+
+
+def _cache_status(response, served_from_memory):
+    if served_from_memory:
+        return 'memory'
+    if response.get('fromServiceWorker'):
+        return 'service-worker'
+    if response.get('fromPrefetchCache'):
+        return 'prefetch'
+    if response.get('fromDiskCache'):
+        return 'disk'
+    if response.get('status') == 304:
+        return 'revalidated'
+    return 'network'
+
+
+def _initiator(initiator):
+    """Short 'type: url:line' description of who started a request"""
+    kind = initiator.get('type', 'other')
+    url, line = initiator.get('url'), initiator.get('lineNumber')
+    stack = initiator.get('stack') or {}
+    while not url and stack:
+        frames = stack.get('callFrames') or []
+        if frames:
+            url, line = frames[0].get('url'), frames[0].get('lineNumber')
+            break
+        stack = stack.get('parent') or {}
+    if not url:
+        return kind
+    return f"{kind}: {url}" + (f":{line + 1}" if line is not None else "")
+
+
+def parse_performance_log(entries):
+    """
+    Rebuild the requests of the most recent document from performance log entries.
+
+    Sub-resources and fetch/XHR calls carry the loaderId of the document
+    that issued them, so requests belonging to earlier pages (or the
+    about:blank left by a browser reset) are dropped.
+    """
+    requests = {}
+    order = []
+    memory_cache = set()
+    document_loader = None
+
+    for entry in entries:
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, TypeError, ValueError):
+            continue
+        method, params = message.get('method', ''), message.get('params', {})
+        request_id = params.get('requestId')
+
+        if method == 'Network.requestWillBeSent':
+            if request_id in requests and params.get('redirectResponse'):
+                # A redirect reuses the requestId; keep the hop as its own row
+                hop_id = f"{request_id}:redirect{len(order)}"
+                requests[hop_id] = requests.pop(request_id)
+                requests[hop_id]['status'] = params['redirectResponse'].get('status')
+                requests[hop_id]['finished'] = params.get('timestamp')
+                order[order.index(request_id)] = hop_id
+            request = params.get('request', {})
+            requests[request_id] = {
+                'request_id': request_id,
+                'loader_id': params.get('loaderId'),
+                'url': request.get('url', ''),
+                'method': request.get('method', 'GET'),
+                'type': params.get('type', 'Other'),
+                'initiator': _initiator(params.get('initiator', {})),
+                'sent': params.get('timestamp'),
+                'finished': None,
+                'status': None,
+                'mime_type': None,
+                'size': 0,
+                'cache': 'network',
+                'server_wait': None,
+                'failed': None,
+            }
+            order.append(request_id)
+            # A navigation's document request shares its id with the new loader
+            if params.get('type') == 'Document' and request_id == params.get('loaderId'):
+                document_loader = request_id
+
+        elif method == 'Network.requestServedFromCache':
+            memory_cache.add(request_id)
+
+        elif method == 'Network.responseReceived' and request_id in requests:
+            response = params.get('response', {})
+            record = requests[request_id]
+            record['status'] = response.get('status')
+            record['mime_type'] = response.get('mimeType')
+            record['type'] = params.get('type', record['type'])
+            record['cache'] = _cache_status(response, request_id in memory_cache)
+            timing = response.get('timing') or {}
+            if timing.get('receiveHeadersEnd') is not None and timing.get('sendEnd') is not None:
+                record['server_wait'] = max(0.0, timing['receiveHeadersEnd'] - timing['sendEnd'])
+
+        elif method == 'Network.loadingFinished' and request_id in requests:
+            requests[request_id]['finished'] = params.get('timestamp')
+            requests[request_id]['size'] = int(params.get('encodedDataLength') or 0)
+
+        elif method == 'Network.loadingFailed' and request_id in requests:
+            requests[request_id]['finished'] = params.get('timestamp')
+            requests[request_id]['failed'] = 'canceled' if params.get('canceled') else params.get('errorText')
+
+    page = [requests[key] for key in order
+            if key in requests and (document_loader is None or requests[key]['loader_id'] == document_loader)]
+    sent_times = [r['sent'] for r in page if r['sent'] is not None]
+    origin = min(sent_times) if sent_times else 0.0
+    for record in page:
+        record['start'] = ((record['sent'] or origin) - origin) * 1000
+        end = record['finished'] if record['finished'] is not None else record['sent']
+        record['duration'] = max(0.0, ((end or origin) - (record['sent'] or origin)) * 1000)
+    return page
+
+
+def is_api_request(record, api_origins=()):
+    url = record['url']
+    if any(url.startswith(origin) for origin in api_origins):
+        return True
+    return urlsplit(url).path.startswith(API_PATH_PREFIX)
+
+
+def _record_list(payload):
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict):
+        for value in payload.values():
+            if isinstance(value, list):
+                return value
+    return None
+
+
+def find_issues(page, api_origins=(), bodies=None, page_text=""):
+    """
+    Flag repeated, oversized, over-fetching and sequential API traffic.
+
+    bodies maps requestId -> decoded JSON body for the API calls whose
+    bodies could be read; page_text is the visible text of the page.
+    """
+    bodies = bodies or {}
+    issues = []
+
+    seen = {}
+    for record in page:
+        if record['type'] != 'Document' and not record['failed']:
+            seen.setdefault((record['method'], record['url']), []).append(record)
+    for (method, url), records in seen.items():
+        if len(records) > 1:
+            issues.append({'kind': 'repeated', 'url': url,
+                           'detail': f"{method} requested {len(records)} times by one page"})
+
+    api_calls = [r for r in page if is_api_request(r, api_origins) and not r['failed']]
+    flagged = set()
+    for record in api_calls:
+        if record['url'] in flagged:
+            continue
+        records = _record_list(bodies.get(record['request_id']))
+        if records is not None and len(records) > OVERFETCH_RECORDS:
+            titles = [item.get('title') for item in records if isinstance(item, dict) and item.get('title')]
+            displayed = sum(1 for title in titles if title in page_text)
+            if titles and displayed < len(titles) * OVERFETCH_DISPLAYED_RATIO:
+                issues.append({'kind': 'overfetch', 'url': record['url'],
+                               'detail': f"{len(records)} records fetched ({format_bytes(record['size'])}), "
+                                         f"only {displayed} shown on the page"})
+                flagged.add(record['url'])
+                continue
+        if record['size'] > LARGE_API_RESPONSE_BYTES:
+            issues.append({'kind': 'large', 'url': record['url'],
+                           'detail': f"{format_bytes(record['size'])} API response"})
+            flagged.add(record['url'])
+
+    if len(api_calls) > 1:
+        ordered = sorted(api_calls, key=lambda r: r['start'])
+        overlapping = any(later['start'] < earlier['start'] + earlier['duration']
+                          for earlier, later in zip(ordered, ordered[1:]))
+        if not overlapping:
+            total = sum(r['duration'] for r in ordered)
+            issues.append({'kind': 'sequential', 'url': ordered[0]['url'],
+                           'detail': f"{len(ordered)} API calls ran one after another ({total:.0f}ms in total)"})
+    return issues
+
+
+class NetworkCaptureStore:
+    """Thread-safe waterfall + issues of the last visit to each page"""
+
+    def __init__(self, api_origins=()):
+        self.api_origins = tuple(api_origins)
+        self.pages = {}     # route -> {'requests': [...], 'issues': [...]}
+        self._lock = threading.Lock()
+
+    def _read_bodies(self, driver, page):
+        bodies = {}
+        for record in page:
+            if not is_api_request(record, self.api_origins) or 'json' not in (record['mime_type'] or ''):
+                continue
+            try:
+                body = driver.execute_cdp_cmd('Network.getResponseBody',
+                                              {'requestId': record['request_id']})
+                bodies[record['request_id']] = json.loads(body.get('body', ''))
+            except (WebDriverException, ValueError):
+                continue
+        return bodies
+
+    def capture(self, driver, route):
+        """Drain the performance log and store the current page's requests under route"""
+        try:
+            page = parse_performance_log(driver.get_log('performance'))
+        except WebDriverException as e:
+            print(f"   ⚠ Network capture unavailable for {route}: {e.msg}")
+            return None
+        try:
+            page_text = driver.find_element(By.TAG_NAME, "body").text
+        except WebDriverException:
+            page_text = ""
+        issues = find_issues(page, self.api_origins, self._read_bodies(driver, page), page_text)
+        for record in page:
+            record.pop('sent', None)
+            record.pop('finished', None)
+        with self._lock:
+            self.pages[route] = {'requests': page, 'issues': issues}
+        total = sum(r['size'] for r in page)
+        print(f"   🌐 {route}: {len(page)} requests, {format_bytes(total)} transferred"
+              + (f", {len(issues)} issue(s)" if issues else ""))
+        for issue in issues:
+            print(f"   ⚠ {issue['kind']}: {issue['url']} - {issue['detail']}")
+        return page
+
+    def save(self, path='selenium-network.json'):
+        with self._lock:
+            data = dict(self.pages)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        return path
+
+    def __bool__(self):
+        return bool(self.pages)
+
+
+def waterfall_html(page, api_origins=()):
+    """HTML table with one bar per request, positioned on the page's timeline"""
+    span = max((r['start'] + r['duration'] for r in page), default=0) or 1
+    rows = ""
+    for record in page:
+        left = record['start'] / span * 100
+        width = max(record['duration'] / span * 100, 0.5)
+        colour = '#764ba2' if is_api_request(record, api_origins) else '#667eea'
+        if record['failed']:
+            colour = '#eb3349'
+        label = record['url'] if len(record['url']) <= 70 else record['url'][:67] + "..."
+        rows += f"""
+                <tr>
+                    <td title="{html.escape(record['url'])}">{html.escape(label)}</td>
+                    <td>{record['type']}</td>
+                    <td>{html.escape(str(record['failed'] or record['status'] or '-'))}</td>
+                    <td>{format_bytes(record['size'])}</td>
+                    <td>{record['cache']}</td>
+                    <td title="{html.escape(record['initiator'])}">{html.escape(record['initiator'].split(':')[0])}</td>
+                    <td class="bar-cell"><div class="bar" style="margin-left: {left:.1f}%; width: {width:.1f}%; background: {colour};" title="{record['start']:.0f}ms + {record['duration']:.0f}ms"></div></td>
+                </tr>"""
+    return f"""
+            <table class="waterfall">
+                <tr><th>URL</th><th>Type</th><th>Status</th><th>Size</th><th>Cache</th><th>Initiator</th><th>Timeline (0 - {span:.0f}ms)</th></tr>{rows}
+            </table>"""
@@ -0,0 +1,177 @@
+"""
+Navigation Timing and Web Vitals for the Selenium Suite
+DevOps Lab - Section E
+
+Wall-clock time around driver.get() mixes network, server and rendering
+time together. This module reads the browser's own timings after a page
+has loaded:
+
+- TTFB:             navigation start -> first response byte
+- DOMContentLoaded: navigation start -> DOMContentLoaded handlers finished
+- Load:             navigation start -> load event finished
+- FCP:              first contentful paint
+- LCP:              largest contentful paint (latest candidate)
+- CLS:              cumulative layout shift (largest session window, as
+                    defined by web.dev)
+
+All times are milliseconds from navigation start. Samples are grouped by
+route, and the store keeps every sample so repeated visits can be
+summarized by their median.
+
+Author: DevOps Lab Project
+"""
+
+import json
+import statistics
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+
+METRICS = ('ttfb', 'dom_content_loaded', 'load', 'fcp', 'lcp', 'cls')
+METRIC_LABELS = {
+    'ttfb': 'TTFB',
+    'dom_content_loaded': 'DOMContentLoaded',
+    'load': 'Load',
+    'fcp': 'FCP',
+    'lcp': 'LCP',
+    'cls': 'CLS',
+}
+# web.dev "good" / "poor" thresholds (ms, CLS is unitless)
+VITAL_THRESHOLDS = {
+    'ttfb': (800, 1800),
+    'fcp': (1800, 3000),
+    'lcp': (2500, 4000),
+    'cls': (0.1, 0.25),
+}
+COLLECT_TIMEOUT_MS = 5000   # Longest the script waits for the load event
+
+# Async script: waits for the load event, then reads navigation and paint
+# entries. LCP and layout shifts are only exposed to observers, so buffered
+# PerformanceObservers replay the entries recorded since navigation start.
+COLLECT_METRICS_JS = """
+var done = arguments[arguments.length - 1];
+var timeoutMs = arguments[0];
+var lcp = null, cls = 0, windowValue = 0, windowStart = 0, lastShift = 0;
+var observers = [];
+
+function onLcp(entries) {
+    if (entries.length) {
+        var last = entries[entries.length - 1];
+        lcp = last.renderTime || last.loadTime || last.startTime;
+    }
+}
+function onShift(entries) {
+    entries.forEach(function (entry) {
+        if (entry.hadRecentInput) { return; }
+        if (windowValue && entry.startTime - lastShift < 1000 && entry.startTime - windowStart < 5000) {
+            windowValue += entry.value;
+        } else {
+            windowValue = entry.value;
+            windowStart = entry.startTime;
+        }
+        lastShift = entry.startTime;
+        cls = Math.max(cls, windowValue);
+    });
+}
+[['largest-contentful-paint', onLcp], ['layout-shift', onShift]].forEach(function (pair) {
+    try {
+        var observer = new PerformanceObserver(function (list) { pair[1](list.getEntries()); });
+        observer.observe({type: pair[0], buffered: true});
+        observers.push([observer, pair[1]]);
+    } catch (e) { /* entry type not supported */ }
+});
+
+var started = performance.now();
+(function poll() {
+    var nav = performance.getEntriesByType('navigation')[0];
+    if ((!nav || nav.loadEventEnd === 0) && performance.now() - started < timeoutMs) {
+        setTimeout(poll, 50);
+        return;
+    }
+    // Let the buffered observer callbacks run before reading the results
+    setTimeout(function () {
+        observers.forEach(function (pair) { pair[1](pair[0].takeRecords()); pair[0].disconnect(); });
+        var fcp = performance.getEntriesByName('first-contentful-paint')[0];
+        done({
+            ttfb: nav ? nav.responseStart : null,
+            dom_content_loaded: nav ? nav.domContentLoadedEventEnd : null,
+            load: nav && nav.loadEventEnd ? nav.loadEventEnd : null,
+            fcp: fcp ? fcp.startTime : null,
+            lcp: lcp,
+            cls: cls
+        });
+    }, 50);
+})();
+"""
+
+
+def collect_page_metrics(driver, timeout_ms=COLLECT_TIMEOUT_MS):
+    """Return the navigation and paint metrics of the page currently loaded"""
+    return driver.execute_async_script(COLLECT_METRICS_JS, timeout_ms)
+
+
+def rate_metric(metric, value):
+    """'good', 'needs-improvement', 'poor' or None when no threshold applies"""
+    if value is None or metric not in VITAL_THRESHOLDS:
+        return None
+    good, poor = VITAL_THRESHOLDS[metric]
+    if value <= good:
+        return 'good'
+    return 'needs-improvement' if value <= poor else 'poor'
+
+
+def format_metric(metric, value):
+    if value is None:
+        return "-"
+    return f"{value:.3f}" if metric == 'cls' else f"{value:.0f}ms"
+
+
+class PageMetricsStore:
+    """Thread-safe collection of per-route metric samples"""
+
+    def __init__(self):
+        self.samples = {}   # route -> [metrics dict, ...]
+        self._lock = threading.Lock()
+
+    def add(self, route, metrics):
+        with self._lock:
+            self.samples.setdefault(route, []).append(dict(metrics))
+
+    def capture(self, driver, route):
+        """Collect metrics from the driver's current page and file them under route"""
+        try:
+            metrics = collect_page_metrics(driver)
+        except WebDriverException as e:
+            print(f"   ⚠ Page metrics unavailable for {route}: {e.msg}")
+            return None
+        self.add(route, metrics)
+        print(f"   📐 {route}: " + ", ".join(
+            f"{METRIC_LABELS[m]} {format_metric(m, metrics.get(m))}" for m in METRICS))
+        return metrics
+
+    def summary(self):
+        """route -> {'samples': n, metric: median value}"""
+        with self._lock:
+            routes = {route: list(samples) for route, samples in self.samples.items()}
+        summary = {}
+        for route, samples in routes.items():
+            row = {'samples': len(samples)}
+            for metric in METRICS:
+                values = [s[metric] for s in samples if s.get(metric) is not None]
+                row[metric] = statistics.median(values) if values else None
+            summary[route] = row
+        return summary
+
+    def to_dict(self):
+        with self._lock:
+            samples = {route: list(items) for route, items in self.samples.items()}
+        return {'units': 'ms (cls unitless)', 'samples': samples, 'median': self.summary()}
+
+    def save(self, path='selenium-page-metrics.json'):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return path
+
+    def __bool__(self):
+        return bool(self.samples)
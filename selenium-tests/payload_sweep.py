@@ -0,0 +1,247 @@
+"""
+Response-Size Sweep for the University List Endpoints
+DevOps Lab - Section E
+
+/api/universities, /api/universities/ranking and /api/universities/top
+return full documents, and some have no limit:
+getUniversitiesByRanking returns the whole collection when no range is
+given. This sweep calls each list endpoint over a range of limit and
+filter values and splits every request into:
+
+- TTFB:     request sent -> response headers received (server + network)
+- server:   the backend's own time, when it sends a Server-Timing header
+            (stub_server.py does)
+- transfer: headers -> last body byte
+- decode:   json.loads() of the body on the client
+
+It records payload bytes (decoded and on the wire) and bytes per record,
+then fits latency against payload size and record count, giving the
+cost of each extra record per endpoint.
+
+Usage:
+    python payload_sweep.py --backend-url http://localhost:5000 --repeats 5
+
+Author: DevOps Lab Project
+"""
+
+import argparse
+import json
+import time
+
+import requests
+
+from http_client import PooledHttpClient
+from perf_report import (format_bytes, format_ms, linear_fit, median, print_section, server_time, svg_chart,
+                         write_html_report, write_text_report)
+from test_university_app import BACKEND_URL
+
+
+DEFAULT_REPEATS = 5                                    # Requests per point; medians are reported
+RANK_LIMITS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)  # maxRank values for /ranking
+SEARCH_LIMITS = (1, 5, 10, 25, 50, 100, 250, 0)        # ?limit= values (0 = no limit)
+FILTER_VALUES = 4                                      # Values per filter, spread over the sizes
+SEARCH_QUERY = "a"                                     # Matches almost every record
+
+
+def build_sweep(stats):
+    """
+    (endpoint, label, path, params) for every point, using the counts in
+    /api/universities/stats to pick filter values from small to large.
+    """
+    points = [('/api/universities', "no filter", '/api/universities', {})]
+    for field, counts in (('province', stats['provinces']), ('city', stats['cities']),
+                          ('discipline', stats['disciplines'])):
+        values = sorted((v for v in counts if v), key=lambda v: counts[v])
+        step = max(1, len(values) // FILTER_VALUES)
+        for value in values[::step][:FILTER_VALUES - 1] + values[-1:]:
+            points.append(('/api/universities', f"{field}={value}", '/api/universities', {field: value}))
+    points += [('/api/universities/ranking', f"maxRank={limit}", '/api/universities/ranking',
+                {'minRank': 1, 'maxRank': limit}) for limit in RANK_LIMITS]
+    points.append(('/api/universities/ranking', "no range", '/api/universities/ranking', {}))
+    points.append(('/api/universities/top', "top 5", '/api/universities/top', {}))
+    points += [('/api/universities/search', f"limit={limit}", '/api/universities/search',
+                {'query': SEARCH_QUERY, 'limit': limit}) for limit in SEARCH_LIMITS]
+    return list({(p[0], p[1]): p for p in points}.values())
+
+
+class SweepPoint:
+    """Median timings and sizes of one endpoint + parameter combination"""
+
+    def __init__(self, endpoint, label):
+        self.endpoint = endpoint
+        self.label = label
+        self.samples = []
+        self.records = None
+        self.bytes = None
+        self.wire_bytes = None
+        self.status = None
+        self.errors = 0
+        self.last_error = None
+
+    def add(self, ttfb, server, transfer, decode):
+        self.samples.append({'ttfb': ttfb, 'server': server, 'transfer': transfer, 'decode': decode,
+                             'total': ttfb + transfer + decode})
+
+    def median(self, key):
+        return median(s[key] for s in self.samples)
+
+    @property
+    def bytes_per_record(self):
+        return self.bytes / self.records if self.records else None
+
+
+def measure_point(client, backend_url, endpoint, label, path, params, repeats):
+    point = SweepPoint(endpoint, label)
+    for attempt in range(repeats + 1):
+        start = time.perf_counter()
+        try:
+            with client.get(f"{backend_url}{path}", params=params, stream=True) as response:
+                ttfb = time.perf_counter() - start
+                content = response.content
+                transfer = time.perf_counter() - start - ttfb
+                wire_bytes = response.raw.tell()
+                decode_start = time.perf_counter()
+                payload = json.loads(content) if response.ok else None
+                decode = time.perf_counter() - decode_start
+        except (requests.RequestException, ValueError) as e:
+            # One failed request should not cost the points already measured
+            if attempt:
+                point.errors += 1
+                point.last_error = type(e).__name__
+            continue
+        if attempt == 0:
+            continue    # Warm-up
+        point.add(ttfb, server_time(response.headers), transfer, decode)
+        point.status = response.status_code
+        point.bytes, point.wire_bytes = len(content), wire_bytes
+        if isinstance(payload, dict):
+            point.records = payload.get('count', len(payload.get('data') or []))
+    return point
+
+
+def run_sweep(client, backend_url, repeats=DEFAULT_REPEATS):
+    stats = client.get(f"{backend_url}/api/universities/stats").json()
+    points = []
+    for endpoint, label, path, params in build_sweep(stats):
+        point = measure_point(client, backend_url, endpoint, label, path, params, repeats)
+        points.append(point)
+        print(f"   {endpoint:<26} {label[:30]:<30} {point.records or 0:>6} records "
+              f"{format_bytes(point.bytes):>9}  {format_ms(point.median('total'))}")
+    return points
+
+
+def fit_costs(points):
+    """
+    Per endpoint (plus "all"): fits of total latency vs. KB and vs.
+    records, and of transfer and decode time vs. KB.
+    """
+    groups = {}
+    for point in points:
+        if point.status == 200 and point.records is not None:
+            groups.setdefault(point.endpoint, []).append(point)
+    groups['all'] = [p for group in list(groups.values()) for p in group]
+    fits = {}
+    for endpoint, group in groups.items():
+        kb = [(p.bytes / 1024, p.median('total') * 1000) for p in group]
+        fits[endpoint] = {
+            'points': len(group),
+            'per_kb': linear_fit(kb),
+            'per_record': linear_fit([(p.records, p.median('total') * 1000) for p in group]),
+            'transfer_per_kb': linear_fit([(p.bytes / 1024, p.median('transfer') * 1000) for p in group]),
+            'decode_per_kb': linear_fit([(p.bytes / 1024, p.median('decode') * 1000) for p in group]),
+            'bytes_per_record': (sum(p.bytes for p in group) / sum(p.records for p in group)
+                                 if sum(p.records for p in group) else None),
+        }
+    return fits
+
+
+def _slope(fit, unit):
+    return f"{fit[1]:.3f}ms/{unit} (r={fit[2]:.2f})" if fit else "N/A"
+
+
+def build_sections(points, fits):
+    has_server = any(p.median('server') is not None for p in points)
+    headers = ["Endpoint", "Parameters", "Records", "Payload", "On Wire", "Bytes/Record", "TTFB"] + \
+              (["Server"] if has_server else []) + ["Transfer", "Decode", "Total", "Errors"]
+    rows = []
+    for p in points:
+        row = [p.endpoint, p.label, p.records if p.records is not None else (p.status or p.last_error),
+               format_bytes(p.bytes),
+               format_bytes(p.wire_bytes),
+               f"{p.bytes_per_record:.0f}B" if p.bytes_per_record else "N/A", format_ms(p.median('ttfb'))]
+        if has_server:
+            row.append(format_ms(p.median('server')))
+        rows.append(row + [format_ms(p.median('transfer')), format_ms(p.median('decode')),
+                           format_ms(p.median('total')), f"{p.errors} ({p.last_error})" if p.errors else 0])
+    notes = [] if has_server else ["No Server-Timing header: TTFB includes both server time and network latency"]
+    failed = sum(p.errors for p in points)
+    if failed:
+        notes.append(f"❌ {failed} requests failed (connection error, timeout or invalid JSON) and were left out")
+    sections = [{'title': "Sweep Results", 'headers': headers, 'rows': rows, 'notes': notes}]
+
+    rows = []
+    for endpoint, fit in fits.items():
+        fixed = f"{fit['per_record'][0]:.1f}ms" if fit['per_record'] else "N/A"
+        rows.append([endpoint, fit['points'], fixed, _slope(fit['per_record'], "record"),
+                     _slope(fit['per_kb'], "KB"), _slope(fit['transfer_per_kb'], "KB"),
+                     _slope(fit['decode_per_kb'], "KB"),
+                     f"{fit['bytes_per_record']:.0f}B" if fit['bytes_per_record'] else "N/A"])
+    notes = []
+    overall = fits.get('all', {})
+    if overall.get('per_record') and overall.get('bytes_per_record'):
+        notes.append(f"Each extra record costs about {overall['per_record'][1]:.3f}ms and "
+                     f"{format_bytes(overall['bytes_per_record'])} on top of a fixed "
+                     f"{overall['per_record'][0]:.1f}ms per request")
+    largest = max((p for p in points if p.bytes), key=lambda p: p.bytes, default=None)
+    if largest:
+        notes.append(f"Largest response: {largest.endpoint} ({largest.label}) - {largest.records} records, "
+                     f"{format_bytes(largest.bytes)} in {format_ms(largest.median('total'))}")
+    series = []
+    for endpoint in fits:
+        group = [p for p in points if p.endpoint == endpoint and p.status == 200]
+        if endpoint != 'all' and group:
+            series.append({'name': endpoint, 'points': [(p.bytes / 1024, p.median('total') * 1000) for p in group]})
+    if overall.get('per_kb'):
+        intercept, slope, _ = overall['per_kb']
+        xs = [x for s in series for x, _ in s['points']]
+        series.append({'name': "fit (all)", 'line': True, 'colour': '#333',
+                       'points': [(0, intercept), (max(xs), intercept + slope * max(xs))]})
+    sections.append({'title': "Cost per Record",
+                     'headers': ["Endpoint", "Points", "Fixed Cost", "Per Record", "Total per KB",
+                                 "Transfer per KB", "Decode per KB", "Bytes/Record"],
+                     'rows': rows, 'notes': notes,
+                     'html': svg_chart(series, "payload (KB)", "total latency (ms)")})
+    return sections
+
+
+def generate_reports(points, meta, basename="payload-sweep-report"):
+    fits = fit_costs(points)
+    sections = build_sections(points, fits)
+    for section in sections:
+        print_section(section)
+    overall = fits.get('all', {})
+    cards = [
+        ("Points", len(points)),
+        ("Largest Payload", format_bytes(max((p.bytes or 0 for p in points), default=0))),
+        ("Per Record", f"{overall['per_record'][1]:.3f}ms" if overall.get('per_record') else "N/A"),
+        ("Bytes/Record", format_bytes(overall.get('bytes_per_record'))),
+    ]
+    write_text_report(f"{basename}.txt", "Payload Sweep Report", meta, sections)
+    write_html_report(f"{basename}.html", "Payload Sweep Report",
+                      "University Finder API - Response Size vs. Latency", meta, cards, sections)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Response-size and limit sweep for the list endpoints")
+    parser.add_argument("--backend-url", default=BACKEND_URL)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="timed requests per point")
+    args = parser.parse_args()
+    backend_url = args.backend_url.rstrip('/')
+
+    print("=" * 70)
+    print("📦 RESPONSE-SIZE SWEEP")
+    print("=" * 70)
+    print(f"📍 Backend URL: {backend_url}\n")
+    with PooledHttpClient(timeout=60) as client:
+        sweep = run_sweep(client, backend_url, max(1, args.repeats))
+    generate_reports(sweep, [("Backend URL", backend_url), ("Repeats", args.repeats)])
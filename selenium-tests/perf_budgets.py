@@ -0,0 +1,145 @@
+"""
+Performance Budgets for the University Finder Test Harness
+DevOps Lab - Section E
+
+Loads the declarative limits in performance-budgets.json and checks
+measured results against them:
+
+- endpoints: backend API paths, checked by test_university_app.py
+- routes:    frontend routes, checked by test_extended.py (latency is the
+             Navigation Timing "load" time, size is the bytes the page
+             transferred, errors are failed or 4xx/5xx requests)
+
+Each target may set any of p50_ms, p95_ms, p99_ms, max_bytes and
+error_rate (0.0 - 1.0). A budget with no measurement is reported but
+never counts as a violation.
+
+Author: DevOps Lab Project
+"""
+
+import json
+import os
+
+from latency_histogram import LatencyHistogram
+from perf_report import format_bytes
+
+
+DEFAULT_BUDGETS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    'performance-budgets.json')
+
+PERCENTILE_KEYS = (('p50_ms', 50), ('p95_ms', 95), ('p99_ms', 99))
+
+
+def load_budgets(path=DEFAULT_BUDGETS_PATH):
+    """Read a budgets file; returns None (with a warning) when it does not exist"""
+    if not path or not os.path.exists(path):
+        if path:
+            print(f"⚠ Budgets file not found: {path} (budgets not checked)")
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        budgets = json.load(f)
+    for section in ('endpoints', 'routes'):
+        if not isinstance(budgets.get(section, {}), dict):
+            raise ValueError(f"'{section}' in {path} must map targets to limits")
+    return budgets
+
+
+class BudgetMeasurement:
+    """Latency samples, largest payload and error count for one target"""
+
+    def __init__(self):
+        self.histogram = LatencyHistogram()
+        self.max_bytes = None
+        self.errors = 0
+        self.count = 0
+
+    def add(self, latency=None, size=None, ok=True):
+        if latency is not None:
+            self.histogram.record(latency)
+        if size is not None:
+            self.max_bytes = size if self.max_bytes is None else max(self.max_bytes, size)
+        self.errors += 0 if ok else 1
+        self.count += 1
+
+    @property
+    def error_rate(self):
+        return self.errors / self.count if self.count else None
+
+
+def _check(target, metric, measured, budget, formatter):
+    return {
+        'target': target,
+        'metric': metric,
+        'measured': measured,
+        'budget': budget,
+        'measured_text': "no data" if measured is None else formatter(measured),
+        'budget_text': formatter(budget),
+        'ok': measured is None or measured <= budget,
+    }
+
+
+def evaluate_budgets(limits, measurements):
+    """
+    Compare measurements (target -> BudgetMeasurement) against limits
+    (target -> {p50_ms, p95_ms, p99_ms, max_bytes, error_rate}).
+
+    Returns one check dict per configured limit, in budgets-file order.
+    """
+    checks = []
+    for target, limit in limits.items():
+        measurement = measurements.get(target)
+        for key, pct in PERCENTILE_KEYS:
+            if key in limit:
+                value = None
+                if measurement is not None and measurement.histogram.count:
+                    value = measurement.histogram.value_at_percentile(pct) * 1000
+                checks.append(_check(target, f"p{pct}", value, limit[key], lambda v: f"{v:.0f}ms"))
+        if 'max_bytes' in limit:
+            value = measurement.max_bytes if measurement is not None else None
+            checks.append(_check(target, "payload", value, limit['max_bytes'], format_bytes))
+        if 'error_rate' in limit:
+            value = measurement.error_rate if measurement is not None else None
+            checks.append(_check(target, "error rate", value, limit['error_rate'], lambda v: f"{v * 100:.1f}%"))
+    return checks
+
+
+def budget_violations(checks):
+    return [check for check in checks if not check['ok']]
+
+
+def budget_rows(checks):
+    """Table rows: target, metric, measured, budget, verdict"""
+    return [[check['target'], check['metric'], check['measured_text'], check['budget_text'],
+             "N/A" if check['measured'] is None else "PASS" if check['ok'] else "FAIL"]
+            for check in checks]
+
+
+BUDGET_HEADERS = ["Target", "Metric", "Measured", "Budget", "Verdict"]
+
+
+def budget_table_html(checks, table_class):
+    """HTML table of measured vs. budget values, failures highlighted"""
+    rows = ""
+    for target, metric, measured, budget, verdict in budget_rows(checks):
+        colour = {"PASS": "#11998e", "FAIL": "#eb3349"}.get(verdict, "#999")
+        rows += (f"                <tr><td>{target}</td><td>{metric}</td><td>{measured}</td>"
+                 f"<td>{budget}</td><td style=\"color: {colour}; font-weight: bold;\">{verdict}</td></tr>\n")
+    header = "".join(f"<th>{h}</th>" for h in BUDGET_HEADERS)
+    return f"""            <table class="{table_class}">
+                <tr>{header}</tr>
+{rows}            </table>"""
+
+
+def print_budget_results(checks):
+    violations = budget_violations(checks)
+    print("\n" + "=" * 70)
+    print("PERFORMANCE BUDGETS")
+    print("=" * 70)
+    for target, metric, measured, budget, verdict in budget_rows(checks):
+        icon = {"PASS": "✅", "FAIL": "❌"}.get(verdict, "➖")
+        print(f"{icon} {target} {metric}: {measured} (budget {budget})")
+    if violations:
+        print(f"\n❌ {len(violations)} budget violation(s)")
+    else:
+        print(f"\n✅ No budget exceeded ({len(checks)} checks)")
+    return not violations
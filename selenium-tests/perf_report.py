@@ -0,0 +1,319 @@
+"""
+Performance Report Helpers
+DevOps Lab - Section E
+
+Shared console, text and HTML output for the performance modes of the
+test harness (load generation, benchmarks, probes). The HTML output uses
+the same gradient style as test-report.html.
+
+A report is described by:
+- meta:     list of (label, value) pairs shown in the header / footer
+- cards:    list of (label, value) summary stat cards (HTML only)
+- sections: list of dicts with 'title', optional 'headers' + 'rows' for a
+            table, optional 'notes' (list of strings) and optional 'html'
+            (pre-rendered markup such as an svg_chart(), HTML only)
+
+It also holds the small statistics helpers the benchmarks share
+(median, linear_fit, server_time).
+
+Author: DevOps Lab Project
+"""
+
+import html
+import re
+from datetime import datetime
+
+
+def format_ms(seconds):
+    """Format a duration in seconds as milliseconds"""
+    if seconds is None:
+        return "N/A"
+    return f"{seconds * 1000:.1f}ms"
+
+
+def format_bytes(num_bytes):
+    """Human readable byte count"""
+    if num_bytes is None:
+        return "N/A"
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(num_bytes) < 1024 or unit == "GB":
+            return f"{num_bytes:.0f}{unit}" if unit == "B" else f"{num_bytes:.1f}{unit}"
+        num_bytes /= 1024
+
+
+def median(values):
+    """Median of the values that are not None, or None"""
+    values = sorted(v for v in values if v is not None)
+    return values[len(values) // 2] if values else None
+
+
+def linear_fit(points):
+    """Least-squares y = a + b*x; returns (a, b, r) or None"""
+    if len(points) < 3:
+        return None
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    sxx = sum((x - mean_x) ** 2 for x, _ in points)
+    syy = sum((y - mean_y) ** 2 for _, y in points)
+    sxy = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    if sxx == 0:
+        return None
+    slope = sxy / sxx
+    r = sxy / (sxx * syy) ** 0.5 if syy else 0.0
+    return mean_y - slope * mean_x, slope, r
+
+
+def server_time(headers):
+    """Total of the Server-Timing durations in seconds, or None without the header"""
+    durations = re.findall(r"dur=([\d.]+)", headers.get('Server-Timing') or '')
+    return sum(float(d) for d in durations) / 1000 if durations else None
+
+
+def format_table(headers, rows):
+    """Render a plain-text table as a list of lines"""
+    cells = [[str(c) for c in headers]] + [[str(c) for c in row] for row in rows]
+    widths = [max(len(row[i]) for row in cells) for i in range(len(headers))]
+    lines = ["  ".join(c.ljust(w) for c, w in zip(cells[0], widths))]
+    lines.append("  ".join("-" * w for w in widths))
+    for row in cells[1:]:
+        lines.append("  ".join(c.ljust(w) for c, w in zip(row, widths)))
+    return lines
+
+
+def print_section(section):
+    """Print one report section to the console"""
+    print("\n" + "=" * 70)
+    print(section['title'].upper())
+    print("=" * 70)
+    if section.get('headers'):
+        for line in format_table(section['headers'], section.get('rows', [])):
+            print(line)
+    for note in section.get('notes', []):
+        print(f"📝 {note}")
+
+
+def write_text_report(path, title, meta, sections):
+    """Write a plain-text report in the same layout as test-report.txt"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("=" * 70 + "\n")
+        f.write(f"{title.upper()}\n")
+        f.write("University Finder Application - DevOps Lab Section E\n")
+        f.write("=" * 70 + "\n\n")
+        f.write(f"Report Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        for label, value in meta:
+            f.write(f"{label}: {value}\n")
+        f.write("\n")
+
+        for section in sections:
+            f.write("=" * 70 + "\n")
+            f.write(f"{section['title'].upper()}\n")
+            f.write("=" * 70 + "\n\n")
+            if section.get('headers'):
+                for line in format_table(section['headers'], section.get('rows', [])):
+                    f.write(line + "\n")
+                f.write("\n")
+            for note in section.get('notes', []):
+                f.write(f"{note}\n")
+            if section.get('notes'):
+                f.write("\n")
+
+    print(f"📄 Text report saved to: {path}")
+
+
+HTML_STYLE = """
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            min-height: 100vh;
+            padding: 20px;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 20px;
+            box-shadow: 0 20px 60px rgba(0,0,0,0.3);
+            overflow: hidden;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 40px;
+            text-align: center;
+        }
+        .header h1 { font-size: 2.5em; margin-bottom: 10px; }
+        .summary {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            padding: 40px;
+            background: linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%);
+        }
+        .stat-card {
+            background: white;
+            padding: 25px;
+            border-radius: 15px;
+            text-align: center;
+            box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+        }
+        .stat-card h3 {
+            color: #666;
+            font-size: 0.9em;
+            margin-bottom: 10px;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+        }
+        .stat-card .value {
+            font-size: 2em;
+            font-weight: bold;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            -webkit-background-clip: text;
+            -webkit-text-fill-color: transparent;
+        }
+        .section { padding: 30px 40px; }
+        .section h2 { margin-bottom: 20px; color: #764ba2; }
+        table { width: 100%; border-collapse: collapse; margin-bottom: 15px; }
+        th {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 10px;
+            text-align: left;
+        }
+        td { padding: 8px 10px; border-bottom: 1px solid #eee; }
+        tr:nth-child(even) td { background: #f8f9fc; }
+        td.fail { color: #eb3349; font-weight: bold; }
+        td.pass { color: #11998e; font-weight: bold; }
+        .note { color: #666; margin: 6px 0; }
+        .footer {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            text-align: center;
+        }
+"""
+
+
+CHART_COLOURS = ('#667eea', '#eb3349', '#11998e', '#f5a623', '#764ba2')
+
+
+def svg_chart(series, x_label, y_label, width=800, height=320):
+    """
+    Inline SVG chart. series is a list of dicts with 'name', 'points'
+    ([(x, y), ...]) and optional 'line' (True joins the points, e.g. a
+    fitted curve) and 'colour'.
+    """
+    points = [p for s in series for p in s['points']]
+    if not points:
+        return ""
+    pad_left, pad_right, pad_top, pad_bottom = 60, 20, 20, 45
+    x_min, x_max = min(p[0] for p in points), max(p[0] for p in points)
+    y_min, y_max = min(0, min(p[1] for p in points)), max(p[1] for p in points)
+    x_span, y_span = (x_max - x_min) or 1, (y_max - y_min) or 1
+    plot_w, plot_h = width - pad_left - pad_right, height - pad_top - pad_bottom
+
+    def sx(x):
+        return pad_left + (x - x_min) / x_span * plot_w
+
+    def sy(y):
+        return pad_top + plot_h - (y - y_min) / y_span * plot_h
+
+    parts = [f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}" '
+             f'xmlns="http://www.w3.org/2000/svg" font-family="Segoe UI, sans-serif" font-size="11">',
+             f'<line x1="{pad_left}" y1="{pad_top + plot_h}" x2="{width - pad_right}" y2="{pad_top + plot_h}" stroke="#999"/>',
+             f'<line x1="{pad_left}" y1="{pad_top}" x2="{pad_left}" y2="{pad_top + plot_h}" stroke="#999"/>']
+    for i in range(5):
+        y = y_min + y_span * i / 4
+        x = x_min + x_span * i / 4
+        parts.append(f'<text x="{pad_left - 5}" y="{sy(y) + 4:.1f}" text-anchor="end" fill="#666">{y:.4g}</text>')
+        parts.append(f'<text x="{sx(x):.1f}" y="{pad_top + plot_h + 15}" text-anchor="middle" fill="#666">{x:.4g}</text>')
+    parts.append(f'<text x="{pad_left + plot_w / 2:.0f}" y="{height - 8}" text-anchor="middle" fill="#333">'
+                 f'{html.escape(x_label)}</text>')
+    parts.append(f'<text x="14" y="{pad_top + plot_h / 2:.0f}" text-anchor="middle" fill="#333" '
+                 f'transform="rotate(-90 14 {pad_top + plot_h / 2:.0f})">{html.escape(y_label)}</text>')
+
+    for index, s in enumerate(series):
+        colour = s.get('colour') or CHART_COLOURS[index % len(CHART_COLOURS)]
+        if s.get('line'):
+            path = " ".join(f"{sx(x):.1f},{sy(y):.1f}" for x, y in sorted(s['points']))
+            parts.append(f'<polyline points="{path}" fill="none" stroke="{colour}" stroke-width="2"/>')
+        else:
+            parts.extend(f'<circle cx="{sx(x):.1f}" cy="{sy(y):.1f}" r="3" fill="{colour}" fill-opacity="0.7"/>'
+                         for x, y in s['points'])
+        parts.append(f'<rect x="{pad_left + 10}" y="{pad_top + index * 16}" width="10" height="10" fill="{colour}"/>')
+        parts.append(f'<text x="{pad_left + 25}" y="{pad_top + index * 16 + 9}" fill="#333">'
+                     f'{html.escape(s["name"])}</text>')
+    parts.append('</svg>')
+    return "            " + "\n            ".join(parts)
+
+
+def _html_cell(value):
+    """Escape a table cell, colouring PASS/FAIL style verdicts"""
+    text = str(value)
+    css = ""
+    if text.startswith(("FAIL", "❌", "REGRESSION")):
+        css = ' class="fail"'
+    elif text.startswith(("PASS", "✅", "OK")):
+        css = ' class="pass"'
+    return f"<td{css}>{html.escape(text)}</td>"
+
+
+def render_html_section(section):
+    """Render one section as HTML"""
+    parts = [f'        <div class="section">\n            <h2>{html.escape(section["title"])}</h2>\n']
+    if section.get('headers'):
+        parts.append("            <table>\n                <tr>")
+        parts.extend(f"<th>{html.escape(str(h))}</th>" for h in section['headers'])
+        parts.append("</tr>\n")
+        for row in section.get('rows', []):
+            parts.append("                <tr>" + "".join(_html_cell(c) for c in row) + "</tr>\n")
+        parts.append("            </table>\n")
+    if section.get('html'):
+        parts.append(section['html'] + "\n")
+    for note in section.get('notes', []):
+        parts.append(f'            <p class="note">📝 {html.escape(note)}</p>\n')
+    parts.append("        </div>\n")
+    return "".join(parts)
+
+
+def write_html_report(path, title, subtitle, meta, cards, sections):
+    """Write an HTML report in the same style as test-report.html"""
+    cards_html = "".join(
+        f"""            <div class="stat-card">
+                <h3>{html.escape(str(label))}</h3>
+                <div class="value">{html.escape(str(value))}</div>
+            </div>
+""" for label, value in cards)
+    meta_html = "".join(f"            <p>{html.escape(str(label))}: {html.escape(str(value))}</p>\n"
+                        for label, value in meta)
+
+    html_content = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{html.escape(title)} - University Finder</title>
+    <style>{HTML_STYLE}    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>📈 {html.escape(title)}</h1>
+            <p>{html.escape(subtitle)}</p>
+        </div>
+        <div class="summary">
+{cards_html}        </div>
+{"".join(render_html_section(s) for s in sections)}
+        <div class="footer">
+            <p><strong>Execution Details</strong></p>
+            <p>Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+{meta_html}        </div>
+    </div>
+</body>
+</html>
+"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(html_content)
+
+    print(f"📄 HTML report saved to: {path}")
@@ -0,0 +1,315 @@
+"""
+Pathological-Input Latency Detector for the Regex-Backed Endpoints
+DevOps Lab - Section E
+
+searchUniversitiesByName, getUniversitiesByDiscipline and the ?search=
+filter of getAllUniversities pass user input straight into
+new RegExp(...), which MongoDB then runs against every record. A crafted
+pattern can cost far more server time than a normal query.
+
+This fuzzer first times normal queries on each endpoint to get a
+baseline, then sends adversarial patterns from several families:
+
+- nested quantifiers / overlapping groups (catastrophic backtracking)
+- wildcard chains such as .*.*.*~ (polynomial backtracking)
+- long alternations and very long inputs
+- single regex metacharacters (invalid patterns -> server errors)
+
+Most families grow with a size n. Each family is escalated one size at a
+time and stops at the first input that is out of proportion (latency
+above RATIO x baseline and at least MIN_EXTRA_MS slower), so the server
+is never pushed far past that point. A binary search between the last
+normal size and the first flagged one then gives the minimal
+reproducing input. After every flagged input the fuzzer waits until a
+normal query is fast again, so a server still busy with one input does
+not make the next inputs look slow; if it never recovers the run stops.
+Run it against your own deployment or stub_server.py only.
+
+Usage:
+    python regex_fuzzer.py --backend-url http://localhost:5000 --targets search discipline
+
+Author: DevOps Lab Project
+"""
+
+import argparse
+import sys
+import time
+from urllib.parse import quote
+
+import requests
+
+from http_client import PooledHttpClient
+from perf_report import format_ms, print_section, write_html_report, write_text_report
+from test_university_app import BACKEND_URL
+
+
+DEFAULT_REPEATS = 3          # Requests per input; the median is used
+DEFAULT_RATIO = 5.0          # Flag inputs slower than 5x the baseline median...
+DEFAULT_MIN_EXTRA_MS = 50    # ...and at least 50ms slower than it
+DEFAULT_TIMEOUT = 10         # Seconds; a timed-out input is always flagged
+RECOVERY_TIMEOUT = 60        # Seconds to wait for normal latency after a flagged input
+MAX_REPR = 60                # Characters of an input shown in reports
+
+# Endpoints whose input reaches new RegExp(); url builds the request path
+TARGETS = {
+    'search': {
+        'url': lambda pattern: f"/api/universities/search?query={quote(pattern, safe='')}",
+        'baseline': ("NUST", "Lahore", "Computer"),
+    },
+    'discipline': {
+        'url': lambda pattern: f"/api/universities/discipline/{quote(pattern, safe='')}",
+        'baseline': ("Computer Science", "Medical", "Engineering"),
+    },
+    'universities': {
+        'url': lambda pattern: f"/api/universities?search={quote(pattern, safe='')}",
+        'baseline': ("NUST", "Lahore"),
+    },
+}
+
+# (family, description, build(n), sizes) - sizes are tried in order
+FAMILIES = [
+    ('nested_quantifier', "(.*a){n}: each group can end at any 'a'",
+     lambda n: "(.*a){%d}~" % n, range(1, 13)),
+    ('wildcard_chain', ".* repeated n times before a character that never matches",
+     lambda n: ".*" * n + "~", range(1, 13)),
+    ('overlapping_group', "^(\\w+\\s?)*$ fails on titles with punctuation",
+     lambda n: "^(\\w+\\s?)*$", (1,)),
+    ('overlapping_group', "(x+x+)+y with an x+ repeated n times",
+     lambda n: "(" + "\\w+" * n + ")+~", range(2, 9)),
+    ('alternation', "n-way alternation of strings that never match",
+     lambda n: "|".join(f"zq{i}x" for i in range(n)), (10, 100, 250, 500, 1000)),
+    ('long_input', "n literal characters",
+     lambda n: "a" * n, (100, 1000, 2000, 4000, 8000)),
+    ('long_input', "n optional characters followed by n literal ones (a?^n a^n)",
+     lambda n: "a?" * n + "a" * n, range(4, 33, 4)),
+]
+METACHARACTERS = ".*+?()[]{}|\\^$"
+
+
+def _short(pattern):
+    text = repr(pattern)
+    return text if len(text) <= MAX_REPR else text[:MAX_REPR - 3] + "..."
+
+
+class ServerNotRecovered(RuntimeError):
+    """A normal query stayed slow for RECOVERY_TIMEOUT after a flagged input"""
+
+
+class Probe:
+    """Median latency and status of one input against one target"""
+
+    def __init__(self, target, family, description, pattern, size, latencies, statuses):
+        self.target = target
+        self.family = family
+        self.description = description
+        self.pattern = pattern
+        self.size = size
+        self.latencies = latencies
+        self.statuses = statuses
+        self.latency = sorted(latencies)[len(latencies) // 2]
+        self.ratio = None
+        self.flagged = False
+
+    @property
+    def status(self):
+        return self.statuses[-1]
+
+    @property
+    def failed(self):
+        return any(status == 'timeout' or (isinstance(status, int) and status >= 500)
+                   for status in self.statuses)
+
+
+class RegexFuzzer:
+    def __init__(self, client, backend_url=BACKEND_URL, repeats=DEFAULT_REPEATS, ratio=DEFAULT_RATIO,
+                 min_extra_ms=DEFAULT_MIN_EXTRA_MS, timeout=DEFAULT_TIMEOUT):
+        self.client = client
+        self.backend_url = backend_url.rstrip('/')
+        self.repeats = repeats
+        self.ratio = ratio
+        self.min_extra = min_extra_ms / 1000
+        self.timeout = timeout
+        self.baselines = {}
+        self.probes = []
+        self.findings = []
+        self.aborted = None
+
+    def _measure(self, target, pattern):
+        latencies, statuses = [], []
+        url = self.backend_url + TARGETS[target]['url'](pattern)
+        for _ in range(self.repeats):
+            start = time.perf_counter()
+            try:
+                response = self.client.get(url, timeout=self.timeout)
+                response.content
+                statuses.append(response.status_code)
+            except requests.Timeout:
+                statuses.append('timeout')
+            except requests.RequestException as e:
+                statuses.append(type(e).__name__)
+            latencies.append(time.perf_counter() - start)
+            if statuses[-1] == 'timeout':
+                break    # Do not keep hammering a server that is already stuck
+        return latencies, statuses
+
+    def measure_baseline(self, target):
+        latencies = []
+        for query in TARGETS[target]['baseline']:
+            self._measure(target, query)    # warm-up
+            latencies += self._measure(target, query)[0]
+        self.baselines[target] = sorted(latencies)[len(latencies) // 2]
+        return self.baselines[target]
+
+    def threshold(self, target):
+        baseline = self.baselines[target]
+        return max(baseline * self.ratio, baseline + self.min_extra)
+
+    def wait_for_recovery(self, target, after):
+        """Block until a normal query is back under the threshold"""
+        query = TARGETS[target]['baseline'][0]
+        deadline = time.time() + RECOVERY_TIMEOUT
+        while time.time() < deadline:
+            latencies, statuses = self._measure(target, query)
+            if statuses[-1] == 200 and min(latencies) <= self.threshold(target):
+                return
+            time.sleep(1)
+        raise ServerNotRecovered(f"{target} still slow {RECOVERY_TIMEOUT}s after {_short(after.pattern)} "
+                                 f"({after.family}, n={after.size}); remaining inputs skipped")
+
+    def probe(self, target, family, description, pattern, size):
+        result = Probe(target, family, description, pattern, size, *self._measure(target, pattern))
+        result.ratio = result.latency / self.baselines[target] if self.baselines[target] else None
+        result.flagged = result.latency > self.threshold(target) or 'timeout' in result.statuses
+        self.probes.append(result)
+        icon = "🔥" if result.flagged else "⚠" if result.failed else "✅"
+        print(f"   {icon} {target:<12} {family:<18} n={size:<5} {format_ms(result.latency):>10} "
+              f"({result.ratio or 0:.1f}x) {result.status}  {_short(pattern)}")
+        if result.flagged:
+            self.wait_for_recovery(target, result)
+        return result
+
+    def minimise(self, target, family, description, build, low, high, flagged):
+        """Binary search the smallest size in (low, high] that is still flagged"""
+        best = flagged
+        while high - low > 1:
+            middle = (low + high) // 2
+            result = self.probe(target, family, description, build(middle), middle)
+            if result.flagged:
+                high, best = middle, result
+            else:
+                low = middle
+        return best
+
+    def fuzz_family(self, target, family, description, build, sizes):
+        previous = None
+        for size in sizes:
+            result = self.probe(target, family, description, build(size), size)
+            if result.flagged:
+                if previous is not None and size - previous > 1:
+                    result = self.minimise(target, family, description, build, previous, size, result)
+                self.findings.append(result)
+                return result
+            previous = size
+        return None
+
+    def run(self, targets):
+        try:
+            for target in targets:
+                baseline = self.measure_baseline(target)
+                print(f"\n🎯 {target}: baseline p50 {format_ms(baseline)}, "
+                      f"flag above {format_ms(self.threshold(target))}")
+                for family, description, build, sizes in FAMILIES:
+                    self.fuzz_family(target, family, description, build, sizes)
+                for char in METACHARACTERS:
+                    self.fuzz_family(target, 'metacharacter', "a lone regex metacharacter",
+                                     lambda n, char=char: char, (1,))
+        except ServerNotRecovered as e:
+            # The input that caused it is the last probe; keep it as a finding
+            if self.probes[-1] not in self.findings:
+                self.findings.append(self.probes[-1])
+            self.aborted = str(e)
+            print(f"\n🛑 {self.aborted}")
+        return self.findings
+
+    def errors(self):
+        """Inputs the server answered with a 5xx or not at all (e.g. invalid patterns)"""
+        return [p for p in self.probes if p.failed and not p.flagged]
+
+
+def build_sections(fuzzer):
+    sections = [{
+        'title': "Baselines",
+        'headers': ["Target", "Normal Queries", "Baseline p50", "Flag Above"],
+        'rows': [[target, ", ".join(TARGETS[target]['baseline']), format_ms(baseline),
+                  format_ms(fuzzer.threshold(target))] for target, baseline in fuzzer.baselines.items()],
+    }]
+    sections.append({
+        'title': "Pathological Inputs (minimal reproducers)",
+        'headers': ["Target", "Family", "Minimal Input", "n", "p50", "x Baseline", "Status"],
+        'rows': [[p.target, p.family, _short(p.pattern), p.size, format_ms(p.latency),
+                  f"{p.ratio:.1f}x", "FAIL" if p.failed else p.status] for p in fuzzer.findings],
+        'notes': ([f"🛑 {fuzzer.aborted}"] if fuzzer.aborted else []) + \
+                 ([f"{p.target} {p.family}: {p.description}; reproduce with "
+                   f"GET {TARGETS[p.target]['url'](p.pattern)}" for p in fuzzer.findings] +
+                  ["Escaping user input before new RegExp() (or an anchored prefix / $text "
+                   "search) removes this whole class of inputs."] if fuzzer.findings else
+                  ["✅ No input cost more than the threshold"]),
+    })
+    errors = fuzzer.errors()
+    if errors:
+        sections.append({
+            'title': "Server Errors",
+            'headers': ["Target", "Family", "Input", "p50", "Status"],
+            'rows': [[p.target, p.family, _short(p.pattern), format_ms(p.latency), p.status] for p in errors],
+            'notes': ["Invalid patterns reach new RegExp() unchecked and surface as 5xx responses"],
+        })
+    sections.append({
+        'title': "All Probes",
+        'headers': ["Target", "Family", "n", "Input", "p50", "x Baseline", "Status"],
+        'rows': [[p.target, p.family, p.size, _short(p.pattern), format_ms(p.latency),
+                  f"{p.ratio:.1f}x", p.status] for p in fuzzer.probes],
+    })
+    return sections
+
+
+def generate_reports(fuzzer, meta, basename="regex-fuzz-report"):
+    sections = build_sections(fuzzer)
+    for section in sections:
+        print_section(section)
+    cards = [
+        ("Inputs Sent", len(fuzzer.probes)),
+        ("Pathological", len(fuzzer.findings)),
+        ("Server Errors", len(fuzzer.errors())),
+        ("Worst", f"{max((p.ratio or 0 for p in fuzzer.probes), default=0):.1f}x"),
+    ]
+    write_text_report(f"{basename}.txt", "Regex Fuzz Report", meta, sections)
+    write_html_report(f"{basename}.html", "Regex Fuzz Report",
+                      "University Finder API - Pathological Regex Inputs", meta, cards, sections)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pathological-input detector for the regex-backed endpoints")
+    parser.add_argument("--backend-url", default=BACKEND_URL)
+    parser.add_argument("--targets", nargs="+", choices=sorted(TARGETS), default=['search', 'discipline'])
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="requests per input (median used)")
+    parser.add_argument("--ratio", type=float, default=DEFAULT_RATIO, help="flag inputs this many times the baseline")
+    parser.add_argument("--min-extra-ms", type=float, default=DEFAULT_MIN_EXTRA_MS,
+                        help="...and at least this much slower than it")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="per-request timeout (seconds)")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("🧨 REGEX PATHOLOGICAL-INPUT FUZZER")
+    print("=" * 70)
+    print(f"📍 Backend URL: {args.backend_url}")
+    print(f"🎯 Targets: {', '.join(args.targets)}")
+    with PooledHttpClient(timeout=args.timeout) as client:
+        fuzzer = RegexFuzzer(client, args.backend_url, max(1, args.repeats), args.ratio,
+                             args.min_extra_ms, args.timeout)
+        fuzzer.run(args.targets)
+
+    meta = [("Backend URL", args.backend_url), ("Targets", ", ".join(args.targets)),
+            ("Repeats", args.repeats), ("Threshold", f"{args.ratio}x baseline and +{args.min_extra_ms:.0f}ms"),
+            ("Timeout", f"{args.timeout}s")]
+    generate_reports(fuzzer, meta)
+    sys.exit(1 if fuzzer.findings else 0)
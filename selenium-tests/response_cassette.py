@@ -0,0 +1,272 @@
+"""
+Record / Replay Response Cassettes for the API Test Suite
+DevOps Lab - Section E
+
+A cassette is a gzip-compressed JSON file holding real responses
+(status, headers, body and how long each one took) keyed by method and
+path + query string. The host is left out of the key so a cassette
+recorded against Azure replays against any BACKEND_URL.
+
+- CassetteRecorder wraps PooledHttpClient, sends real requests and keeps
+  every response; save() / close() writes the cassette.
+- CassetteReplayClient has the same get()/request()/stats/describe()
+  interface but answers from the cassette, either with the recorded
+  timing or with no delay at all (schema and integrity checks then run in
+  milliseconds, e.g. as a pre-commit hook).
+
+A cassette's durations also give a fixed baseline that later live runs
+can be compared against (compare_to_cassette). The cassette stores the
+conditions it was recorded under (execution mode, concurrency,
+keep-alive): a concurrent run is slower per request than a sequential
+one against the same backend, so runs under other conditions are not
+compared at all (conditions_mismatch).
+
+Author: DevOps Lab Project
+"""
+
+import base64
+import gzip
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from http_client import ConnectionStats
+from perf_report import median
+
+
+DEFAULT_CASSETTE_PATH = 'api-cassette.json.gz'
+CASSETTE_VERSION = 1
+
+# Live latency this many times the recorded one is reported as slower...
+DEFAULT_BASELINE_TOLERANCE = 1.5
+# ...provided it is also at least this much slower in absolute terms (seconds),
+# so jitter on fast endpoints (3ms -> 5ms) is not a regression
+DEFAULT_MIN_SLOWDOWN = 0.05
+
+# Headers that describe the wire encoding rather than the stored body
+DROPPED_HEADERS = ('content-encoding', 'transfer-encoding', 'connection', 'keep-alive')
+
+
+class CassetteMiss(LookupError):
+    """The replayed request was never recorded"""
+
+
+def request_key(method, url):
+    """'GET /api/universities/search?query=NUST' - host-independent, query sorted"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return f"{method.upper()} {parts.path or '/'}" + (f"?{query}" if query else "")
+
+
+def _encode_body(content):
+    try:
+        return content.decode('utf-8'), 'utf-8'
+    except UnicodeDecodeError:
+        return base64.b64encode(content).decode('ascii'), 'base64'
+
+
+def _decode_body(interaction):
+    if interaction['body_encoding'] == 'base64':
+        return base64.b64decode(interaction['body'])
+    return interaction['body'].encode('utf-8')
+
+
+def load_cassette(path):
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        cassette = json.load(f)
+    if cassette.get('version') != CASSETTE_VERSION:
+        raise ValueError(f"Unsupported cassette version in {path}: {cassette.get('version')}")
+    return cassette
+
+
+class CassetteRecorder:
+    """Pass-through client that records every response it returns"""
+
+    def __init__(self, client, path=DEFAULT_CASSETTE_PATH, backend_url=None, conditions=None):
+        self.client = client
+        self.path = path
+        self.backend_url = backend_url
+        # How the run was made, e.g. {'mode': 'async', 'concurrency': 5, 'keep_alive': True}
+        self.conditions = conditions or {}
+        self.interactions = []
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self):
+        return self.client.stats
+
+    def request(self, method, url, **kwargs):
+        start = time.perf_counter()
+        response = self.client.request(method, url, **kwargs)
+        # Reading .content here buffers streamed bodies too; iter_content()
+        # then yields from the buffer, so callers are unaffected
+        content = response.content
+        duration = time.perf_counter() - start
+        body, body_encoding = _encode_body(content)
+        headers = {name: value for name, value in response.headers.items()
+                   if name.lower() not in DROPPED_HEADERS}
+        headers['Content-Length'] = str(len(content))
+        with self._lock:
+            self.interactions.append({
+                'key': request_key(method, url),
+                'status': response.status_code,
+                'reason': response.reason,
+                'headers': headers,
+                'body': body,
+                'body_encoding': body_encoding,
+                'duration': duration,
+            })
+        return response
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def describe(self):
+        return f"{self.client.describe()}, recording to {self.path}"
+
+    def save(self):
+        with self._lock:
+            cassette = {
+                'version': CASSETTE_VERSION,
+                'recorded_at': datetime.now().isoformat(timespec='seconds'),
+                'backend_url': self.backend_url,
+                'conditions': dict(self.conditions),
+                'interactions': list(self.interactions),
+            }
+        with gzip.open(self.path, 'wt', encoding='utf-8') as f:
+            json.dump(cassette, f, separators=(',', ':'))
+        print(f"📼 {len(cassette['interactions'])} responses recorded to: {self.path}")
+        return self.path
+
+    def close(self):
+        self.save()
+        self.client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CassetteReplayClient:
+    """
+    Serves requests from a cassette instead of the network.
+
+    delay=True sleeps for each response's recorded duration; delay=False
+    answers immediately. A key recorded several times is replayed in
+    recording order and then starts over.
+    """
+
+    def __init__(self, path=DEFAULT_CASSETTE_PATH, delay=True):
+        self.path = path
+        self.delay = delay
+        self.cassette = load_cassette(path)
+        self.stats = ConnectionStats()
+        self._interactions = {}
+        for interaction in self.cassette['interactions']:
+            self._interactions.setdefault(interaction['key'], []).append(interaction)
+        self._next = {}
+        self._lock = threading.Lock()
+
+    def _take(self, key):
+        with self._lock:
+            recorded = self._interactions.get(key)
+            if not recorded:
+                raise CassetteMiss(f"{key} is not in cassette {self.path}")
+            index = self._next.get(key, 0)
+            self._next[key] = (index + 1) % len(recorded)
+            return recorded[index]
+
+    def request(self, method, url, **kwargs):
+        self.stats.record_request()
+        interaction = self._take(request_key(method, url))
+        if self.delay:
+            time.sleep(interaction['duration'])
+
+        response = requests.Response()
+        response.status_code = interaction['status']
+        response.reason = interaction.get('reason')
+        response.headers = CaseInsensitiveDict(interaction['headers'])
+        response.url = url
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.elapsed = timedelta(seconds=interaction['duration'])
+        response._content = _decode_body(interaction)
+        response._content_consumed = True
+        return response
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def describe(self):
+        timing = "recorded timing" if self.delay else "no delay"
+        return f"replay of {self.path} ({len(self.cassette['interactions'])} responses, {timing})"
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def cassette_latencies(cassette):
+    """Recorded durations per path (the request key without method and query)"""
+    latencies = {}
+    for interaction in cassette['interactions']:
+        path = interaction['key'].split(' ', 1)[1].split('?', 1)[0]
+        latencies.setdefault(path, []).append(interaction['duration'])
+    return latencies
+
+
+def describe_conditions(conditions):
+    if not conditions:
+        return "unknown conditions"
+    return ", ".join(f"{name.replace('_', ' ')} {value}" for name, value in sorted(conditions.items()))
+
+
+def conditions_mismatch(cassette, conditions):
+    """Why the cassette's timings are not comparable with a run under conditions, or None"""
+    recorded = cassette.get('conditions')
+    if not recorded:
+        return "the cassette does not record how it was made (re-record it)"
+    if recorded != conditions:
+        return f"recorded with {describe_conditions(recorded)}, this run uses {describe_conditions(conditions)}"
+    return None
+
+
+def compare_to_cassette(cassette, live_latencies, tolerance=DEFAULT_BASELINE_TOLERANCE,
+                        min_slowdown=DEFAULT_MIN_SLOWDOWN):
+    """
+    Compare live latencies (endpoint -> list of seconds) with the recorded
+    ones, median against median. Returns rows of endpoint, recorded, live,
+    ratio, sample counts and whether the live run is more than tolerance
+    times and at least min_slowdown seconds slower.
+    """
+    recorded = cassette_latencies(cassette)
+    rows = []
+    for endpoint, live_samples in live_latencies.items():
+        live_samples = [v for v in live_samples if v is not None]
+        if endpoint not in recorded or not live_samples:
+            continue
+        durations = recorded[endpoint]
+        baseline = median(durations)
+        live = median(live_samples)
+        ratio = live / baseline if baseline > 0 else float('inf')
+        rows.append({
+            'endpoint': endpoint,
+            'recorded': baseline,
+            'live': live,
+            'recorded_n': len(durations),
+            'live_n': len(live_samples),
+            'ratio': ratio,
+            'slower': ratio > tolerance and live - baseline >= min_slowdown,
+        })
+    return rows
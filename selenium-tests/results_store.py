@@ -0,0 +1,385 @@
+"""
+Historical Results Store and Regression Detection
+DevOps Lab - Section E
+
+Every run of the API suite or the load generator appends its per-endpoint
+latency samples to a local SQLite database, tagged with the git SHA, the
+target URLs and a timestamp. Rows are never updated or deleted (triggers
+reject it), so the database is an append-only history.
+
+The compare command takes the most recent runs of a suite as the
+candidate window and the runs before them as the baseline window, then
+runs a two-sided Mann-Whitney U test per endpoint. A change is reported
+only when it is both significant (p < alpha) and not negligible in size
+(|Cliff's delta| >= MIN_EFFECT_SIZE), so one slow sample cannot raise an
+alarm on its own.
+
+The unit of the test is a run: each run contributes its median latency
+per endpoint. A load run stores thousands of samples, but they share one
+deployment, one network path and one moment, so they are not independent
+of each other; tested one by one, any run-to-run shift would look
+significant. The candidate window therefore defaults to MIN_SAMPLES runs.
+When no endpoint has enough runs in both windows the command exits 2
+instead of passing silently.
+
+Usage:
+    python results_store.py list
+    python results_store.py compare --suite api --baseline 20
+    python results_store.py compare --suite load-closed --baseline 5
+
+Author: DevOps Lab Project
+"""
+
+import argparse
+import math
+import os
+import sqlite3
+import subprocess
+from datetime import datetime
+
+from perf_report import format_ms, print_section, write_text_report, write_html_report
+
+
+DEFAULT_HISTORY_PATH = 'perf-history.sqlite3'
+DEFAULT_BASELINE_RUNS = 10
+DEFAULT_ALPHA = 0.05
+MIN_EFFECT_SIZE = 0.147     # |Cliff's delta| below this is "negligible" (Romano et al.)
+MIN_SAMPLES = 5             # Runs per window, below this no test is run
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    suite TEXT NOT NULL,
+    started_at TEXT NOT NULL,
+    git_sha TEXT,
+    frontend_url TEXT,
+    backend_url TEXT
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    endpoint TEXT NOT NULL,
+    latency REAL NOT NULL,          -- seconds
+    count INTEGER NOT NULL DEFAULT 1,
+    ok INTEGER NOT NULL DEFAULT 1
+);
+CREATE INDEX IF NOT EXISTS samples_by_run ON samples(run_id, endpoint);
+CREATE TRIGGER IF NOT EXISTS runs_append_only_update BEFORE UPDATE ON runs
+    BEGIN SELECT RAISE(ABORT, 'results store is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS runs_append_only_delete BEFORE DELETE ON runs
+    BEGIN SELECT RAISE(ABORT, 'results store is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS samples_append_only_update BEFORE UPDATE ON samples
+    BEGIN SELECT RAISE(ABORT, 'results store is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS samples_append_only_delete BEFORE DELETE ON samples
+    BEGIN SELECT RAISE(ABORT, 'results store is append-only'); END;
+"""
+
+
+def current_git_sha():
+    """SHA of the checked-out commit (CI env vars first, then git itself)"""
+    for var in ('GIT_SHA', 'GITHUB_SHA'):
+        if os.environ.get(var):
+            return os.environ[var]
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)),
+                              timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+class ResultsStore:
+    """Append-only SQLite history of per-endpoint latency samples"""
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def record_run(self, suite, samples, frontend_url=None, backend_url=None,
+                   git_sha=None, started_at=None):
+        """
+        Append one run. samples is an iterable of (endpoint, latency_seconds,
+        count, ok) tuples; count > 1 stores a histogram bucket as one row.
+        """
+        started_at = started_at or datetime.now()
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO runs (suite, started_at, git_sha, frontend_url, backend_url) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (suite, started_at.isoformat(timespec='seconds'), git_sha or current_git_sha(),
+                 frontend_url, backend_url))
+            run_id = cursor.lastrowid
+            self.conn.executemany(
+                "INSERT INTO samples (run_id, endpoint, latency, count, ok) VALUES (?, ?, ?, ?, ?)",
+                ((run_id, endpoint, latency, count, int(ok)) for endpoint, latency, count, ok in samples))
+        return run_id
+
+    def runs(self, suite=None, backend_url=None, limit=None):
+        """Runs newest first as dicts"""
+        query = "SELECT id, suite, started_at, git_sha, frontend_url, backend_url FROM runs WHERE 1=1"
+        params = []
+        if suite:
+            query += " AND suite = ?"
+            params.append(suite)
+        if backend_url:
+            query += " AND backend_url = ?"
+            params.append(backend_url)
+        query += " ORDER BY id DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        columns = ('id', 'suite', 'started_at', 'git_sha', 'frontend_url', 'backend_url')
+        return [dict(zip(columns, row)) for row in self.conn.execute(query, params)]
+
+    def samples(self, run_ids):
+        """endpoint -> [(latency, count), ...] of the successful samples of run_ids"""
+        if not run_ids:
+            return {}
+        marks = ",".join("?" * len(run_ids))
+        result = {}
+        for endpoint, latency, count in self.conn.execute(
+                f"SELECT endpoint, latency, count FROM samples WHERE ok = 1 AND run_id IN ({marks})",
+                list(run_ids)):
+            result.setdefault(endpoint, []).append((latency, count))
+        return result
+
+    def run_medians(self, run_ids):
+        """endpoint -> [(median latency, 1), ...], one entry per run with successful samples"""
+        result = {}
+        for run_id in run_ids:
+            for endpoint, samples in self.samples([run_id]).items():
+                result.setdefault(endpoint, []).append((weighted_median(samples), 1))
+        return result
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+# ----------------------------------------------------------------------
+# Statistics (weighted samples: (value, count) pairs)
+# ----------------------------------------------------------------------
+
+def _total(samples):
+    return sum(count for _, count in samples)
+
+
+def weighted_median(samples):
+    ordered = sorted(samples)
+    half = _total(ordered) / 2
+    running = 0
+    for value, count in ordered:
+        running += count
+        if running >= half:
+            return value
+    return None
+
+
+def mann_whitney_u(candidate, baseline):
+    """
+    Two-sided Mann-Whitney U test (normal approximation, tie-corrected).
+
+    Returns (U of candidate, p-value, Cliff's delta). Delta > 0 means
+    candidate values tend to be larger (slower) than baseline values.
+    """
+    n1, n2 = _total(candidate), _total(baseline)
+    pooled = {}
+    for value, count in candidate:
+        pooled.setdefault(value, [0, 0])[0] += count
+    for value, count in baseline:
+        pooled.setdefault(value, [0, 0])[1] += count
+
+    rank_sum = 0.0
+    tie_term = 0
+    next_rank = 1
+    for value in sorted(pooled):
+        in_candidate, in_baseline = pooled[value]
+        tied = in_candidate + in_baseline
+        average_rank = next_rank + (tied - 1) / 2
+        rank_sum += average_rank * in_candidate
+        tie_term += tied ** 3 - tied
+        next_rank += tied
+
+    u1 = rank_sum - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    mean = n1 * n2 / 2
+    if variance <= 0:
+        p_value = 1.0
+    else:
+        z = (abs(u1 - mean) - 0.5) / math.sqrt(variance)
+        p_value = min(1.0, math.erfc(max(z, 0) / math.sqrt(2)))
+    delta = 2 * u1 / (n1 * n2) - 1
+    return u1, p_value, delta
+
+
+def describe_effect(delta):
+    size = abs(delta)
+    if size < MIN_EFFECT_SIZE:
+        return "negligible"
+    if size < 0.33:
+        return "small"
+    return "medium" if size < 0.474 else "large"
+
+
+def compare_windows(baseline, candidate, alpha=DEFAULT_ALPHA):
+    """
+    Compare two endpoint -> [(latency, count)] maps.
+
+    Returns one dict per endpoint with medians, change, p-value,
+    Cliff's delta and a verdict (REGRESSION / IMPROVEMENT / OK /
+    INSUFFICIENT DATA).
+    """
+    rows = []
+    for endpoint in sorted(set(baseline) | set(candidate)):
+        base, cand = baseline.get(endpoint, []), candidate.get(endpoint, [])
+        row = {
+            'endpoint': endpoint,
+            'baseline_n': _total(base),
+            'candidate_n': _total(cand),
+            'baseline_median': weighted_median(base) if base else None,
+            'candidate_median': weighted_median(cand) if cand else None,
+            'p_value': None,
+            'delta': None,
+            'verdict': "INSUFFICIENT DATA",
+        }
+        if row['baseline_n'] >= MIN_SAMPLES and row['candidate_n'] >= MIN_SAMPLES:
+            _, p_value, delta = mann_whitney_u(cand, base)
+            row['p_value'], row['delta'] = p_value, delta
+            if p_value < alpha and abs(delta) >= MIN_EFFECT_SIZE:
+                row['verdict'] = "REGRESSION" if delta > 0 else "IMPROVEMENT"
+            else:
+                row['verdict'] = "OK"
+        rows.append(row)
+    return rows
+
+
+# ----------------------------------------------------------------------
+# Commands
+# ----------------------------------------------------------------------
+
+def compare_runs(store, suite, baseline_runs=DEFAULT_BASELINE_RUNS,
+                 candidate_runs=None, alpha=DEFAULT_ALPHA, backend_url=None):
+    """
+    Compare the per-run medians of the latest candidate_runs of suite
+    against those of the baseline_runs before them
+    """
+    latest = store.runs(suite, limit=1)
+    if not latest:
+        raise ValueError(f"No '{suite}' runs in {store.path}")
+    # Only compare runs against the same target as the newest run
+    backend_url = backend_url or latest[0]['backend_url']
+    candidate_runs = candidate_runs or MIN_SAMPLES
+    runs = store.runs(suite, backend_url, limit=baseline_runs + candidate_runs)
+    candidate, baseline = runs[:candidate_runs], runs[candidate_runs:]
+    rows = compare_windows(store.run_medians([r['id'] for r in baseline]),
+                           store.run_medians([r['id'] for r in candidate]), alpha)
+    return candidate, baseline, rows
+
+
+def _window_label(runs):
+    if not runs:
+        return "none"
+    shas = sorted({(r['git_sha'] or 'unknown')[:8] for r in runs})
+    return f"{len(runs)} run(s), {runs[-1]['started_at']} .. {runs[0]['started_at']}, sha {', '.join(shas)}"
+
+
+def comparison_sections(rows, alpha):
+    headers = ["Endpoint", "Baseline runs", "Candidate runs", "Baseline p50", "Candidate p50",
+               "Change", "p-value", "Cliff's delta", "Effect", "Verdict"]
+    table = []
+    for row in rows:
+        change = "-"
+        if row['baseline_median'] and row['candidate_median'] is not None:
+            change = f"{(row['candidate_median'] / row['baseline_median'] - 1) * 100:+.1f}%"
+        table.append([
+            row['endpoint'], row['baseline_n'], row['candidate_n'],
+            format_ms(row['baseline_median']), format_ms(row['candidate_median']), change,
+            "-" if row['p_value'] is None else f"{row['p_value']:.4f}",
+            "-" if row['delta'] is None else f"{row['delta']:+.2f}",
+            "-" if row['delta'] is None else describe_effect(row['delta']),
+            row['verdict'],
+        ])
+    return [{
+        'title': "Regression Check",
+        'headers': headers,
+        'rows': table,
+        'notes': [
+            f"Two-sided Mann-Whitney U test, alpha = {alpha}; a change needs p < alpha "
+            f"and |Cliff's delta| >= {MIN_EFFECT_SIZE}",
+            "Cliff's delta > 0 means the candidate window is slower than the baseline",
+            "Each run counts once, by its median latency per endpoint",
+            f"Endpoints with fewer than {MIN_SAMPLES} runs in either window are not tested",
+        ],
+    }]
+
+
+def print_runs(store, suite=None, limit=20):
+    print("=" * 70)
+    print("STORED RUNS")
+    print("=" * 70)
+    for run in store.runs(suite, limit=limit):
+        print(f"#{run['id']:<5} {run['started_at']}  {run['suite']:<12} "
+              f"{(run['git_sha'] or 'unknown')[:8]}  {run['backend_url'] or ''}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Performance history and regression detection")
+    parser.add_argument("--db", default=DEFAULT_HISTORY_PATH, help="SQLite history file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = commands.add_parser("list", help="show the most recent runs")
+    list_parser.add_argument("--suite")
+    list_parser.add_argument("--limit", type=int, default=20)
+
+    compare_parser = commands.add_parser("compare", help="test the latest runs against a baseline window")
+    compare_parser.add_argument("--suite", default="api",
+                                help="api, load-closed, load-open, soak-closed, soak-open, search or routes")
+    compare_parser.add_argument("--baseline", type=int, default=DEFAULT_BASELINE_RUNS,
+                                help="runs in the baseline window")
+    compare_parser.add_argument("--candidate", type=int,
+                                help=f"most recent runs in the candidate window (default {MIN_SAMPLES})")
+    compare_parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA)
+    compare_parser.add_argument("--backend-url", help="only compare runs against this backend")
+    args = parser.parse_args()
+
+    with ResultsStore(args.db) as history:
+        if args.command == "list":
+            print_runs(history, args.suite, args.limit)
+            exit(0)
+
+        candidate_window, baseline_window, comparison = compare_runs(
+            history, args.suite, max(1, args.baseline), args.candidate and max(1, args.candidate),
+            args.alpha, args.backend_url)
+
+    sections = comparison_sections(comparison, args.alpha)
+    for section in sections:
+        print_section(section)
+    regressions = [row for row in comparison if row['verdict'] == "REGRESSION"]
+    improvements = [row for row in comparison if row['verdict'] == "IMPROVEMENT"]
+    print(f"\n📉 {len(regressions)} regression(s), 📈 {len(improvements)} improvement(s)")
+    untested = all(row['verdict'] == "INSUFFICIENT DATA" for row in comparison)
+    if untested:
+        print(f"❌ No endpoint has {MIN_SAMPLES} runs in both windows - nothing was tested. "
+              f"Record more runs or widen --baseline / --candidate")
+
+    meta = [
+        ("Suite", args.suite),
+        ("History", args.db),
+        ("Baseline", _window_label(baseline_window)),
+        ("Candidate", _window_label(candidate_window)),
+    ]
+    cards = [
+        ("Endpoints", len(comparison)),
+        ("Regressions", len(regressions)),
+        ("Improvements", len(improvements)),
+    ]
+    write_text_report("perf-comparison-report.txt", "Performance Comparison Report", meta, sections)
+    write_html_report("perf-comparison-report.html", "Performance Comparison Report",
+                      "University Finder API - Regression Detection", meta, cards, sections)
+    exit(1 if regressions else 2 if untested else 0)
@@ -0,0 +1,417 @@
+"""
+Route Auto-Discovery and Benchmark Matrix
+DevOps Lab - Section E
+
+AutomatedTestSuite checks a handful of hand-picked URLs, while
+backendsample/src/server.js registers 40+ routes. This module reads the
+route table straight from server.js (app.get/post/put/delete/patch
+calls). It follows each handler's require() to its controller to find
+the query parameters it reads (req.query), then builds a parameterised
+benchmark matrix:
+
+- path parameters named like a record field (:city, :province,
+  :discipline) get values from the live records
+- id parameters (:id, :companyId) get _id values from the same records
+- query parameters named like a record field, query/search (a title
+  word) and minX/maxX ranges get values from them as well
+
+The records come from the nearest parent GET route that lists any
+(/api/universities for /api/universities/city/:city, /admin/contacts
+for /admin/contacts/:id), so admin routes are filled from admin data.
+
+Write routes (POST/PUT/DELETE/PATCH) and admin/company routes are left
+out unless --include-writes / --include-admin is given. Every case is
+timed several times and latencies are aggregated per route, so a new
+endpoint gets latency coverage without a new test method.
+
+Usage:
+    python route_matrix.py --backend-url http://localhost:5000 --repeats 5
+    python route_matrix.py --list
+
+Author: DevOps Lab Project
+"""
+
+import argparse
+import itertools
+import json
+import os
+import re
+import time
+from collections import Counter
+from urllib.parse import quote
+
+from http_client import PooledHttpClient
+from latency_histogram import LatencyHistogram
+from perf_report import format_bytes, format_ms, print_section, write_html_report, write_text_report
+from results_store import DEFAULT_HISTORY_PATH, ResultsStore
+from test_university_app import BACKEND_URL, FRONTEND_URL
+
+
+SERVER_JS = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir,
+                         'backendsample', 'src', 'server.js')
+DEFAULT_REPEATS = 3
+DEFAULT_VALUES = 3                               # Values tried per parameter
+WRITE_METHODS = ('POST', 'PUT', 'DELETE', 'PATCH')
+ADMIN_PREFIXES = ('/admin', '/company')          # Back-office routes
+TEXT_QUERY_PARAMS = ('query', 'search')          # Free-text search parameters
+
+ROUTE_RE = re.compile(r"\bapp\.(get|post|put|delete|patch)\(\s*([\"'`])([^\"'`]+)\2\s*,")
+REQUIRE_RE = re.compile(r"const\s+(\{[^}]*\}|\w+)\s*=\s*require\(\s*[\"'](\./[^\"']+)[\"']\s*\)")
+FUNCTION_START_RE = re.compile(r"^(?:const|let|var|async function|function|exports\.|module\.exports)\b", re.M)
+
+
+def _strip_comments(source):
+    source = re.sub(r"/\*.*?\*/", "", source, flags=re.S)
+    return re.sub(r"(?m)^\s*//.*$", "", source)
+
+
+def _handler_name(args):
+    """Controller called by a route: the function an inline arrow calls, or the last bare identifier"""
+    if "=>" in args:
+        called = re.search(r"([A-Za-z_$][\w$]*)\(\s*req\s*,\s*res", args)
+        return called.group(1) if called else None
+    bare = re.findall(r"(?:^|,)\s*([A-Za-z_$][\w$]*)\s*(?=,|$)", args.split(");")[0].strip())
+    return bare[-1] if bare else None
+
+
+def _controller_sources(server_js, source):
+    """{local handler name: source of its function in the required controller file}"""
+    base = os.path.dirname(server_js)
+    sources = {}
+    for names, module in REQUIRE_RE.findall(source):
+        path = os.path.normpath(os.path.join(base, module))
+        path = path if path.endswith('.js') else path + '.js'
+        if not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            controller = f.read()
+        if names.startswith('{'):
+            pairs = [[part.strip() for part in name.split(':')] for name in names.strip('{}').split(',')
+                     if name.strip()]
+        else:
+            pairs = [[names, names]]
+        for pair in pairs:
+            exported, local = pair[0], pair[-1]
+            match = re.search(rf"(?:const|let|var|function|exports\.)\s*{re.escape(exported)}\b", controller)
+            if not match:
+                sources[local] = controller
+                continue
+            following = FUNCTION_START_RE.search(controller, match.end())
+            sources[local] = controller[match.start():following.start() if following else len(controller)]
+    return sources
+
+
+def query_params(source):
+    """Names the controller reads from req.query, in order of appearance"""
+    names = []
+    for group in re.findall(r"\{([^{}]*)\}\s*=\s*req\.query", source or ""):
+        names += [name.split('=')[0].split(':')[0].strip() for name in group.split(',') if name.strip()]
+    names += re.findall(r"req\.query\.(\w+)", source or "")
+    return list(dict.fromkeys(names))
+
+
+def discover_routes(server_js=SERVER_JS):
+    """Route table from server.js: method, path, handler, path params, query params"""
+    with open(server_js, 'r', encoding='utf-8') as f:
+        source = _strip_comments(f.read())
+    controllers = _controller_sources(server_js, source)
+    matches = list(ROUTE_RE.finditer(source))
+    routes = []
+    for match, following in zip(matches, matches[1:] + [None]):
+        method, path = match.group(1), match.group(3)
+        # Arguments run on over indented lines (middleware lists) and up to "});" (inline arrows)
+        args = source[match.end():following.start() if following else len(source)]
+        statement_end = re.search(r"\n(?![\s}])", args)
+        handler = _handler_name(args[:statement_end.start()] if statement_end else args)
+        routes.append({
+            'method': method.upper(),
+            'path': path,
+            'handler': handler,
+            'path_params': re.findall(r":(\w+)", path),
+            'query_params': query_params(controllers.get(handler)),
+        })
+    return routes
+
+
+def route_class(route):
+    """'read', 'write', 'admin' or 'admin write'"""
+    kinds = [kind for kind, matches in (('admin', route['path'].startswith(ADMIN_PREFIXES)),
+                                        ('write', route['method'] in WRITE_METHODS)) if matches]
+    return " ".join(kinds) or 'read'
+
+
+def _records(payload):
+    if isinstance(payload, list):
+        return payload
+    if isinstance(payload, dict):
+        for value in payload.values():
+            if isinstance(value, list):
+                return value
+    return []
+
+
+def _spread(values, count):
+    """Most common, rarest and evenly spaced values in between"""
+    ranked = [value for value, _ in Counter(values).most_common()]
+    if len(ranked) <= count:
+        return ranked
+    step = (len(ranked) - 1) / (count - 1) if count > 1 else 0
+    return list(dict.fromkeys(ranked[round(i * step)] for i in range(count)))
+
+
+class ValueSource:
+    """Fills path and query parameters from the records the API itself lists"""
+
+    def __init__(self, client, backend_url, routes, count=DEFAULT_VALUES):
+        self.client = client
+        self.backend_url = backend_url
+        self.get_paths = {r['path'] for r in routes if r['method'] == 'GET' and not r['path_params']}
+        self.count = count
+        self._lists = {}
+
+    def list_records(self, path):
+        if path not in self._lists:
+            try:
+                response = self.client.get(f"{self.backend_url}{path}", timeout=30)
+                self._lists[path] = _records(response.json()) if response.ok else []
+            except Exception:
+                self._lists[path] = []
+        return self._lists[path]
+
+    def records_for(self, path):
+        """Records of the closest GET route at or above path that lists any"""
+        parent = path.split('/:')[0].rstrip('/')
+        while parent:
+            if parent in self.get_paths:
+                records = [r for r in self.list_records(parent) if isinstance(r, dict)]
+                if records:
+                    return records
+            parent = parent.rsplit('/', 1)[0]
+        return []
+
+    def field_values(self, field, records):
+        return _spread([r[field] for r in records if r.get(field) not in (None, '') and
+                        not isinstance(r[field], (list, dict))], self.count)
+
+    def path_values(self, route, param):
+        records = self.records_for(route['path'].split(f":{param}")[0])
+        if param == 'id' or param.endswith('Id'):
+            return [r.get('_id') or r.get('id') for r in records[:self.count] if r.get('_id') or r.get('id')]
+        return self.field_values(param, records)
+
+    def query_cases(self, route):
+        """Query-string variants: none, then each fillable parameter (min/max as a pair)"""
+        params = route['query_params']
+        records = self.records_for(route['path'])
+        cases = [{}]
+        handled = set()
+        for param in params:
+            if param in handled:
+                continue
+            range_match = re.match(r"(min|max)(\w+)$", param)
+            if range_match:
+                low, high = f"min{range_match.group(2)}", f"max{range_match.group(2)}"
+                # minRank/maxRank -> "ranking": the numeric field named like the suffix
+                numbers = sorted(value for r in records for field, value in r.items()
+                                 if field.lower().startswith(range_match.group(2).lower()) and
+                                 isinstance(value, (int, float)) and not isinstance(value, bool))
+                if numbers and low in params and high in params:
+                    for fraction in (0.1, 0.5, 1.0)[:self.count]:
+                        cases.append({low: numbers[0], high: numbers[int(fraction * (len(numbers) - 1))]})
+                    handled.update((low, high))
+                continue
+            if param in TEXT_QUERY_PARAMS:
+                names = self.field_values('title', records) or self.field_values('name', records)
+                cases += [{param: str(name).split()[0]} for name in names if str(name).split()]
+            elif any(param in r for r in records):
+                cases += [{param: value} for value in self.field_values(param, records)]
+        return cases
+
+
+def build_matrix(routes, values, include_writes=False, include_admin=False):
+    """Returns (cases, skipped): cases are {route, url, label}; skipped are (route, reason)"""
+    cases, skipped = [], []
+    for route in routes:
+        kind = route_class(route)
+        if 'write' in kind and not include_writes:
+            skipped.append((route, "write route (use --include-writes)"))
+            continue
+        if 'admin' in kind and not include_admin:
+            skipped.append((route, "admin route (use --include-admin)"))
+            continue
+        param_values = {param: values.path_values(route, param) for param in route['path_params']}
+        missing = [param for param, found in param_values.items() if not found]
+        if missing:
+            skipped.append((route, f"no values for :{', :'.join(missing)}"))
+            continue
+        query_cases = values.query_cases(route) if route['method'] == 'GET' else [{}]
+        for combination in itertools.product(*param_values.values()):
+            path = route['path']
+            for param, value in zip(param_values, combination):
+                path = path.replace(f":{param}", quote(str(value), safe=''))
+            for query in query_cases:
+                label = path + ("?" + "&".join(f"{k}={v}" for k, v in query.items()) if query else "")
+                cases.append({'route': route, 'path': path, 'query': query, 'label': label})
+    return cases, skipped
+
+
+class CaseResult:
+    def __init__(self, case):
+        self.case = case
+        self.histogram = LatencyHistogram()
+        self.timings = []     # (latency, status) per timed request
+        self.statuses = Counter()
+        self.size = None
+
+
+def run_matrix(client, backend_url, cases, repeats, bodies=None):
+    results = []
+    for case in cases:
+        route = case['route']
+        result = CaseResult(case)
+        body = (bodies or {}).get(f"{route['method']} {route['path']}", {})
+        kwargs = {'params': case['query']}
+        if route['method'] != 'GET':
+            kwargs['json'] = body
+        for attempt in range(repeats + 1):
+            start = time.perf_counter()
+            try:
+                response = client.request(route['method'], f"{backend_url}{case['path']}", **kwargs)
+                content = response.content
+                status = response.status_code
+            except Exception as e:
+                content, status = b"", type(e).__name__
+            latency = time.perf_counter() - start
+            if attempt == 0 and route['method'] == 'GET':
+                continue    # Warm-up (writes are not repeated for nothing)
+            result.histogram.record(latency)
+            result.timings.append((latency, status))
+            result.statuses[status] += 1
+            result.size = len(content)
+        results.append(result)
+        statuses = ", ".join(str(s) for s in result.statuses)
+        print(f"   {route['method']:<6} {case['label'][:60]:<60} {statuses:>8}  "
+              f"p50 {format_ms(result.histogram.value_at_percentile(50))}")
+    return results
+
+
+def _ok(status):
+    return isinstance(status, int) and status < 500
+
+
+def build_sections(routes, results, skipped):
+    by_route = {}
+    for result in results:
+        key = (result.case['route']['method'], result.case['route']['path'])
+        by_route.setdefault(key, []).append(result)
+
+    rows = []
+    for route in routes:
+        key = (route['method'], route['path'])
+        reason = next((why for r, why in skipped if r is route), None)
+        rows.append([route['method'], route['path'], route['handler'] or '-',
+                     ", ".join(route['query_params']) or '-', route_class(route),
+                     f"{len(by_route.get(key, []))} cases" if key in by_route else f"skipped: {reason}"])
+    sections = [{'title': "Discovered Routes",
+                 'headers': ["Method", "Path", "Handler", "Query Params", "Class", "Benchmark"],
+                 'rows': rows,
+                 'notes': [f"{len(routes)} routes found in server.js, {len(by_route)} benchmarked"]}]
+
+    rows = []
+    for (method, path), group in by_route.items():
+        histogram = LatencyHistogram()
+        statuses = Counter()
+        for result in group:
+            histogram.merge(result.histogram)
+            statuses.update(result.statuses)
+        errors = sum(count for status, count in statuses.items() if not _ok(status))
+        rows.append([method, path, len(group), histogram.count,
+                     ", ".join(f"{status}x{count}" for status, count in sorted(statuses.items(), key=str)),
+                     format_ms(histogram.value_at_percentile(50)), format_ms(histogram.value_at_percentile(95)),
+                     format_ms(histogram.max), "FAIL" if errors else "OK"])
+    sections.append({'title': "Latency per Route",
+                     'headers': ["Method", "Route", "Cases", "Requests", "Statuses", "p50", "p95", "Max",
+                                 "Verdict"],
+                     'rows': rows})
+
+    sections.append({'title': "Benchmark Matrix",
+                     'headers': ["Method", "Case", "Status", "p50", "p95", "Size"],
+                     'rows': [[r.case['route']['method'], r.case['label'],
+                               ", ".join(str(s) for s in r.statuses),
+                               format_ms(r.histogram.value_at_percentile(50)),
+                               format_ms(r.histogram.value_at_percentile(95)), format_bytes(r.size)]
+                              for r in results]})
+    return sections
+
+
+def save_history(results, backend_url, path=DEFAULT_HISTORY_PATH):
+    """Append every timed request to the results store, one endpoint per route pattern"""
+    samples = [(f"{r.case['route']['method']} {r.case['route']['path']}", latency, 1, _ok(status))
+               for r in results for latency, status in r.timings]
+    with ResultsStore(path) as store:
+        run_id = store.record_run("routes", samples, FRONTEND_URL, backend_url)
+    print(f"🗄️ Run #{run_id} saved to history: {path}")
+    return run_id
+
+
+def generate_reports(routes, results, skipped, meta, basename="route-matrix-report"):
+    sections = build_sections(routes, results, skipped)
+    for section in sections:
+        print_section(section)
+    failing = sum(1 for row in sections[1]['rows'] if row[-1] == "FAIL")
+    cards = [
+        ("Routes Found", len(routes)),
+        ("Routes Benchmarked", len(sections[1]['rows'])),
+        ("Cases", len(results)),
+        ("Routes with 5xx", failing),
+    ]
+    write_text_report(f"{basename}.txt", "Route Matrix Report", meta, sections)
+    write_html_report(f"{basename}.html", "Route Matrix Report",
+                      "University Finder API - Routes Discovered from server.js", meta, cards, sections)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark every route registered in server.js")
+    parser.add_argument("--backend-url", default=BACKEND_URL)
+    parser.add_argument("--server-js", default=SERVER_JS, help="Express entry point to read routes from")
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="timed requests per case")
+    parser.add_argument("--values", type=int, default=DEFAULT_VALUES, help="values tried per parameter")
+    parser.add_argument("--include-writes", action="store_true",
+                        help="also send POST/PUT/DELETE/PATCH requests (these change real data)")
+    parser.add_argument("--include-admin", action="store_true", help="also benchmark /admin and /company routes")
+    parser.add_argument("--bodies", help="JSON file mapping \"METHOD /path/:param\" to a request body for writes")
+    parser.add_argument("--list", action="store_true", help="print the discovered routes and exit")
+    parser.add_argument("--history", default=DEFAULT_HISTORY_PATH,
+                        help="SQLite results history to append to (\"\" to skip)")
+    args = parser.parse_args()
+    backend_url = args.backend_url.rstrip('/')
+
+    discovered = discover_routes(args.server_js)
+    if args.list:
+        for route in discovered:
+            print(f"{route['method']:<7} {route['path']:<45} {route['handler'] or '-':<32} "
+                  f"{route_class(route):<6} {', '.join(route['query_params'])}")
+        raise SystemExit(0)
+
+    request_bodies = None
+    if args.bodies:
+        with open(args.bodies, 'r', encoding='utf-8') as f:
+            request_bodies = json.load(f)
+
+    print("=" * 70)
+    print("🧭 ROUTE DISCOVERY BENCHMARK MATRIX")
+    print("=" * 70)
+    print(f"📍 Backend URL: {backend_url}")
+    print(f"📜 {len(discovered)} routes read from {os.path.relpath(args.server_js)}\n")
+    with PooledHttpClient(timeout=60) as client:
+        source = ValueSource(client, backend_url, discovered, max(1, args.values))
+        matrix, skipped_routes = build_matrix(discovered, source, args.include_writes, args.include_admin)
+        print(f"🧮 {len(matrix)} cases, {len(skipped_routes)} routes skipped\n")
+        matrix_results = run_matrix(client, backend_url, matrix, max(1, args.repeats), request_bodies)
+
+    meta = [("Backend URL", backend_url), ("Routes Found", len(discovered)), ("Repeats", args.repeats),
+            ("Writes", "included" if args.include_writes else "excluded"),
+            ("Admin Routes", "included" if args.include_admin else "excluded")]
+    generate_reports(discovered, matrix_results, skipped_routes, meta)
+    if args.history:
+        save_history(matrix_results, backend_url, args.history)
@@ -0,0 +1,259 @@
+"""
+Per-Endpoint Concurrency Scaling with a Universal Scalability Law Fit
+DevOps Lab - Section E
+
+/api/universities/stats runs four aggregations on every call and search
+scans the collection with a regex, so these may stop scaling long
+before the rest. For each endpoint this sweep runs closed-loop load
+with no think time at concurrency 1, 2, 4, ... up to --max-concurrency.
+It measures throughput X(N) at each level and fits Gunther's Universal
+Scalability Law:
+
+    X(N) = lambda * N / (1 + sigma * (N - 1) + kappa * N * (N - 1))
+
+- lambda: throughput of a single client (no queueing)
+- sigma:  contention - the share of each request that is serialised
+          (one event loop, a lock, a single database queue). Throughput
+          flattens towards lambda / sigma.
+- kappa:  coherency - the cost of requests interfering with each other
+          (pool churn, cache thrash, crosstalk between resources).
+          Throughput peaks at N* = sqrt((1 - sigma) / kappa), then falls.
+
+An endpoint is reported as serialisation-limited when the sigma term
+dominates at the highest concurrency, and resource-limited (coherency)
+when the kappa term does.
+
+Usage:
+    python scalability_sweep.py --backend-url http://localhost:5000 --max-concurrency 32 --duration 10
+
+Author: DevOps Lab Project
+"""
+
+import argparse
+import math
+
+from load_generator import ClosedLoopLoadGenerator, MultiProcessLoadCoordinator, SCENARIOS
+from perf_report import (CHART_COLOURS, format_ms, print_section, svg_chart, write_html_report,
+                         write_text_report)
+from test_university_app import BACKEND_URL
+
+
+DEFAULT_MAX_CONCURRENCY = 32
+DEFAULT_DURATION = 10.0         # Seconds per concurrency level
+SCALES_EFFICIENCY = 0.8         # X(N) / (N * X(1)) at the top level counted as "still scaling"
+LAMBDA_GRID = [0.8 + 0.01 * i for i in range(41)]   # lambda tried as 0.8x - 1.2x of X(1)
+ENDPOINTS = SCENARIOS + [
+    {'name': 'Stats', 'path': '/api/universities/stats', 'params': {}},
+]
+
+
+def concurrency_levels(maximum):
+    """1, 2, 4, ... up to and including maximum"""
+    levels, n = [], 1
+    while n < maximum:
+        levels.append(n)
+        n *= 2
+    return levels + [maximum]
+
+
+def usl_throughput(n, lam, sigma, kappa):
+    return lam * n / (1 + sigma * (n - 1) + kappa * n * (n - 1))
+
+
+def _fit_coefficients(points, lam):
+    """
+    With lambda fixed, lam * N / X - 1 = sigma * (N - 1) + kappa * N * (N - 1)
+    is linear in sigma and kappa: least squares through the origin,
+    clamped to non-negative coefficients.
+    """
+    rows = [(n - 1, n * (n - 1), lam * n / x - 1) for n, x in points if x > 0]
+    s11 = sum(a * a for a, _, _ in rows)
+    s12 = sum(a * b for a, b, _ in rows)
+    s22 = sum(b * b for _, b, _ in rows)
+    s1y = sum(a * y for a, _, y in rows)
+    s2y = sum(b * y for _, b, y in rows)
+    determinant = s11 * s22 - s12 * s12
+    sigma = kappa = 0.0
+    if determinant > 0:
+        sigma = (s1y * s22 - s2y * s12) / determinant
+        kappa = (s2y * s11 - s1y * s12) / determinant
+    if kappa <= 0 or determinant <= 0:
+        sigma, kappa = (s1y / s11 if s11 else 0.0), 0.0
+    if sigma < 0:
+        sigma, kappa = 0.0, max(0.0, s2y / s22 if s22 else 0.0)
+    return max(0.0, sigma), kappa
+
+
+def fit_usl(points):
+    """
+    Fit the USL to [(N, throughput), ...]. lambda is searched on a grid
+    around the single-client throughput; returns a dict with lambda,
+    sigma, kappa and r_squared, or None with fewer than three levels.
+    """
+    points = sorted((n, x) for n, x in points if x > 0)
+    if len(points) < 3:
+        return None
+    base = points[0][1] / points[0][0]
+    best = None
+    for factor in LAMBDA_GRID:
+        lam = base * factor
+        sigma, kappa = _fit_coefficients(points, lam)
+        sse = sum((x - usl_throughput(n, lam, sigma, kappa)) ** 2 for n, x in points)
+        if best is None or sse < best[0]:
+            best = (sse, lam, sigma, kappa)
+    sse, lam, sigma, kappa = best
+    mean = sum(x for _, x in points) / len(points)
+    sst = sum((x - mean) ** 2 for _, x in points)
+    fit = {'lambda': lam, 'sigma': sigma, 'kappa': kappa, 'r_squared': 1 - sse / sst if sst else 1.0}
+    fit['peak_n'] = math.sqrt((1 - sigma) / kappa) if kappa > 0 and sigma < 1 else None
+    fit['peak_x'] = usl_throughput(fit['peak_n'], lam, sigma, kappa) if fit['peak_n'] else None
+    fit['ceiling'] = lam / sigma if sigma > 0 and not kappa else fit['peak_x']
+    return fit
+
+
+def classify(fit, points):
+    """Which term limits scaling at the highest concurrency measured"""
+    if not fit:
+        return "N/A (too few levels)"
+    top_n, top_x = max(points)
+    single = min(points)[1] / min(points)[0]
+    efficiency = top_x / (top_n * single) if single else 0.0
+    contention = fit['sigma'] * (top_n - 1)
+    coherency = fit['kappa'] * top_n * (top_n - 1)
+    if efficiency >= SCALES_EFFICIENCY:
+        return "scales (no limit in range)"
+    if coherency > contention:
+        return "resources / coherency (kappa)"
+    return "serialisation / contention (sigma)"
+
+
+class SweepLevel:
+    """Throughput and latency at one concurrency level"""
+
+    def __init__(self, concurrency, results, name):
+        stats = results.endpoints[name]
+        self.concurrency = concurrency
+        self.requests = stats.count
+        self.errors = stats.errors
+        self.throughput = results.throughput(stats)
+        self.p50 = stats.histogram.value_at_percentile(50)
+        self.p99 = stats.histogram.value_at_percentile(99)
+
+
+def sweep_endpoint(backend_url, endpoint, levels, duration, processes=1):
+    sweep = []
+    print(f"\n📈 {endpoint['name']} ({endpoint['path']})")
+    for n in levels:
+        settings = dict(backend_url=backend_url, users=n, duration=duration, think_time=0, scenarios=[endpoint])
+        if processes > 1 and n > 1:
+            generator = MultiProcessLoadCoordinator("closed", processes, **settings)
+            results = generator.run()
+        else:
+            results = ClosedLoopLoadGenerator(**settings).run(verbose=False)
+        level = SweepLevel(n, results, endpoint['name'])
+        sweep.append(level)
+        print(f"   N={n:<4} {level.throughput:8.1f} req/s  p50 {format_ms(level.p50):>9}  "
+              f"p99 {format_ms(level.p99):>9}  errors {level.errors}")
+    return sweep
+
+
+def build_sections(sweeps):
+    rows, fits, series = [], {}, []
+    for index, (endpoint, sweep) in enumerate(sweeps):
+        points = [(level.concurrency, level.throughput) for level in sweep]
+        fit = fits[endpoint['name']] = fit_usl(points)
+        single = sweep[0].throughput / sweep[0].concurrency if sweep and sweep[0].throughput else None
+        for level in sweep:
+            speedup = level.throughput / single if single else None
+            rows.append([endpoint['name'], level.concurrency, f"{level.throughput:.1f}",
+                         f"{speedup:.2f}x" if speedup else "N/A",
+                         f"{speedup / level.concurrency * 100:.0f}%" if speedup else "N/A",
+                         f"{usl_throughput(level.concurrency, fit['lambda'], fit['sigma'], fit['kappa']):.1f}"
+                         if fit else "N/A",
+                         format_ms(level.p50), format_ms(level.p99), level.errors])
+        colour = CHART_COLOURS[index % len(CHART_COLOURS)]
+        series.append({'name': endpoint['name'], 'points': points, 'colour': colour})
+        if fit:
+            top = max(n for n, _ in points)
+            curve = [1 + (top - 1) * i / 40 for i in range(41)]
+            series.append({'name': f"{endpoint['name']} USL", 'line': True, 'colour': colour,
+                           'points': [(n, usl_throughput(n, fit['lambda'], fit['sigma'], fit['kappa']))
+                                      for n in curve]})
+    sections = [{'title': "Concurrency Sweep",
+                 'headers': ["Endpoint", "Concurrency", "Throughput", "Speedup", "Efficiency", "USL Fit",
+                             "p50", "p99", "Errors"],
+                 'rows': rows,
+                 'notes': ["Closed loop, no think time: each client sends its next request as soon as the "
+                           "last one returns",
+                           "Speedup and efficiency are relative to the single-client throughput"],
+                 'html': svg_chart(series, "concurrency (clients)", "throughput (req/s)")}]
+
+    rows, notes = [], []
+    for endpoint, sweep in sweeps:
+        fit = fits[endpoint['name']]
+        points = [(level.concurrency, level.throughput) for level in sweep if level.throughput]
+        verdict = classify(fit, points)
+        if not fit:
+            rows.append([endpoint['name']] + ["N/A"] * 6 + [verdict])
+            continue
+        rows.append([endpoint['name'], f"{fit['lambda']:.1f}", f"{fit['sigma']:.4f}", f"{fit['kappa']:.5f}",
+                     f"{fit['r_squared']:.3f}", f"{fit['peak_n']:.1f}" if fit['peak_n'] else "none",
+                     f"{fit['ceiling']:.1f}" if fit['ceiling'] else "unbounded", verdict])
+        if fit['r_squared'] < 0.9:
+            notes.append(f"{endpoint['name']}: poor fit (R² {fit['r_squared']:.2f}) - lengthen --duration "
+                         f"or check for errors")
+    notes += ["sigma (contention): share of each request that is serialised; throughput flattens at lambda/sigma",
+              "kappa (coherency): requests slowing each other down; throughput peaks at N* and then falls",
+              "Check that the load generator itself is not the bottleneck (use --processes for high concurrency)"]
+    sections.append({'title': "Universal Scalability Law Fit",
+                     'headers': ["Endpoint", "Lambda (req/s)", "Sigma", "Kappa", "R²", "Peak N*",
+                                 "Max Throughput", "Limited By"],
+                     'rows': rows, 'notes': notes})
+    return sections, fits
+
+
+def generate_reports(sweeps, meta, basename="scalability-report"):
+    sections, fits = build_sections(sweeps)
+    for section in sections:
+        print_section(section)
+    verdicts = [classify(fits[e['name']], [(lv.concurrency, lv.throughput) for lv in s if lv.throughput])
+                for e, s in sweeps]
+    cards = [
+        ("Endpoints", len(sweeps)),
+        ("Serialisation-Limited", sum(1 for v in verdicts if v.startswith("serialisation"))),
+        ("Resource-Limited", sum(1 for v in verdicts if v.startswith("resources"))),
+        ("Still Scaling", sum(1 for v in verdicts if v.startswith("scales"))),
+    ]
+    write_text_report(f"{basename}.txt", "Scalability Report", meta, sections)
+    write_html_report(f"{basename}.html", "Scalability Report",
+                      "University Finder API - Concurrency Scaling (Universal Scalability Law)",
+                      meta, cards, sections)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Concurrency sweep with a Universal Scalability Law fit")
+    parser.add_argument("--backend-url", default=BACKEND_URL)
+    parser.add_argument("--max-concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY)
+    parser.add_argument("--levels", type=int, nargs="+", help="explicit concurrency levels (default: 1, 2, 4, ...)")
+    parser.add_argument("--duration", type=float, default=DEFAULT_DURATION, help="seconds per level")
+    parser.add_argument("--endpoints", nargs="+", help="endpoint names or paths (default: all)")
+    parser.add_argument("--processes", type=int, default=1,
+                        help="worker processes generating the load at each level above 1")
+    args = parser.parse_args()
+    backend_url = args.backend_url.rstrip('/')
+    concurrency = sorted(set(args.levels)) if args.levels else concurrency_levels(max(1, args.max_concurrency))
+    selected = [e for e in ENDPOINTS if not args.endpoints or e['name'] in args.endpoints or
+                e['path'] in args.endpoints]
+    if not selected:
+        parser.error(f"No endpoint matches {args.endpoints}; choose from {[e['name'] for e in ENDPOINTS]}")
+
+    print("=" * 70)
+    print("📐 CONCURRENCY SCALING SWEEP")
+    print("=" * 70)
+    print(f"📍 Backend URL: {backend_url}")
+    print(f"👥 Concurrency: {', '.join(str(n) for n in concurrency)} ({args.duration:g}s each)")
+    results = [(e, sweep_endpoint(backend_url, e, concurrency, args.duration, max(1, args.processes)))
+               for e in selected]
+    meta = [("Backend URL", backend_url), ("Concurrency Levels", ", ".join(str(n) for n in concurrency)),
+            ("Duration per Level", f"{args.duration:g}s"), ("Processes", max(1, args.processes))]
+    generate_reports(results, meta)
@@ -0,0 +1,335 @@
+"""
+Query-Workload Benchmark for /api/universities/search
+DevOps Lab - Section E
+
+searchUniversitiesByName builds a case-insensitive RegExp from the query,
+matches it against title, city, province, discipline and degree with $or
+and sorts by ranking. test_03_search_api only times the query "NUST".
+
+This benchmark builds a query set from the live catalogue (fetched from
+/api/universities):
+
+- exact_title: full university titles
+- prefix:      the first few letters of a title
+- city / province / discipline: values that exist in the data
+- rare:        words that occur in exactly one record
+- no_match:    strings that match nothing
+- limit:       one broad query with several ?limit= values (0 = no limit)
+
+Every query is timed several times. The report shows latency by query
+type, vs. result count and vs. selectivity (share of the catalogue the
+regex matches, computed locally), with a linear fit. A request without a
+query is rejected before MongoDB is touched, so its latency is the
+floor. The extra time a no-match query takes over that floor is the cost
+of scanning the whole collection. If it grows with the catalogue (compare
+runs in perf-history.sqlite3, suite "search") the search is doing full
+collection scans.
+
+Usage:
+    python search_benchmark.py --backend-url http://localhost:5000 --repeats 10
+
+Author: DevOps Lab Project
+"""
+
+import argparse
+import random
+import re
+import time
+from collections import Counter
+
+from http_client import PooledHttpClient
+from latency_histogram import LatencyHistogram
+from perf_report import (format_bytes, format_ms, linear_fit, print_section, svg_chart, write_html_report,
+                         write_text_report)
+from results_store import DEFAULT_HISTORY_PATH, ResultsStore
+from test_university_app import BACKEND_URL, FRONTEND_URL
+
+
+DEFAULT_REPEATS = 5          # Timed requests per query (after one warm-up)
+DEFAULT_SAMPLE = 6           # Queries per category
+DEFAULT_LIMIT = 10           # Controller default for ?limit=
+LIMITS = (1, 10, 50, 0)      # 0 = MongoDB "no limit"
+BROAD_QUERY = "a"            # Matches almost every record, used for the limit sweep
+PREFIX_LENGTH = 4
+SCAN_SHARE = 0.8             # Fit intercept >= 80% of the median latency -> latency is not driven by matches
+SEARCH_FIELDS = ('title', 'city', 'province', 'discipline', 'degree')
+NO_MATCH_QUERIES = ('zzqxv', 'qwxjz university', 'xyzzy123')
+RESULT_BUCKETS = ((0, 0), (1, 1), (2, 10), (11, 50), (51, None))
+SEARCH_PATH = '/api/universities/search'
+
+
+def fetch_catalogue(client, backend_url):
+    response = client.get(f"{backend_url}/api/universities", timeout=30)
+    response.raise_for_status()
+    return response.json()['data']
+
+
+def count_matches(universities, query):
+    """How many records the controller's $regex matches (None if the pattern is invalid)"""
+    try:
+        regex = re.compile(query, re.IGNORECASE)
+    except re.error:
+        return None
+    return sum(1 for u in universities if any(regex.search(str(u.get(f, ''))) for f in SEARCH_FIELDS))
+
+
+def _distinct(universities, field):
+    return [value for value, _ in Counter(u.get(field) for u in universities if u.get(field)).most_common()]
+
+
+def _rare_words(universities):
+    """Words of 5+ letters that appear in exactly one record's searchable fields"""
+    owners = {}
+    for index, u in enumerate(universities):
+        text = " ".join(str(u.get(f, '')) for f in SEARCH_FIELDS)
+        for word in set(re.findall(r"[A-Za-z]{5,}", text.lower())):
+            owners.setdefault(word, set()).add(index)
+    return sorted(word for word, indexes in owners.items() if len(indexes) == 1)
+
+
+def build_query_set(universities, sample=DEFAULT_SAMPLE, seed=0):
+    """List of {'category', 'query', 'limit'} built from the catalogue"""
+    rng = random.Random(seed)
+
+    def pick(values):
+        values = list(dict.fromkeys(values))
+        return values if len(values) <= sample else rng.sample(values, sample)
+
+    titles = [u['title'] for u in universities if u.get('title')]
+    categories = {
+        'exact_title': pick(titles),
+        'prefix': pick(t[:PREFIX_LENGTH] for t in titles if len(t) >= PREFIX_LENGTH),
+        'city': _distinct(universities, 'city')[:sample],
+        'province': _distinct(universities, 'province')[:sample],
+        'discipline': _distinct(universities, 'discipline')[:sample],
+        'rare': pick(_rare_words(universities)),
+        'no_match': list(NO_MATCH_QUERIES),
+    }
+    queries = [{'category': category, 'query': query, 'limit': None}
+               for category, values in categories.items() for query in values]
+    queries += [{'category': 'limit', 'query': BROAD_QUERY, 'limit': limit} for limit in LIMITS]
+    return queries
+
+
+class QueryResult:
+    """Latency samples and response details for one query"""
+
+    def __init__(self, category, query, limit, matched, total):
+        self.category = category
+        self.query = query
+        self.limit = limit
+        self.matched = matched
+        self.selectivity = matched / total if matched is not None and total else None
+        self.histogram = LatencyHistogram()
+        self.latencies = []
+        self.returned = None
+        self.size = 0
+        self.errors = 0
+        self.status = None
+
+    @property
+    def expected(self):
+        """Records the controller should return given the match count and limit"""
+        if self.matched is None:
+            return None
+        limit = DEFAULT_LIMIT if self.limit is None else self.limit
+        return self.matched if limit == 0 else min(self.matched, limit)
+
+    @property
+    def p50(self):
+        return self.histogram.value_at_percentile(50) if self.histogram.count else None
+
+    @property
+    def label(self):
+        return self.query if self.limit is None else f"{self.query} (limit={self.limit})"
+
+
+def time_query(client, backend_url, query, limit, result):
+    params = {} if query is None else {'query': query}
+    if limit is not None:
+        params['limit'] = limit
+    start = time.perf_counter()
+    try:
+        response = client.get(f"{backend_url}{SEARCH_PATH}", params=params)
+        content = response.content
+        latency = time.perf_counter() - start
+        result.status = response.status_code
+        result.size = len(content)
+        if response.ok:
+            result.returned = response.json().get('count')
+    except Exception:
+        latency = time.perf_counter() - start
+        result.status = 'error'
+    if result.status != 200:
+        result.errors += 1
+    return latency
+
+
+def run_benchmark(client, backend_url, queries, total, universities, repeats=DEFAULT_REPEATS):
+    """Time every query; returns (query results, floor result)"""
+    results = []
+    floor = QueryResult('floor', None, None, None, total)
+    for spec in [None] + queries:
+        if spec is None:
+            result, query, limit = floor, None, None
+        else:
+            query, limit = spec['query'], spec['limit']
+            result = QueryResult(spec['category'], query, limit, count_matches(universities, query), total)
+        time_query(client, backend_url, query, limit, result)     # warm-up
+        for _ in range(repeats):
+            latency = time_query(client, backend_url, query, limit, result)
+            result.histogram.record(latency)
+            result.latencies.append(latency)
+        if spec is not None:
+            results.append(result)
+            print(f"   {result.category:<12} {result.label[:40]:<40} "
+                  f"{result.returned if result.returned is not None else result.status!s:>5} results  "
+                  f"p50 {format_ms(result.p50)}")
+    # Only the floor's errors are expected: it is a 400 by design
+    floor.errors = 0
+    return results, floor
+
+
+def _merged(results):
+    histogram = LatencyHistogram()
+    for result in results:
+        histogram.merge(result.histogram)
+    return histogram
+
+
+def _bucket_label(low, high):
+    if high is None:
+        return f"{low}+"
+    return str(low) if low == high else f"{low}-{high}"
+
+
+def build_sections(results, floor, total):
+    by_category = {}
+    for result in results:
+        by_category.setdefault(result.category, []).append(result)
+
+    rows = []
+    for category, group in by_category.items():
+        histogram = _merged(group)
+        returned = [r.returned for r in group if r.returned is not None]
+        selectivity = [r.selectivity for r in group if r.selectivity is not None]
+        rows.append([category, len(group),
+                     f"{sum(returned) / len(returned):.1f}" if returned else "N/A",
+                     f"{sum(selectivity) / len(selectivity) * 100:.1f}%" if selectivity else "N/A",
+                     format_ms(histogram.value_at_percentile(50)), format_ms(histogram.value_at_percentile(95)),
+                     format_ms(histogram.max)])
+    sections = [{'title': "Latency by Query Type",
+                 'headers': ["Query Type", "Queries", "Avg Results", "Avg Selectivity", "p50", "p95", "Max"],
+                 'rows': rows,
+                 'notes': [f"Floor (no query, rejected before MongoDB): p50 {format_ms(floor.p50)}"]}]
+
+    rows = []
+    for low, high in RESULT_BUCKETS:
+        group = [r for r in results if r.returned is not None and r.returned >= low
+                 and (high is None or r.returned <= high)]
+        if group:
+            histogram = _merged(group)
+            rows.append([_bucket_label(low, high), len(group), format_ms(histogram.value_at_percentile(50)),
+                         format_ms(histogram.value_at_percentile(95))])
+    count_points = [(r.returned, r.p50 * 1000) for r in results if r.returned is not None]
+    sections.append({'title': "Latency vs. Result Count",
+                     'headers': ["Results Returned", "Queries", "p50", "p95"], 'rows': rows,
+                     'html': svg_chart([{'name': "query p50", 'points': count_points}],
+                                       "records returned", "p50 latency (ms)")})
+
+    points = [(r.selectivity * 100, r.p50 * 1000) for r in results
+              if r.selectivity is not None and r.limit is None]
+    fit = linear_fit(points)
+    notes = []
+    series = [{'name': "query p50", 'points': points}]
+    no_match = [r for r in results if r.category == 'no_match' and r.p50 is not None]
+    if fit:
+        intercept, slope, r = fit
+        notes.append(f"Fit: latency = {intercept:.1f}ms + {slope:.2f}ms per 1% of the catalogue matched (r = {r:.2f})")
+        series.append({'name': "linear fit", 'line': True,
+                       'points': [(x, intercept + slope * x) for x in (0, max(p[0] for p in points))]})
+        median = sorted(y for _, y in points)[len(points) // 2]
+        if intercept >= median * SCAN_SHARE:
+            notes.append("Latency hardly depends on how much of the catalogue matches: every search pays "
+                         "the same fixed cost. An unanchored, case-insensitive $regex cannot use an index, "
+                         "so that cost is a full collection scan and grows with the catalogue.")
+        else:
+            notes.append("Latency grows with the share of the catalogue matched: returning and sorting "
+                         "matches dominates, not the scan.")
+    if no_match and floor.p50 is not None:
+        scan = _merged(no_match).value_at_percentile(50) - floor.p50
+        notes.append(f"No-match queries take {format_ms(scan)} more than the floor over {total} records "
+                     f"({scan / total * 1e6:.2f}us per record). This is the scan cost to compare as the "
+                     f"catalogue grows.")
+    sections.append({'title': "Latency vs. Selectivity",
+                     'headers': [], 'notes': notes,
+                     'html': svg_chart(series, "selectivity (% of catalogue matched)", "p50 latency (ms)")})
+
+    rows = [[r.category, r.label, r.returned if r.returned is not None else r.status,
+             r.matched if r.matched is not None else "invalid",
+             f"{r.selectivity * 100:.1f}%" if r.selectivity is not None else "N/A",
+             format_ms(r.p50), format_ms(r.histogram.value_at_percentile(95)), format_bytes(r.size)]
+            for r in results]
+    mismatches = [r for r in results if r.returned is not None and r.expected is not None
+                  and r.returned != r.expected]
+    notes = [f"'{r.label}' returned {r.returned} records, {r.expected} expected from the catalogue "
+             f"(the query is used as a regex, so characters like ( ) . + change its meaning)"
+             for r in mismatches]
+    sections.append({'title': "Per-Query Results",
+                     'headers': ["Type", "Query", "Returned", "Matched", "Selectivity", "p50", "p95", "Size"],
+                     'rows': rows, 'notes': notes})
+    return sections
+
+
+def save_history(results, backend_url, path=DEFAULT_HISTORY_PATH):
+    """Append every timed request to the results store as search:<query type>"""
+    samples = [(f"search:{r.category}", latency, 1, r.errors == 0) for r in results for latency in r.latencies]
+    with ResultsStore(path) as store:
+        run_id = store.record_run("search", samples, FRONTEND_URL, backend_url)
+    print(f"🗄️ Run #{run_id} saved to history: {path}")
+    return run_id
+
+
+def generate_reports(results, floor, total, meta, basename="search-benchmark-report"):
+    sections = build_sections(results, floor, total)
+    for section in sections:
+        print_section(section)
+    overall = _merged(results)
+    cards = [
+        ("Catalogue", f"{total} records"),
+        ("Queries", len(results)),
+        ("Search p50", format_ms(overall.value_at_percentile(50))),
+        ("Floor p50", format_ms(floor.p50)),
+    ]
+    write_text_report(f"{basename}.txt", "Search Benchmark Report", meta, sections)
+    write_html_report(f"{basename}.html", "Search Benchmark Report",
+                      "University Finder API - /api/universities/search Query Workload", meta, cards, sections)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Query-workload benchmark for /api/universities/search")
+    parser.add_argument("--backend-url", default=BACKEND_URL)
+    parser.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="timed requests per query")
+    parser.add_argument("--sample", type=int, default=DEFAULT_SAMPLE, help="queries per query type")
+    parser.add_argument("--seed", type=int, default=0, help="seed for picking queries from the catalogue")
+    parser.add_argument("--history", default=DEFAULT_HISTORY_PATH,
+                        help="SQLite results history to append to (\"\" to skip)")
+    args = parser.parse_args()
+    backend_url = args.backend_url.rstrip('/')
+
+    print("=" * 70)
+    print("🔎 SEARCH QUERY-WORKLOAD BENCHMARK")
+    print("=" * 70)
+    with PooledHttpClient() as client:
+        universities = fetch_catalogue(client, backend_url)
+        queries = build_query_set(universities, max(1, args.sample), args.seed)
+        print(f"📍 Backend URL: {backend_url}")
+        print(f"📚 Catalogue: {len(universities)} records, {len(queries)} queries x {args.repeats} runs\n")
+        results, floor = run_benchmark(client, backend_url, queries, len(universities), universities,
+                                       max(1, args.repeats))
+
+    meta = [("Backend URL", backend_url), ("Catalogue Size", len(universities)),
+            ("Queries", len(queries)), ("Repeats", args.repeats), ("Seed", args.seed)]
+    generate_reports(results, floor, len(universities), meta)
+    if args.history:
+        save_history(results, backend_url, args.history)
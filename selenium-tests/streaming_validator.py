@@ -0,0 +1,330 @@
+"""
+Streaming Validation of the /api/universities Payload
+DevOps Lab - Section E
+
+response.json() parses the whole body into memory before any check runs.
+This module instead reads the response in chunks as bytes arrive, pulls
+the records out of the top-level "data" array one at a time, and checks
+each record against the fields of backendsample/src/models/UniversitySchema.js.
+Only one chunk plus the record being decoded is held in memory, so memory
+use stays flat however large the catalogue grows.
+
+Usage:
+    python streaming_validator.py --url http://localhost:5000/api/universities
+
+Author: DevOps Lab Project
+"""
+
+import argparse
+import codecs
+import json
+import time
+import tracemalloc
+
+from http_client import PooledHttpClient
+from perf_report import format_bytes
+from test_university_app import BACKEND_URL
+
+
+CHUNK_SIZE = 64 * 1024
+MAX_EXAMPLES = 5   # Violations kept per field for the report
+
+# Field types from UniversitySchema.js (String -> str, Number -> int/float)
+REQUIRED_FIELDS = {
+    'city': str,
+    'degree': str,
+    'discipline': str,
+    'id': str,
+    'province': str,
+    'title': str,
+}
+OPTIONAL_FIELDS = {
+    'admissions': str,
+    'contact': str,
+    'fee': (int, float),
+    'info': str,
+    'key': (int, float),
+    'logo': str,
+    'merit': (int, float),
+    'ranking': (int, float),
+    'status': (int, float),
+    'url': str,
+    'web': str,
+    'deadline': str,
+    'admission': str,
+    'map': dict,
+}
+MAP_FIELDS = {
+    'address': str,
+    'lat': (int, float),
+    'location': str,
+    'long': (int, float),
+}
+
+
+class StreamFormatError(ValueError):
+    """The byte stream is not the expected {"...": ..., "data": [...]} shape"""
+
+
+_WHITESPACE = " \t\n\r"
+_VALUE_DELIMITERS = ",]}" + _WHITESPACE
+
+
+def _type_ok(value, expected):
+    # bool is a subclass of int, but a JSON true/false is not a Number field
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, expected)
+
+
+def validate_university(record):
+    """Return a list of (field, problem) tuples for one university record"""
+    if not isinstance(record, dict):
+        return [("<record>", f"expected object, got {type(record).__name__}")]
+    problems = []
+    for field, expected in REQUIRED_FIELDS.items():
+        value = record.get(field)
+        if value is None or value == "":
+            problems.append((field, "required field missing"))
+        elif not _type_ok(value, expected):
+            problems.append((field, f"expected string, got {type(value).__name__}"))
+    for field, expected in OPTIONAL_FIELDS.items():
+        value = record.get(field)
+        if value is not None and not _type_ok(value, expected):
+            problems.append((field, f"unexpected type {type(value).__name__}"))
+    if isinstance(record.get('map'), dict):
+        for field, expected in MAP_FIELDS.items():
+            value = record['map'].get(field)
+            if value is not None and not _type_ok(value, expected):
+                problems.append((f"map.{field}", f"unexpected type {type(value).__name__}"))
+    return problems
+
+
+class JsonArrayStreamer:
+    """
+    Incrementally yield the elements of one array inside a top-level object.
+
+    Feed decoded text with feed(); it returns the elements completed so far.
+    Scalar members of the top-level object (e.g. "success", "count") are
+    collected in self.meta. Each element is decoded with raw_decode as soon
+    as its closing bracket has arrived, and consumed text is discarded.
+    """
+
+    def __init__(self, key='data'):
+        self.key = key
+        self.meta = {}
+        self.buffer = ""
+        self.pos = 0
+        # start -> object -> colon -> value (-> array) -> object ... -> done
+        self.state = 'start'
+        self.pending_key = None
+        self._decoder = json.JSONDecoder()
+
+    def _skip(self, chars=_WHITESPACE):
+        while self.pos < len(self.buffer) and self.buffer[self.pos] in chars:
+            self.pos += 1
+        return self.pos < len(self.buffer)
+
+    def _decode_value(self, final):
+        """Decode one JSON value at pos, or return (False, None) if incomplete"""
+        try:
+            value, end = self._decoder.raw_decode(self.buffer, self.pos)
+        except json.JSONDecodeError:
+            if final:
+                raise StreamFormatError(f"Malformed JSON near offset {self.pos}")
+            return False, None
+        # A number is only complete once a delimiter follows it: "3." or "1e"
+        # at a chunk boundary decodes as 3 / 1 with the rest still to come
+        if not final and not isinstance(value, (dict, list, str)) and \
+                (end >= len(self.buffer) or self.buffer[end] not in _VALUE_DELIMITERS):
+            return False, None
+        self.pos = end
+        return True, value
+
+    def feed(self, text, final=False):
+        self.buffer += text
+        items = []
+        while True:
+            if not self._skip():
+                break
+            char = self.buffer[self.pos]
+
+            if self.state == 'start':
+                if char != '{':
+                    raise StreamFormatError("Response body is not a JSON object")
+                self.pos += 1
+                self.state = 'object'
+
+            elif self.state == 'object':
+                if char == ',':
+                    self.pos += 1
+                elif char == '}':
+                    self.pos += 1
+                    self.state = 'done'
+                else:
+                    ok, key = self._decode_value(final)
+                    if not ok:
+                        break
+                    self.pending_key = key
+                    self.state = 'colon'
+
+            elif self.state == 'colon':
+                if char != ':':
+                    raise StreamFormatError(f"Expected ':' at offset {self.pos}")
+                self.pos += 1
+                self.state = 'value'
+
+            elif self.state == 'value':
+                if self.pending_key == self.key and char == '[':
+                    self.pos += 1
+                    self.state = 'array'
+                else:
+                    ok, value = self._decode_value(final)
+                    if not ok:
+                        break
+                    self.meta[self.pending_key] = value
+                    self.state = 'object'
+                self.pending_key = None
+
+            elif self.state == 'array':
+                if char == ',':
+                    self.pos += 1
+                elif char == ']':
+                    self.pos += 1
+                    self.state = 'object'
+                else:
+                    ok, value = self._decode_value(final)
+                    if not ok:
+                        break
+                    items.append(value)
+
+            else:  # done
+                break
+
+        # Drop consumed text so the buffer never grows beyond one record + chunk
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+        return items
+
+
+def iter_array_items(chunks, key='data', streamer=None):
+    """Yield array elements from an iterable of byte chunks"""
+    streamer = streamer or JsonArrayStreamer(key)
+    decoder = codecs.getincrementaldecoder('utf-8')()
+    for chunk in chunks:
+        yield from streamer.feed(decoder.decode(chunk))
+    yield from streamer.feed(decoder.decode(b"", final=True), final=True)
+    if streamer.state != 'done':
+        raise StreamFormatError("Response body ended before the JSON object was closed")
+
+
+class StreamingValidationResult:
+    """Outcome of one streaming validation run"""
+
+    def __init__(self):
+        self.records = 0
+        self.invalid_records = 0
+        self.bytes_read = 0
+        self.elapsed = 0.0
+        self.time_to_first_record = None
+        self.peak_memory = None    # Bytes, when measured
+        self.meta = {}
+        self.field_problems = {}    # field -> count
+        self.examples = []          # (record index, record id, field, problem)
+
+    @property
+    def records_per_second(self):
+        return self.records / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def count_matches(self):
+        """True when the record count agrees with the 'count' member (if sent)"""
+        return 'count' not in self.meta or self.meta['count'] == self.records
+
+    def summary(self):
+        return (f"{self.records} records, {self.invalid_records} invalid, "
+                f"{self.records_per_second:.0f} records/s, "
+                f"peak memory {format_bytes(self.peak_memory)}")
+
+
+def _stream_pass(client, url, key, validate, chunk_size):
+    """One download of url, validating each element of its `key` array"""
+    result = StreamingValidationResult()
+    streamer = JsonArrayStreamer(key)
+    start = time.perf_counter()
+    with client.get(url, stream=True) as response:
+        response.raise_for_status()
+
+        def counted_chunks():
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                result.bytes_read += len(chunk)
+                yield chunk
+
+        for record in iter_array_items(counted_chunks(), key, streamer):
+            if result.time_to_first_record is None:
+                result.time_to_first_record = time.perf_counter() - start
+            problems = validate(record) if validate else []
+            if problems:
+                result.invalid_records += 1
+                for field, problem in problems:
+                    result.field_problems[field] = result.field_problems.get(field, 0) + 1
+                    if len(result.examples) < MAX_EXAMPLES:
+                        record_id = record.get('_id', record.get('id')) if isinstance(record, dict) else None
+                        result.examples.append((result.records, record_id, field, problem))
+            result.records += 1
+    result.elapsed = time.perf_counter() - start
+    result.meta = streamer.meta
+    return result
+
+
+def stream_validate(client, url, key='data', validate=validate_university,
+                    chunk_size=CHUNK_SIZE, track_memory=True):
+    """
+    Download url in chunks and validate each element of its `key` array.
+
+    Timings come from a pass without tracing, since tracemalloc slows
+    every allocation. With track_memory, a second pass runs under
+    tracemalloc for the peak memory. tracemalloc is process-wide, so only
+    track memory when nothing else runs in the process; otherwise
+    peak_memory stays None.
+    """
+    result = _stream_pass(client, url, key, validate, chunk_size)
+    if track_memory:
+        tracemalloc.start()
+        try:
+            _stream_pass(client, url, key, validate, chunk_size)
+            result.peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def print_result(url, result):
+    print("=" * 70)
+    print("STREAMING VALIDATION RESULT")
+    print("=" * 70)
+    print(f"📍 URL: {url}")
+    print(f"✅ Records: {result.records} ({result.invalid_records} invalid)")
+    print(f"✅ Bytes read: {format_bytes(result.bytes_read)}")
+    print(f"⏱️ Elapsed: {result.elapsed:.3f}s, first record after "
+          f"{(result.time_to_first_record or 0) * 1000:.1f}ms")
+    print(f"⚡ Throughput: {result.records_per_second:.0f} records/s")
+    print(f"🧠 Peak memory: {format_bytes(result.peak_memory)}")
+    if not result.count_matches:
+        print(f"❌ 'count' says {result.meta['count']} but {result.records} records were streamed")
+    for field, count in result.field_problems.items():
+        print(f"❌ {field}: {count} violations")
+    for index, record_id, field, problem in result.examples:
+        print(f"   └─ record {index} ({record_id}): {field} - {problem}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Stream-validate the universities payload")
+    parser.add_argument("--url", default=f"{BACKEND_URL}/api/universities")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    with PooledHttpClient() as client:
+        outcome = stream_validate(client, args.url, chunk_size=args.chunk_size)
+    print_result(args.url, outcome)
+    exit(0 if outcome.invalid_records == 0 and outcome.count_matches else 1)
@@ -0,0 +1,616 @@
+"""
+Local Stand-in Backend for Offline Benchmarking
+DevOps Lab - Section E
+
+A multi-threaded HTTP server that answers the routes of
+backendsample/src/server.js from the bundled University dataset
+(frontendsample/campusfinder_cleaned.json, transformed the same way as
+backendsample/src/scripts/insertUniversities.js). No MongoDB and no
+network are needed, so the test suites, the load generator and the
+Selenium wait logic can run on a laptop.
+
+The university and discipline routes reproduce the controllers' filters,
+sorting, limits and response shapes. The auth, admin, company and contact
+routes return fixed stand-in responses. Like Express, JSON responses
+carry a weak ETag and conditional GETs get 304.
+
+Behaviour can be shaped per run:
+
+- latency:    a distribution for the injected delay (see parse_latency),
+              globally and per route
+- error rate: fraction of requests answered with a 500, globally and per
+              route
+- size:       --records N grows or shrinks the dataset to N records
+
+Every response carries a Server-Timing header (injected delay + handler
+time), so clients can separate server time from transfer time.
+
+Search patterns run in a helper process with a time limit, the way
+Mongo's maxTimeMS bounds a find: a pattern with catastrophic
+backtracking gets a 500 after --regex-time-limit instead of pinning a
+server thread forever.
+
+Usage:
+    python stub_server.py --port 5000 --latency lognormal:40:0.5 --error-rate 0.01
+    BACKEND_URL=http://localhost:5000 python test_university_app.py
+
+Author: DevOps Lab Project
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+
+DATASET_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir,
+                            'frontendsample', 'campusfinder_cleaned.json')
+DEFAULT_PORT = 5000
+DEFAULT_REGEX_TIME_LIMIT = 1.0  # Seconds a search pattern may run, like Mongo maxTimeMS
+
+# Fields the controllers' $regex searches look at
+SEARCH_FIELDS = ('title', 'city', 'province', 'discipline', 'degree')
+
+# Fields returned by the controllers that use .select(...)
+SUMMARY_FIELDS = ('_id', 'id', 'title', 'city', 'province', 'discipline', 'degree',
+                  'ranking', 'merit', 'fee', 'url')
+
+
+# ----------------------------------------------------------------------
+# Dataset
+# ----------------------------------------------------------------------
+
+def _object_id(index):
+    """Deterministic 24-hex-digit id in the shape of a MongoDB ObjectId"""
+    return f"65a1{index:020x}"
+
+
+def transform_university(raw, index):
+    """Same defaults and nested map as insertUniversities.js"""
+    return {
+        '_id': _object_id(index),
+        'admissions': raw.get('admissions') or "0.0",
+        'city': raw.get('city') or '',
+        'contact': raw.get('contact') or '',
+        'degree': raw.get('degree') or '',
+        'discipline': raw.get('discipline') or '',
+        'fee': raw.get('fee') or 0,
+        'id': raw.get('id') or '',
+        'info': raw.get('info') or '',
+        'key': raw.get('key') or 0,
+        'logo': raw.get('logo') or '',
+        'merit': raw.get('merit') or 0,
+        'province': raw.get('province') or '',
+        'ranking': raw.get('ranking') or 0,
+        'status': raw.get('status') or 1,
+        'title': raw.get('title') or '',
+        'url': raw.get('url') or '',
+        'web': raw.get('web') or '',
+        'deadline': raw.get('deadline') or '',
+        'admission': raw.get('admission') or '',
+        'map': {
+            'address': raw.get('map.address') or '',
+            'lat': raw.get('map.lat') or 0,
+            'location': raw.get('map.location') or raw.get('city') or '',
+            'long': raw.get('map.long') or 0,
+        },
+        '__v': 0,
+    }
+
+
+def load_universities(path=DATASET_PATH, records=None):
+    """
+    Load and transform the dataset. With records=N the list is cut or
+    repeated (with fresh ids) to exactly N entries.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        raw = json.load(f)
+    records = len(raw) if records is None else records
+    universities = []
+    for index in range(records):
+        university = transform_university(raw[index % len(raw)], index)
+        if index >= len(raw):
+            university['id'] = f"{university['id']}-{index // len(raw)}"
+        universities.append(university)
+    return universities
+
+
+# ----------------------------------------------------------------------
+# Latency and error injection
+# ----------------------------------------------------------------------
+
+def parse_latency(spec):
+    """
+    Build a delay sampler (returns seconds) from a spec in milliseconds:
+
+        none | fixed:MS | uniform:LOW:HIGH | normal:MEAN:SD |
+        lognormal:MEDIAN:SIGMA | exponential:MEAN | bimodal:FAST:SLOW:P_SLOW
+    """
+    parts = (spec or "none").split(':')
+    kind, args = parts[0].lower(), [float(p) for p in parts[1:]]
+    expected = {'none': 0, 'fixed': 1, 'uniform': 2, 'normal': 2, 'lognormal': 2,
+                'exponential': 1, 'bimodal': 3}
+    if kind not in expected:
+        raise ValueError(f"Unknown latency distribution '{kind}'")
+    if len(args) != expected[kind]:
+        raise ValueError(f"Latency '{kind}' takes {expected[kind]} parameter(s): {spec}")
+
+    if kind == 'none':
+        return lambda rng: 0.0
+    if kind == 'fixed':
+        return lambda rng: args[0] / 1000
+    if kind == 'uniform':
+        return lambda rng: rng.uniform(args[0], args[1]) / 1000
+    if kind == 'normal':
+        return lambda rng: max(0.0, rng.gauss(args[0], args[1])) / 1000
+    if kind == 'lognormal':
+        return lambda rng: rng.lognormvariate(math.log(max(args[0], 1e-3)), args[1]) / 1000
+    if kind == 'exponential':
+        return lambda rng: rng.expovariate(1 / args[0]) / 1000 if args[0] > 0 else 0.0
+    # bimodal: mostly FAST, occasionally SLOW (tail spikes)
+    return lambda rng: (args[1] if rng.random() < args[2] else args[0]) / 1000
+
+
+def _route_overrides(items, convert):
+    """Parse repeated PATH=VALUE options into {path: converted value}"""
+    overrides = {}
+    for item in items or ():
+        path, _, value = item.partition('=')
+        if not value:
+            raise ValueError(f"Expected PATH=VALUE, got '{item}'")
+        overrides[path] = convert(value)
+    return overrides
+
+
+class StubConfig:
+    """Injected latency / errors, resolved per route pattern"""
+
+    def __init__(self, latency="none", error_rate=0.0, route_latency=None,
+                 route_error_rate=None, seed=None):
+        self.latency = parse_latency(latency)
+        self.latency_spec = latency
+        self.error_rate = error_rate
+        self.route_latency = _route_overrides(route_latency, parse_latency)
+        self.route_error_rate = _route_overrides(route_error_rate, float)
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def delay_for(self, pattern, path):
+        sampler = self.route_latency.get(path, self.route_latency.get(pattern, self.latency))
+        with self._lock:
+            return sampler(self._rng)
+
+    def should_fail(self, pattern, path):
+        rate = self.route_error_rate.get(path, self.route_error_rate.get(pattern, self.error_rate))
+        if rate <= 0:
+            return False
+        with self._lock:
+            return self._rng.random() < rate
+
+
+# ----------------------------------------------------------------------
+# Route handlers (mirror backendsample/src/controllers)
+# ----------------------------------------------------------------------
+
+def _regex(pattern):
+    """JavaScript-style case-insensitive RegExp; errors surface as a 500 like Mongo's"""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+class RegexTimeout(Exception):
+    """A search pattern ran past the time limit (Mongo: MaxTimeMSExpired)"""
+
+
+def _match_worker(rows, connection):
+    """Matcher process: answer (pattern, columns) with the indexes of matching rows"""
+    while True:
+        request = connection.recv()
+        if request is None:
+            return
+        pattern, columns = request
+        regex = _regex(pattern)
+        connection.send([i for i, row in enumerate(rows) if any(regex.search(row[c]) for c in columns)])
+
+
+class RegexMatcher:
+    """
+    Runs case-insensitive searches over the text columns of every record in
+    a child process. Python's re cannot be interrupted, so a pattern that
+    is still running after time_limit is stopped by killing the process,
+    which is restarted on the next search.
+    """
+
+    def __init__(self, rows, time_limit=DEFAULT_REGEX_TIME_LIMIT):
+        self.rows = rows
+        self.time_limit = time_limit
+        self._lock = threading.Lock()
+        self._process = None
+        self._connection = None
+
+    def _start(self):
+        self._connection, child = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(target=_match_worker, args=(self.rows, child),
+                                                name="stub-regex", daemon=True)
+        self._process.start()
+        child.close()
+
+    def matching(self, pattern, columns):
+        """Indexes of the rows where pattern matches any of columns"""
+        _regex(pattern)     # Invalid patterns raise re.error here, not in the child
+        with self._lock:
+            if self._process is None or not self._process.is_alive():
+                self._start()
+            self._connection.send((pattern, columns))
+            if not self._connection.poll(self.time_limit):
+                self.close()
+                raise RegexTimeout(f"operation exceeded time limit ({self.time_limit * 1000:.0f}ms)")
+            return self._connection.recv()
+
+    def close(self):
+        if self._process is not None:
+            self._process.kill()
+            self._process.join()
+            self._connection.close()
+            self._process = None
+
+
+def _by_ranking(universities):
+    return sorted(universities, key=lambda u: u['ranking'])
+
+
+def _select(university, fields=SUMMARY_FIELDS):
+    return {field: university[field] for field in fields if field in university}
+
+
+def _list(universities):
+    return 200, {'success': True, 'count': len(universities), 'data': universities}
+
+
+def _int_param(value, default):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class UniversityApi:
+    """In-memory implementation of the university and discipline controllers"""
+
+    def __init__(self, universities, regex_time_limit=DEFAULT_REGEX_TIME_LIMIT):
+        self.universities = universities
+        self.by_object_id = {u['_id']: u for u in universities}
+        self.matcher = RegexMatcher([tuple(str(u[f]) for f in SEARCH_FIELDS) for u in universities],
+                                    regex_time_limit)
+
+    def _search(self, pattern, fields=SEARCH_FIELDS):
+        columns = [SEARCH_FIELDS.index(f) for f in fields]
+        return [self.universities[i] for i in self.matcher.matching(pattern, columns)]
+
+    def get_all(self, query, params):
+        result = self.universities
+        if query.get('search'):
+            result = self._search(query['search'])
+        for field in ('province', 'city', 'discipline', 'degree'):
+            if query.get(field):
+                result = [u for u in result if u[field] == query[field]]
+        return _list(_by_ranking(result))
+
+    def search(self, query, params):
+        if not query.get('query'):
+            return 400, {'success': False, 'error': 'Search query is required'}
+        limit = _int_param(query.get('limit'), 10)
+        matches = _by_ranking(self._search(query['query']))
+        # Mongo treats limit(0) as "no limit"
+        return _list(matches[:limit] if limit > 0 else matches)
+
+    def ranking(self, query, params):
+        result = self.universities
+        if query.get('minRank'):
+            result = [u for u in result if u['ranking'] >= _int_param(query['minRank'], 0)]
+        if query.get('maxRank'):
+            result = [u for u in result if u['ranking'] <= _int_param(query['maxRank'], 0)]
+        return _list(_by_ranking(result))
+
+    def top(self, query, params):
+        ranked = [u for u in self.universities if 1 <= u['ranking'] <= 100]
+        ranked.sort(key=lambda u: (u['ranking'], -u['merit']))
+        return _list([_select(u) for u in ranked[:5]])
+
+    def by_field(self, field):
+        def handler(query, params):
+            return _list([u for u in self.universities if u[field] == params[field]])
+        return handler
+
+    def by_discipline(self, query, params):
+        matches = [_select(u) for u in self._search(params['discipline'], ('discipline',))]
+        return _list(_by_ranking(matches))
+
+    def stats(self, query, params):
+        def counts(field):
+            totals = {}
+            for u in self.universities:
+                totals[u[field]] = totals.get(u[field], 0) + 1
+            return dict(sorted(totals.items(), key=lambda item: -item[1]))
+        return 200, {'success': True, 'total': len(self.universities), 'provinces': counts('province'),
+                     'cities': counts('city'), 'disciplines': counts('discipline')}
+
+    def by_id(self, query, params):
+        object_id = params['id']
+        if not re.fullmatch(r'[0-9a-fA-F]{24}', object_id):
+            return 500, {'success': False,
+                         'error': f'Cast to ObjectId failed for value "{object_id}" (type string) '
+                                  f'at path "_id" for model "University"'}
+        university = self.by_object_id.get(object_id.lower())
+        if university is None:
+            return 404, {'success': False, 'error': 'University not found'}
+        return 200, {'success': True, 'data': university}
+
+    def disciplines(self, query, params):
+        totals = {}
+        for u in self.universities:
+            if u['discipline']:
+                totals[u['discipline']] = totals.get(u['discipline'], 0) + 1
+        ordered = sorted(totals.items(), key=lambda item: (-item[1], item[0]))
+        return 200, {'success': True, 'count': len(ordered), 'data': [name for name, _ in ordered]}
+
+
+def _stub_read(query, params):
+    return 200, {'success': True, 'count': 0, 'data': []}
+
+
+def _stub_write(query, params):
+    return 200, {'success': True, 'message': 'Accepted by the local stand-in server'}
+
+
+def _stub_login(query, params):
+    return 401, {'success': False, 'message': 'Invalid email or password'}
+
+
+def build_routes(api):
+    """(method, pattern, handler) in server.js order - specific routes first"""
+    return [
+        ('POST', '/contact', _stub_write),
+        ('POST', '/login', _stub_login),
+        ('POST', '/register', _stub_write),
+        ('POST', '/google-register', _stub_write),
+        ('POST', '/google-login', _stub_login),
+        ('POST', '/forgot-password', _stub_write),
+        ('POST', '/reset-password', _stub_write),
+        ('GET', '/verify-reset-token/:token', _stub_read),
+        ('POST', '/admin/login', _stub_login),
+        ('POST', '/admin/register', _stub_write),
+        ('POST', '/candidate/verify', _stub_login),
+        ('GET', '/api/universities/search', api.search),
+        ('GET', '/api/universities/ranking', api.ranking),
+        ('GET', '/api/universities/top', api.top),
+        ('GET', '/api/universities/city/:city', api.by_field('city')),
+        ('GET', '/api/universities/province/:province', api.by_field('province')),
+        ('GET', '/api/universities/discipline/:discipline', api.by_discipline),
+        ('GET', '/api/universities', api.get_all),
+        ('GET', '/api/universities/stats', api.stats),
+        ('GET', '/api/universities/:id', api.by_id),
+        ('GET', '/api/disciplines', api.disciplines),
+        ('GET', '/admin/contacts', _stub_read),
+        ('GET', '/admin/contacts/:id', _stub_read),
+        ('PUT', '/admin/contacts/:id/status', _stub_write),
+        ('DELETE', '/admin/contacts/:id', _stub_write),
+        ('GET', '/admin/dashboard', _stub_read),
+        ('GET', '/admin/companies', _stub_read),
+        ('POST', '/admin/companies', _stub_write),
+        ('PUT', '/admin/companies/:id', _stub_write),
+        ('DELETE', '/admin/companies/:id', _stub_write),
+        ('PUT', '/admin/companies/:companyId/status', _stub_write),
+        ('GET', '/company/profile', _stub_read),
+        ('PUT', '/company/profile/update-name', _stub_write),
+        ('PUT', '/company/profile/update-email', _stub_write),
+        ('PUT', '/company/password/change', _stub_write),
+        ('GET', '/company/team', _stub_read),
+        ('GET', '/company/team/member/:id', _stub_read),
+        ('POST', '/company/team/invite', _stub_write),
+        ('PUT', '/company/team/resend/:id', _stub_write),
+        ('DELETE', '/company/team/cancel/:id', _stub_write),
+    ]
+
+
+def _compile(pattern):
+    regex = re.sub(r':(\w+)', r'(?P<\1>[^/]+)', pattern)
+    return re.compile(f"^{regex}/?$")
+
+
+def express_etag(body):
+    """Weak ETag in the format Express generates for res.json()"""
+    digest = base64.b64encode(hashlib.sha1(body).digest()).decode('ascii')[:27]
+    return f'W/"{len(body):x}-{digest}"'
+
+
+# ----------------------------------------------------------------------
+# Server
+# ----------------------------------------------------------------------
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"   # keep-alive, like Node
+    # Headers and body are written separately; without TCP_NODELAY, Nagle +
+    # delayed ACK would add ~40ms to every response
+    disable_nagle_algorithm = True
+    server_version = "StubServer"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status, body=b"", headers=()):
+        self.send_response(status)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("X-Powered-By", "Express")
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body and self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def _dispatch(self, method):
+        started = time.perf_counter()
+        parts = urlsplit(self.path)
+        path = unquote(parts.path)
+        query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+        # Drain any request body so keep-alive connections stay in sync
+        length = int(self.headers.get('Content-Length') or 0)
+        if length:
+            self.rfile.read(length)
+
+        pattern, status, payload = None, 404, {
+            'success': False, 'message': f"Route {method} {path} not found"}
+        for route_method, route_pattern, regex, handler in self.server.routes:
+            match = regex.match(path) if route_method == method else None
+            if match:
+                pattern = route_pattern
+                try:
+                    status, payload = handler(query, {k: unquote(v) for k, v in match.groupdict().items()})
+                except re.error as e:
+                    status, payload = 500, {'success': False, 'error': f"Invalid regular expression: {e}"}
+                except RegexTimeout as e:
+                    status, payload = 500, {'success': False, 'error': str(e)}
+                break
+
+        config = self.server.config
+        delay = config.delay_for(pattern, path)
+        if pattern and config.should_fail(pattern, path):
+            status, payload = 500, {'success': False, 'message': 'Internal server error',
+                                    'error': 'Something went wrong'}
+        if delay > 0:
+            time.sleep(delay)
+        self.server.count_request(status)
+
+        body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        handler_ms = (time.perf_counter() - started) * 1000 - delay * 1000
+        headers = [("Content-Type", "application/json; charset=utf-8"),
+                   ("Server-Timing", f"delay;dur={delay * 1000:.1f}, app;dur={max(handler_ms, 0):.1f}")]
+        if method in ('GET', 'HEAD') and status == 200:
+            etag = express_etag(body)
+            headers.append(("ETag", etag))
+            if etag in (self.headers.get('If-None-Match') or ''):
+                self._send(304, headers=[h for h in headers if h[0] != "Content-Type"])
+                return
+        self._send(status, body, headers)
+
+    def do_OPTIONS(self):
+        # cors() preflight
+        self._send(204, headers=[("Access-Control-Allow-Methods", "GET,HEAD,PUT,PATCH,POST,DELETE"),
+                                 ("Access-Control-Allow-Headers",
+                                  self.headers.get('Access-Control-Request-Headers') or "*")])
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_HEAD(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+
+class StubServer(ThreadingHTTPServer):
+    """Threaded stand-in backend; use as a context manager to run it in the background"""
+
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, config=None, universities=None,
+                 verbose=False, regex_time_limit=DEFAULT_REGEX_TIME_LIMIT):
+        super().__init__((host, port), StubRequestHandler)
+        self.config = config or StubConfig()
+        self.universities = universities if universities is not None else load_universities()
+        self.api = UniversityApi(self.universities, regex_time_limit)
+        self.routes = [(method, pattern, _compile(pattern), handler)
+                       for method, pattern, handler in build_routes(self.api)]
+        self.verbose = verbose
+        self.status_counts = {}
+        self._count_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count_request(self, status):
+        with self._count_lock:
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def server_close(self):
+        super().server_close()
+        self.api.matcher.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local stand-in for the University Finder backend")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency", default="none",
+                        help="delay distribution in ms, e.g. fixed:50, uniform:20:80, normal:50:10, "
+                             "lognormal:40:0.5, exponential:50, bimodal:20:800:0.02")
+    parser.add_argument("--route-latency", action="append", metavar="PATH=SPEC",
+                        help="per-route delay, e.g. /api/universities=lognormal:120:0.4 (repeatable)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 500")
+    parser.add_argument("--route-error-rate", action="append", metavar="PATH=RATE",
+                        help="per-route error rate, e.g. /api/universities/search=0.1 (repeatable)")
+    parser.add_argument("--records", type=int, help="serve exactly this many university records")
+    parser.add_argument("--dataset", default=DATASET_PATH)
+    parser.add_argument("--seed", type=int, help="random seed for repeatable latency/error sequences")
+    parser.add_argument("--regex-time-limit", type=float, default=DEFAULT_REGEX_TIME_LIMIT,
+                        help="seconds a search pattern may run before the request fails with a 500")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    stub_config = StubConfig(args.latency, args.error_rate, args.route_latency,
+                             args.route_error_rate, args.seed)
+    server = StubServer(args.host, args.port, stub_config,
+                        load_universities(args.dataset, args.records), args.verbose, args.regex_time_limit)
+    print("=" * 70)
+    print("🧪 UNIVERSITY FINDER - LOCAL STAND-IN BACKEND")
+    print("=" * 70)
+    print(f"URL:        {server.url}")
+    print(f"Records:    {len(server.universities)}")
+    print(f"Latency:    {args.latency}" + (f" (+{len(stub_config.route_latency)} route overrides)"
+                                            if stub_config.route_latency else ""))
+    print(f"Error rate: {args.error_rate:.1%}" + (f" (+{len(stub_config.route_error_rate)} route overrides)"
+                                                  if stub_config.route_error_rate else ""))
+    print("=" * 70)
+    print(f"👉 BACKEND_URL={server.url} python test_university_app.py")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 Stopping stand-in server")
+    finally:
+        server.server_close()
+        print(f"📊 Responses by status: {server.status_counts}")
@@ -9,15 +9,23 @@ Author: DevOps Lab Project
 Date: December 2025
 """
 
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from concurrent.futures import ThreadPoolExecutor
+import argparse
+import html
+import threading
 import time
 import sys
 
+from driver_pool import DriverPool, create_driver, reset_driver
+from network_capture import NetworkCaptureStore, is_api_request, waterfall_html
+from perf_budgets import (DEFAULT_BUDGETS_PATH, BudgetMeasurement, budget_table_html, budget_violations,
+                          evaluate_budgets, load_budgets, print_budget_results)
+from perf_report import format_bytes
+from page_metrics import METRICS, METRIC_LABELS, PageMetricsStore, format_metric, rate_metric
+from wait_engine import WaitEngine
+
 # ==========================================
 # CONFIGURATION
 # ==========================================
@@ -25,24 +33,40 @@ FRONTEND_URL = "http://4.213.223.12"
 BACKEND_URL = "http://135.235.246.98:5000"
 TIMEOUT = 15
 
+# Per-test wait timeouts (seconds); tests not listed use TIMEOUT
+TEST_TIMEOUTS = {
+    'test_01_homepage_loads': 20,
+    'test_02_navigation_functionality': 15,
+    'test_03_login_form_elements': 10,
+    'test_04_backend_api_connectivity': 15,
+    'test_05_responsive_design': 10,
+    'test_06_search_functionality': 15,
+}
+
 test_results = []
+# Cold (launch) vs. warm (reset) browser start times of the last run
+startup_stats = {}
+# Navigation Timing / Web Vitals samples per frontend route
+page_metrics = PageMetricsStore()
+# Network waterfall and API-call issues of the last visit to each route
+network_capture = NetworkCaptureStore(api_origins=(BACKEND_URL,))
+# Route budget checks of the last run (see performance-budgets.json)
+budget_checks = []
+_results_lock = threading.Lock()
+# Remembers the last result logged on each thread so runners can annotate it
+_thread_state = threading.local()
 
-def setup_driver():
-    """Initialize Chrome WebDriver with options"""
+def setup_driver(headless=True):
+    """Initialize Chrome WebDriver with options (headless by default)"""
     print("\n🔧 Setting up Chrome WebDriver...")
-    chrome_options = Options()
-    # chrome_options.add_argument('--headless')  # Uncomment for headless mode
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--window-size=1920,1080')
-    chrome_options.add_argument('--start-maximized')
-    
-    driver = webdriver.Chrome(options=chrome_options)
-    driver.implicitly_wait(TIMEOUT)
+    driver = create_driver(headless=headless, implicit_wait=TIMEOUT)
     print("✅ Chrome WebDriver initialized\n")
     return driver
 
+def create_driver_pool(size=1, headless=True):
+    """Pre-launch size browsers that are reset, not restarted, between tests"""
+    return DriverPool(size, headless=headless, origins=(FRONTEND_URL, BACKEND_URL))
+
 def log_test_result(test_name, status, message=""):
     """Log and display test results"""
     result = {
@@ -51,17 +75,70 @@ def log_test_result(test_name, status, message=""):
         'message': message,
         'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
     }
-    test_results.append(result)
+    with _results_lock:
+        test_results.append(result)
+    _thread_state.last_result = result
     status_symbol = "✅" if status == "PASS" else "❌"
     print(f"{status_symbol} {test_name}: {status}")
     if message:
         print(f"   └─ {message}")
 
+def last_logged_result():
+    """Result most recently logged by the current thread"""
+    return getattr(_thread_state, 'last_result', None)
+
+def reset_browser_state(driver):
+    """Clear cookies, cache and site storage so the next test starts from a clean browser"""
+    reset_driver(driver, (FRONTEND_URL, BACKEND_URL))
+
+def record_startup_stats(pool):
+    startup_stats.clear()
+    startup_stats.update(pool.startup_summary())
+    print(f"🔥 Browser starts: {startup_stats['cold_starts']} cold "
+          f"(avg {startup_stats['cold_avg']:.2f}s), {startup_stats['warm_starts']} warm "
+          f"(avg {startup_stats['warm_avg']:.2f}s), ~{startup_stats['saved']:.1f}s saved")
+
+def capture_route_metrics(driver, route):
+    """Record the timings (TTFB, DCL, load, FCP, LCP, CLS) and network requests of the page just loaded"""
+    metrics = page_metrics.capture(driver, route)
+    network_capture.capture(driver, route)
+    return metrics
+
+def route_measurements():
+    """
+    Per-route load time samples, transferred bytes and failed requests.
+    Only the page document and API calls count towards the error rate; a
+    missing favicon or a third-party 4xx is not a broken route.
+    """
+    measurements = {}
+    for route, samples in page_metrics.samples.items():
+        measurement = measurements.setdefault(route, BudgetMeasurement())
+        for sample in samples:
+            if sample.get('load') is not None:
+                measurement.histogram.record(sample['load'] / 1000)
+    for route, capture in network_capture.pages.items():
+        measurement = measurements.setdefault(route, BudgetMeasurement())
+        requests_made = capture['requests']
+        measurement.max_bytes = sum(r['size'] for r in requests_made)
+        checked = [r for r in requests_made
+                   if r['type'] == 'Document' or is_api_request(r, network_capture.api_origins)]
+        measurement.errors = sum(1 for r in checked if r['failed'] or (r['status'] or 0) >= 400)
+        measurement.count = len(checked)
+    return measurements
+
+def check_route_budgets(budgets_path=DEFAULT_BUDGETS_PATH):
+    """Evaluate the frontend route budgets; returns True when none is exceeded"""
+    budgets = load_budgets(budgets_path)
+    budget_checks[:] = evaluate_budgets(budgets.get('routes', {}), route_measurements()) if budgets else []
+    if not budget_checks:
+        return True
+    return print_budget_results(budget_checks)
+
 # ==========================================
 # TEST CASES
 # ==========================================
 
-def test_01_homepage_loads(driver):
+def test_01_homepage_loads(driver, wait):
     """Test Case 1: Verify Homepage Loads Successfully"""
     test_name = "Test 1: Homepage Loads Successfully"
     print(f"\n🧪 Running {test_name}...")
@@ -69,11 +146,10 @@ def test_01_homepage_loads(driver):
         start_time = time.time()
         driver.get(FRONTEND_URL)
         
-        # Wait for page to load
-        WebDriverWait(driver, TIMEOUT).until(
-            EC.presence_of_element_located((By.TAG_NAME, "body"))
-        )
+        # Wait for React to render and the page's requests to settle
+        wait.for_page()
         load_time = time.time() - start_time
+        capture_route_metrics(driver, '/')
         
         # Get page title
         page_title = driver.title
@@ -97,13 +173,14 @@ def test_01_homepage_loads(driver):
         log_test_result(test_name, "FAIL", str(e))
         return False
 
-def test_02_navigation_functionality(driver):
+def test_02_navigation_functionality(driver, wait):
     """Test Case 2: Test Navigation and Routing"""
     test_name = "Test 2: Navigation Functionality"
     print(f"\n🧪 Running {test_name}...")
     try:
         driver.get(FRONTEND_URL)
-        time.sleep(2)
+        wait.for_page()
+        capture_route_metrics(driver, '/')
         
         # Test navigation to different pages
         pages_to_test = [
@@ -117,7 +194,8 @@ def test_02_navigation_functionality(driver):
             try:
                 full_url = FRONTEND_URL + path
                 driver.get(full_url)
-                time.sleep(2)
+                wait.for_page()
+                capture_route_metrics(driver, path)
                 
                 # Verify URL changed
                 current_url = driver.current_url
@@ -135,13 +213,14 @@ def test_02_navigation_functionality(driver):
         log_test_result(test_name, "FAIL", str(e))
         return False
 
-def test_03_login_form_elements(driver):
+def test_03_login_form_elements(driver, wait):
     """Test Case 3: Validate Login Form Elements"""
     test_name = "Test 3: Login Form Elements"
     print(f"\n🧪 Running {test_name}...")
     try:
         driver.get(f"{FRONTEND_URL}/login")
-        time.sleep(3)
+        wait.for_page()
+        capture_route_metrics(driver, '/login')
         
         # Check page source for form elements
         page_source = driver.page_source.lower()
@@ -170,7 +249,7 @@ def test_03_login_form_elements(driver):
         log_test_result(test_name, "FAIL", str(e))
         return False
 
-def test_04_backend_api_connectivity(driver):
+def test_04_backend_api_connectivity(driver, wait):
     """Test Case 4: Verify Backend API Connectivity"""
     test_name = "Test 4: Backend API Connectivity"
     print(f"\n🧪 Running {test_name}...")
@@ -178,7 +257,7 @@ def test_04_backend_api_connectivity(driver):
         # Test backend API endpoint directly
         api_url = f"{BACKEND_URL}/api/universities"
         driver.get(api_url)
-        time.sleep(2)
+        wait.for_document_ready()
         
         # Check if JSON data is displayed
         body_text = driver.find_element(By.TAG_NAME, "body").text.lower()
@@ -191,7 +270,8 @@ def test_04_backend_api_connectivity(driver):
         
         # Navigate to frontend page that uses API
         driver.get(f"{FRONTEND_URL}/company/hero-section")
-        time.sleep(3)
+        wait.for_page()
+        capture_route_metrics(driver, '/company/hero-section')
         
         # Verify page loaded with content
         page_content = driver.find_element(By.TAG_NAME, "body").text
@@ -204,29 +284,29 @@ def test_04_backend_api_connectivity(driver):
         log_test_result(test_name, "FAIL", str(e))
         return False
 
-def test_05_responsive_design(driver):
+def test_05_responsive_design(driver, wait):
     """Test Case 5: Test Responsive Design"""
     test_name = "Test 5: Responsive Design"
     print(f"\n🧪 Running {test_name}...")
     try:
         driver.get(FRONTEND_URL)
-        time.sleep(2)
+        wait.for_page()
         
         # Test Mobile View (iPhone X)
         driver.set_window_size(375, 812)
-        time.sleep(1)
+        wait.for_viewport(375, 812)
         assert driver.find_element(By.TAG_NAME, "body").is_displayed()
         print("   ✓ Mobile view (375x812) validated")
         
         # Test Tablet View (iPad)
         driver.set_window_size(768, 1024)
-        time.sleep(1)
+        wait.for_viewport(768, 1024)
         assert driver.find_element(By.TAG_NAME, "body").is_displayed()
         print("   ✓ Tablet view (768x1024) validated")
         
         # Reset to Desktop
         driver.set_window_size(1920, 1080)
-        time.sleep(1)
+        wait.for_viewport(1920, 1080)
         print("   ✓ Desktop view (1920x1080) validated")
         
         log_test_result(test_name, "PASS", "Responsive design verified across 3 viewports")
@@ -235,13 +315,14 @@ def test_05_responsive_design(driver):
         log_test_result(test_name, "FAIL", str(e))
         return False
 
-def test_06_search_functionality(driver):
+def test_06_search_functionality(driver, wait):
     """Test Case 6: Test Search/Hero Section"""
     test_name = "Test 6: Search Functionality"
     print(f"\n🧪 Running {test_name}...")
     try:
         driver.get(f"{FRONTEND_URL}/company/hero-section")
-        time.sleep(3)
+        wait.for_page(route="hero")
+        capture_route_metrics(driver, '/company/hero-section')
         
         # Verify page loaded
         current_url = driver.current_url
@@ -265,6 +346,15 @@ def test_06_search_functionality(driver):
         log_test_result(test_name, "FAIL", str(e))
         return False
 
+TESTS = [
+    test_01_homepage_loads,
+    test_02_navigation_functionality,
+    test_03_login_form_elements,
+    test_04_backend_api_connectivity,
+    test_05_responsive_design,
+    test_06_search_functionality
+]
+
 # ==========================================
 # REPORT GENERATION
 # ==========================================
@@ -275,6 +365,61 @@ def generate_html_report():
     passed = sum(1 for r in test_results if r['status'] == 'PASS')
     failed = total - passed
     success_rate = (passed / total * 100) if total > 0 else 0
+    total_wait = sum(r.get('wait_time', 0) for r in test_results)
+    route_metrics_html = ""
+    if page_metrics:
+        header_cells = "".join(f"<th>{METRIC_LABELS[m]}</th>" for m in METRICS)
+        rows_html = ""
+        for route, row in page_metrics.summary().items():
+            cells = "".join(
+                f'<td class="{rate_metric(m, row[m]) or ""}">{format_metric(m, row[m])}</td>'
+                for m in METRICS)
+            rows_html += f"<tr><td><strong>{route}</strong></td><td>{row['samples']}</td>{cells}</tr>"
+        route_metrics_html = f"""
+        <div class="route-metrics">
+            <h2>📐 Navigation Timing &amp; Web Vitals</h2>
+            <table>
+                <tr><th>Route</th><th>Samples</th>{header_cells}</tr>
+                {rows_html}
+            </table>
+            <p style="color: #999; font-size: 0.9em; margin-top: 10px;">Median per route, milliseconds from navigation start (CLS is unitless). Colours use the web.dev good / poor thresholds.</p>
+        </div>"""
+    budgets_html = ""
+    if budget_checks:
+        budgets_html = f"""
+        <div class="route-metrics">
+            <h2>🎯 Performance Budgets</h2>
+            <p style="color: #666; margin-top: 10px;">{len(budget_violations(budget_checks))} of {len(budget_checks)} checks over budget (route latency is the Navigation Timing load time)</p>
+{budget_table_html(budget_checks, "budget-table")}
+        </div>"""
+    network_html = ""
+    if network_capture:
+        network_html = """
+        <div class="network">
+            <h2>🌐 Network Waterfall</h2>"""
+        for route, capture in network_capture.pages.items():
+            requests_made = capture['requests']
+            issues_html = "".join(
+                f'<div class="issue">⚠ <strong>{issue["kind"]}</strong>: {html.escape(issue["url"])} - {html.escape(issue["detail"])}</div>'
+                for issue in capture['issues'])
+            network_html += f"""
+            <h3>{route} <span style="color: #999; font-weight: normal;">({len(requests_made)} requests, {format_bytes(sum(r['size'] for r in requests_made))})</span></h3>
+            {issues_html}{waterfall_html(requests_made, network_capture.api_origins)}"""
+        network_html += """
+        </div>"""
+    startup_cards = ""
+    if startup_stats:
+        startup_cards = f"""
+            <div class="stat-card">
+                <h3>Cold Start (avg)</h3>
+                <div class="value">{startup_stats['cold_avg']:.2f}s</div>
+                <p>{startup_stats['cold_starts']} browser launch(es)</p>
+            </div>
+            <div class="stat-card">
+                <h3>Warm Start (avg)</h3>
+                <div class="value">{startup_stats['warm_avg']:.2f}s</div>
+                <p>{startup_stats['warm_starts']} reuse(s), ~{startup_stats['saved']:.1f}s saved</p>
+            </div>"""
     
     html_content = f"""<!DOCTYPE html>
 <html lang="en">
@@ -344,6 +489,26 @@ def generate_html_report():
             color: white;
             font-weight: bold;
         }}
+        .route-metrics {{ padding: 40px 40px 0; }}
+        .route-metrics table {{ width: 100%; border-collapse: collapse; margin-top: 15px; }}
+        .route-metrics th, .route-metrics td {{ padding: 10px; border-bottom: 1px solid #e0e0e0; text-align: right; }}
+        .route-metrics th:first-child, .route-metrics td:first-child {{ text-align: left; }}
+        .route-metrics th {{ background: #f5f7fa; }}
+        .route-metrics td.good {{ color: #11998e; font-weight: bold; }}
+        .route-metrics td.needs-improvement {{ color: #f39c12; font-weight: bold; }}
+        .route-metrics td.poor {{ color: #eb3349; font-weight: bold; }}
+        .network {{ padding: 40px 40px 0; }}
+        .network h3 {{ margin-top: 25px; }}
+        .network .issue {{ background: #fff4e5; border-left: 4px solid #f39c12; padding: 8px 12px; margin-top: 8px; border-radius: 5px; }}
+        .waterfall {{ width: 100%; border-collapse: collapse; margin-top: 10px; font-size: 0.85em; table-layout: fixed; }}
+        .waterfall th, .waterfall td {{ padding: 6px; border-bottom: 1px solid #eee; text-align: left; overflow: hidden; white-space: nowrap; text-overflow: ellipsis; }}
+        .waterfall th {{ background: #f5f7fa; }}
+        .waterfall th:first-child {{ width: 35%; }}
+        .waterfall .bar-cell {{ width: 30%; }}
+        .waterfall .bar {{ height: 12px; border-radius: 3px; }}
+        .budget-table {{ width: 100%; border-collapse: collapse; margin-top: 15px; }}
+        .budget-table th, .budget-table td {{ padding: 10px; border-bottom: 1px solid #e0e0e0; text-align: left; }}
+        .budget-table th {{ background: #f5f7fa; }}
         .test-results {{ padding: 40px; }}
         .test-case {{
             background: white;
@@ -400,12 +565,16 @@ def generate_html_report():
                 <h3>Success Rate</h3>
                 <div class="value">{success_rate:.1f}%</div>
             </div>
+            <div class="stat-card">
+                <h3>Time Waiting</h3>
+                <div class="value">{total_wait:.1f}s</div>
+            </div>{startup_cards}
         </div>
         <div style="padding: 0 40px;">
             <div class="progress-bar">
                 <div class="progress-fill">{success_rate:.1f}%</div>
             </div>
-        </div>
+        </div>{route_metrics_html}{budgets_html}{network_html}
         <div class="test-results">
             <h2>📋 Test Cases</h2>
 """
@@ -421,6 +590,7 @@ def generate_html_report():
                     <div class="test-status {status_class}">{result['status']}</div>
                 </div>
                 <div style="color: #666;">📝 {result['message']}</div>
+                <div style="color: #999; font-size: 0.9em; margin-top: 10px;">⏳ Waited: {result.get('wait_time', 0):.2f}s{f" · 🧵 {result['worker']}" if result.get('worker') else ""}</div>
                 <div style="color: #999; font-size: 0.9em; margin-top: 10px;">🕐 {result['timestamp']}</div>
             </div>
 """
@@ -441,13 +611,17 @@ def generate_html_report():
         f.write(html_content)
     
     print(f"\n📄 HTML report saved to: selenium-test-report.html")
+    if page_metrics:
+        print(f"📐 Page metrics saved to: {page_metrics.save()}")
+    if network_capture:
+        print(f"🌐 Network capture saved to: {network_capture.save()}")
 
 # ==========================================
 # MAIN EXECUTION
 # ==========================================
 
-def run_all_tests():
-    """Run all Selenium test cases"""
+def run_all_tests(pause=0, headless=True, budgets_path=DEFAULT_BUDGETS_PATH):
+    """Run all Selenium test cases on one pooled browser, reset between tests"""
     print("=" * 70)
     print("🚀 UNIVERSITY FINDER - SELENIUM TEST SUITE")
     print("=" * 70)
@@ -455,23 +629,27 @@ def run_all_tests():
     print(f"Backend URL:  {BACKEND_URL}")
     print("=" * 70)
     
-    driver = setup_driver()
+    pool = create_driver_pool(1, headless=headless)
+    driver = pool.acquire()
+    wait = WaitEngine(driver, timeout=TIMEOUT)
     passed = 0
     
-    tests = [
-        test_01_homepage_loads,
-        test_02_navigation_functionality,
-        test_03_login_form_elements,
-        test_04_backend_api_connectivity,
-        test_05_responsive_design,
-        test_06_search_functionality
-    ]
+    tests = TESTS
     
     try:
-        for test in tests:
-            if test(driver):
+        for index, test in enumerate(tests):
+            if index > 0:
+                # Warm start: reset the same browser instead of relaunching it
+                pool.release(driver)
+                reused = pool.acquire()
+                if reused is not driver:
+                    driver, wait = reused, WaitEngine(reused, timeout=TIMEOUT)
+            wait.start_test(test.__name__, TEST_TIMEOUTS.get(test.__name__))
+            if test(driver, wait):
                 passed += 1
-            time.sleep(1)
+            waited = wait.time_waited(test.__name__)
+            last_logged_result()['wait_time'] = waited
+            print(f"   ⏳ Waited: {waited:.2f}s")
         
         print("\n" + "=" * 70)
         print("📊 TEST EXECUTION SUMMARY")
@@ -480,19 +658,112 @@ def run_all_tests():
         print(f"✅ Passed: {passed}")
         print(f"❌ Failed: {len(tests) - passed}")
         print(f"📈 Success Rate: {(passed/len(tests)*100):.1f}%")
+        print(f"⏳ Total Wait Time: {sum(wait.wait_times.values()):.2f}s")
+        record_startup_stats(pool)
         print("=" * 70)
+        budgets_ok = check_route_budgets(budgets_path)
         
         # Generate HTML report
         generate_html_report()
         
-        print("\n📸 PAUSING FOR 10 SECONDS... TAKE SCREENSHOTS!")
-        print("   Browser will remain open for screenshot capture...")
-        time.sleep(10)
+        if pause > 0:
+            print(f"\n📸 PAUSING FOR {pause} SECONDS... TAKE SCREENSHOTS!")
+            print("   Browser will remain open for screenshot capture...")
+            time.sleep(pause)
         
     finally:
         print("\n🔧 Closing browser...")
-        driver.quit()
+        pool.close()
         print("✅ Test execution complete!")
+    return passed == len(tests) and budgets_ok
+
+def run_all_tests_parallel(workers=2, budgets_path=DEFAULT_BUDGETS_PATH):
+    """
+    Run the Selenium tests sharded across a pool of headless Chrome workers.
+    
+    The browsers are pre-launched together by a DriverPool. Tests are
+    handed out as browsers become free, and each browser is reset after
+    every test so the next one never sees cookies, storage, cache or
+    window size left by another test.
+    Results are merged back into test_results in the original test order,
+    so the report matches a serial run.
+    """
+    print("=" * 70)
+    print("🚀 UNIVERSITY FINDER - SELENIUM TEST SUITE (PARALLEL)")
+    print("=" * 70)
+    print(f"Frontend URL: {FRONTEND_URL}")
+    print(f"Backend URL:  {BACKEND_URL}")
+    print(f"Workers:      {workers}")
+    print("=" * 70)
+    
+    pool = create_driver_pool(workers, headless=True)
+    engines = {}
+    engines_lock = threading.Lock()
+    
+    def wait_engine_for(driver):
+        with engines_lock:
+            if driver not in engines:
+                engines[driver] = WaitEngine(driver, timeout=TIMEOUT)
+            return engines[driver]
+    
+    def run_one(index, test):
+        with pool.session() as driver:
+            wait = wait_engine_for(driver)
+            wait.start_test(test.__name__, TEST_TIMEOUTS.get(test.__name__))
+            test_start = time.time()
+            ok = test(driver, wait)
+            result = last_logged_result()
+            result['wait_time'] = wait.time_waited(test.__name__)
+            result['duration'] = time.time() - test_start
+            result['worker'] = threading.current_thread().name
+        return index, ok, result
+    
+    wall_start = time.time()
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="chrome-worker") as executor:
+            outcomes = list(executor.map(lambda item: run_one(*item), enumerate(TESTS)))
+    finally:
+        print("\n🔧 Closing browsers...")
+        pool.close()
+    wall_time = time.time() - wall_start
+    
+    # Merge back in declaration order, exactly as a serial run would log them
+    with _results_lock:
+        test_results[:] = [result for _, _, result in sorted(outcomes, key=lambda o: o[0])]
+    passed = sum(1 for _, ok, _ in outcomes if ok)
+    serial_time = sum(r['duration'] for r in test_results)
+    
+    print("\n" + "=" * 70)
+    print("📊 TEST EXECUTION SUMMARY")
+    print("=" * 70)
+    print(f"Total Tests: {len(TESTS)}")
+    print(f"✅ Passed: {passed}")
+    print(f"❌ Failed: {len(TESTS) - passed}")
+    print(f"📈 Success Rate: {(passed/len(TESTS)*100):.1f}%")
+    print(f"⏱️ Wall Time: {wall_time:.2f}s (sum of test times: {serial_time:.2f}s, "
+          f"speed-up {serial_time / wall_time if wall_time else 0:.1f}x)")
+    record_startup_stats(pool)
+    print("=" * 70)
+    budgets_ok = check_route_budgets(budgets_path)
+    
+    generate_html_report()
+    print("✅ Test execution complete!")
+    return passed == len(TESTS) and budgets_ok
 
 if __name__ == "__main__":
-    run_all_tests()
+    parser = argparse.ArgumentParser(description="University Finder Selenium test suite")
+    parser.add_argument("--pause", type=float, default=0,
+                        help="keep the browser open this many seconds at the end (for screenshots)")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="run tests in parallel on this many headless Chrome workers")
+    parser.add_argument("--headed", action="store_true",
+                        help="show the browser window (implied by --pause)")
+    parser.add_argument("--budgets", default=DEFAULT_BUDGETS_PATH,
+                        help="performance budgets file (\"\" to skip budget checks)")
+    args = parser.parse_args()
+    if args.workers > 1:
+        success = run_all_tests_parallel(workers=args.workers, budgets_path=args.budgets)
+    else:
+        success = run_all_tests(pause=args.pause, headless=not (args.headed or args.pause > 0),
+                                budgets_path=args.budgets)
+    sys.exit(0 if success else 1)
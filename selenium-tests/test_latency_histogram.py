@@ -0,0 +1,86 @@
+"""
+Unit tests for latency_histogram.py: bucketing, merging and serialisation
+
+Usage:
+    python -m pytest -q test_latency_histogram.py
+"""
+
+import pickle
+
+import pytest
+
+from latency_histogram import LatencyHistogram
+
+
+def test_bucketing_keeps_two_significant_figures():
+    histogram = LatencyHistogram()
+    for value_us in (1, 150, 12_345, 987_654, 59_000_000):
+        histogram.record_us(value_us)
+        assert histogram.value_at_percentile(100) == pytest.approx(value_us / 1_000_000)  # True maximum
+    for lowest, highest, count in histogram.iter_buckets():
+        assert count == 1
+        # Bucket width stays within 1% of the values it holds
+        assert (highest - lowest) <= max(lowest, 1e-6) * 0.01 + 1e-6
+
+
+def test_percentiles_report_top_of_bucket():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.record(ms / 1000)
+    assert histogram.count == 100
+    assert histogram.value_at_percentile(50) == pytest.approx(0.050, rel=0.01)
+    assert histogram.value_at_percentile(99) == pytest.approx(0.099, rel=0.01)
+    assert histogram.value_at_percentile(100) == pytest.approx(0.100)
+    assert histogram.min == pytest.approx(0.001)
+    assert histogram.mean == pytest.approx(0.0505)
+
+
+def test_values_above_range_are_clamped_but_max_is_kept():
+    histogram = LatencyHistogram(highest_us=1_000_000)
+    histogram.record(5.0)
+    assert histogram.count == 1
+    assert histogram.max == 5.0
+    assert histogram.count_between(0.9, 1.1) == 1
+
+
+def test_empty_histogram():
+    histogram = LatencyHistogram()
+    assert histogram.value_at_percentile(50) is None
+    assert histogram.min is None and histogram.max is None and histogram.mean is None
+
+
+def test_merge_adds_counts_and_extremes():
+    fast, slow = LatencyHistogram(), LatencyHistogram()
+    for _ in range(90):
+        fast.record(0.010)
+    for _ in range(10):
+        slow.record(0.500)
+    merged = fast.copy().merge(slow)
+    assert merged.count == 100
+    assert merged.min == pytest.approx(0.010)
+    assert merged.max == pytest.approx(0.500)
+    assert merged.value_at_percentile(90) == pytest.approx(0.010, rel=0.01)
+    assert merged.value_at_percentile(95) == pytest.approx(0.500, rel=0.01)
+    assert fast.count == 90     # copy() left the original alone
+
+
+def test_merge_rejects_incompatible_layouts():
+    with pytest.raises(ValueError):
+        LatencyHistogram().merge(LatencyHistogram(significant_figures=3))
+
+
+def test_dict_and_pickle_round_trip():
+    histogram = LatencyHistogram()
+    for ms in (1, 2, 2, 30, 400, 5000):
+        histogram.record(ms / 1000)
+    for restored in (LatencyHistogram.from_dict(histogram.to_dict()), pickle.loads(pickle.dumps(histogram))):
+        assert restored.count == histogram.count
+        assert list(restored.iter_buckets()) == list(histogram.iter_buckets())
+        assert restored.percentiles((50, 99)) == histogram.percentiles((50, 99))
+
+
+def test_from_dict_rejects_mismatched_counts():
+    data = LatencyHistogram().to_dict()
+    data['highest_us'] *= 1000
+    with pytest.raises(ValueError):
+        LatencyHistogram.from_dict(data)
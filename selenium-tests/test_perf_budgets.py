@@ -0,0 +1,61 @@
+"""
+Unit tests for perf_budgets.py: budget evaluation
+
+Usage:
+    python -m pytest -q test_perf_budgets.py
+"""
+
+import json
+
+import pytest
+
+from perf_budgets import BudgetMeasurement, budget_rows, budget_violations, evaluate_budgets, load_budgets
+
+
+def _measurement(latencies_ms, size=None, failures=0):
+    measurement = BudgetMeasurement()
+    for ms in latencies_ms:
+        measurement.add(ms / 1000, size)
+    for _ in range(failures):
+        measurement.add(ok=False)
+    return measurement
+
+
+def test_checks_follow_the_budgets_file():
+    limits = {'/api/a': {'p50_ms': 100, 'p95_ms': 200, 'max_bytes': 1000, 'error_rate': 0.1}}
+    checks = evaluate_budgets(limits, {'/api/a': _measurement(range(1, 101), size=500)})
+    assert [c['metric'] for c in checks] == ["p50", "p95", "payload", "error rate"]
+    assert all(c['ok'] for c in checks)
+    assert budget_violations(checks) == []
+
+
+def test_violations_are_reported():
+    limits = {'/api/a': {'p99_ms': 50, 'max_bytes': 100, 'error_rate': 0.01}}
+    checks = evaluate_budgets(limits, {'/api/a': _measurement([10] * 9 + [300], size=2048, failures=1)})
+    failed = {c['metric'] for c in budget_violations(checks)}
+    assert failed == {"p99", "payload", "error rate"}
+    assert [row[-1] for row in budget_rows(checks)] == ["FAIL", "FAIL", "FAIL"]
+
+
+def test_percentile_at_the_limit_passes():
+    checks = evaluate_budgets({'/api/a': {'p50_ms': 20}}, {'/api/a': _measurement([20] * 5)})
+    assert checks[0]['ok']
+    assert checks[0]['measured'] == 20
+
+
+def test_missing_measurement_is_not_a_failure():
+    checks = evaluate_budgets({'/api/missing': {'p95_ms': 10, 'error_rate': 0}}, {})
+    assert [c['measured'] for c in checks] == [None, None]
+    assert budget_violations(checks) == []
+    assert [row[-1] for row in budget_rows(checks)] == ["N/A", "N/A"]
+
+
+def test_load_budgets(tmp_path):
+    assert load_budgets("") is None
+    assert load_budgets(str(tmp_path / "missing.json")) is None
+    path = tmp_path / "budgets.json"
+    path.write_text(json.dumps({'endpoints': {'/api/a': {'p95_ms': 10}}}))
+    assert load_budgets(str(path))['endpoints']['/api/a'] == {'p95_ms': 10}
+    path.write_text(json.dumps({'endpoints': ['/api/a']}))
+    with pytest.raises(ValueError):
+        load_budgets(str(path))
@@ -0,0 +1,81 @@
+"""
+Unit tests for results_store.py: Mann-Whitney U, tie correction and Cliff's delta
+
+Usage:
+    python -m pytest -q test_results_store.py
+"""
+
+import math
+
+import pytest
+
+from results_store import (MIN_SAMPLES, ResultsStore, compare_runs, compare_windows, mann_whitney_u,
+                           weighted_median)
+
+
+def _samples(values):
+    return [(value, 1) for value in values]
+
+
+def test_u_statistic_and_delta_for_separated_samples():
+    u, p_value, delta = mann_whitney_u(_samples([6, 7, 8, 9, 10]), _samples([1, 2, 3, 4, 5]))
+    assert u == 25                      # Every candidate value beats every baseline value
+    assert delta == 1.0
+    assert p_value < 0.05
+
+
+def test_u_statistic_matches_pairwise_count():
+    candidate, baseline = [1, 4, 5, 9], [2, 3, 6, 7, 8]
+    wins = sum((c > b) + 0.5 * (c == b) for c in candidate for b in baseline)
+    u, _, delta = mann_whitney_u(_samples(candidate), _samples(baseline))
+    assert u == wins
+    assert delta == pytest.approx(2 * wins / (len(candidate) * len(baseline)) - 1)
+
+
+def test_identical_samples_are_not_significant():
+    u, p_value, delta = mann_whitney_u(_samples([5] * 8), _samples([5] * 8))
+    assert u == 32
+    assert delta == 0
+    assert p_value == 1.0               # All ties: zero variance after tie correction
+
+
+def test_tie_correction_shrinks_variance():
+    # Heavy ties: without the correction z would be smaller and p larger
+    candidate, baseline = _samples([2, 2, 2, 3, 3]), _samples([1, 1, 2, 2, 2])
+    u, p_value, _ = mann_whitney_u(candidate, baseline)
+    n1 = n2 = 5
+    uncorrected = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+    z_uncorrected = (abs(u - n1 * n2 / 2) - 0.5) / uncorrected
+    assert p_value < math.erfc(z_uncorrected / math.sqrt(2))
+
+
+def test_weighted_samples_equal_repeated_samples():
+    weighted = mann_whitney_u([(1, 3), (4, 2)], [(2, 4), (3, 1)])
+    repeated = mann_whitney_u(_samples([1, 1, 1, 4, 4]), _samples([2, 2, 2, 2, 3]))
+    assert weighted == pytest.approx(repeated)
+    assert weighted_median([(1, 3), (4, 2)]) == 1
+
+
+def test_compare_windows_verdicts():
+    baseline = {'/fast': _samples([0.010 + i / 1000 for i in range(10)]),
+                '/few': _samples([0.010])}
+    candidate = {'/fast': _samples([0.050 + i / 1000 for i in range(10)]),
+                 '/few': _samples([0.100])}
+    rows = {row['endpoint']: row for row in compare_windows(baseline, candidate)}
+    assert rows['/fast']['verdict'] == "REGRESSION"
+    assert rows['/few']['verdict'] == "INSUFFICIENT DATA"
+
+
+def test_each_run_counts_once_by_its_median(tmp_path):
+    with ResultsStore(str(tmp_path / "history.sqlite3")) as store:
+        for _ in range(MIN_SAMPLES + 3):
+            # Thousands of bucketed samples per run, like a load run
+            store.record_run("load", [("/a", 0.100, 3000, True), ("/a", 0.110, 1000, True),
+                                      ("/a", 0.005, 500, False)], git_sha="x")
+        for _ in range(MIN_SAMPLES):
+            store.record_run("load", [("/a", 0.101, 3000, True), ("/a", 0.110, 1000, True)], git_sha="x")
+        assert store.run_medians([1, 2]) == {'/a': [(0.100, 1), (0.100, 1)]}
+        candidate, baseline, rows = compare_runs(store, "load", baseline_runs=MIN_SAMPLES + 3)
+        assert (len(candidate), len(baseline)) == (MIN_SAMPLES, MIN_SAMPLES + 3)
+        assert (rows[0]['baseline_n'], rows[0]['candidate_n']) == (MIN_SAMPLES + 3, MIN_SAMPLES)
+        assert rows[0]['verdict'] == "REGRESSION"
@@ -0,0 +1,113 @@
+"""
+Unit tests for route_matrix.py: route discovery from server.js
+
+Usage:
+    python -m pytest -q test_route_matrix.py
+"""
+
+import os
+
+import pytest
+
+from route_matrix import SERVER_JS, discover_routes, query_params, route_class
+
+
+SERVER = """
+const express = require("express");
+const {
+  listItems,
+  getItem
+} = require("./controllers/itemController");
+const { search: findItems } = require("./controllers/searchController");
+const auth = require("./middleware/auth");
+
+// app.get("/commented-out", listItems);
+/* app.post("/also-commented", listItems); */
+app.get("/api/items", listItems);
+app.get("/api/items/search", findItems);
+app.get("/api/items/:id", getItem);
+app.put("/admin/items/:id",
+  auth,
+  getItem
+);
+app.post("/contact", async (req, res) => {
+  try {
+    await createContact(req, res);
+  } catch (error) {
+    res.status(500).json({});
+  }
+});
+"""
+
+ITEM_CONTROLLER = """
+const listItems = async (req, res) => {
+  const { page = 1, limit: pageSize, sort } = req.query;
+  res.json([]);
+};
+
+const getItem = async (req, res) => {
+  res.json({ id: req.params.id, verbose: req.query.verbose });
+};
+
+module.exports = { listItems, getItem };
+"""
+
+SEARCH_CONTROLLER = """
+exports.search = async (req, res) => {
+  const { query } = req.query;
+  res.json([]);
+};
+"""
+
+
+def _write_app(tmp_path):
+    (tmp_path / "controllers").mkdir()
+    (tmp_path / "controllers" / "itemController.js").write_text(ITEM_CONTROLLER)
+    (tmp_path / "controllers" / "searchController.js").write_text(SEARCH_CONTROLLER)
+    server_js = tmp_path / "server.js"
+    server_js.write_text(SERVER)
+    return str(server_js)
+
+
+def test_discovers_routes_in_order_and_skips_comments(tmp_path):
+    routes = discover_routes(_write_app(tmp_path))
+    assert [(r['method'], r['path']) for r in routes] == [
+        ('GET', '/api/items'), ('GET', '/api/items/search'), ('GET', '/api/items/:id'),
+        ('PUT', '/admin/items/:id'), ('POST', '/contact'),
+    ]
+
+
+def test_handlers_and_params(tmp_path):
+    routes = {(r['method'], r['path']): r for r in discover_routes(_write_app(tmp_path))}
+    assert routes[('GET', '/api/items')]['handler'] == 'listItems'
+    assert routes[('GET', '/api/items')]['query_params'] == ['page', 'limit', 'sort']
+    # Renamed destructured import resolves to the exported function
+    assert routes[('GET', '/api/items/search')]['handler'] == 'findItems'
+    assert routes[('GET', '/api/items/search')]['query_params'] == ['query']
+    assert routes[('GET', '/api/items/:id')]['path_params'] == ['id']
+    assert routes[('GET', '/api/items/:id')]['query_params'] == ['verbose']
+    # Middleware list spread over several lines: the last identifier is the handler
+    assert routes[('PUT', '/admin/items/:id')]['handler'] == 'getItem'
+    # Inline arrow handler: the function it calls
+    assert routes[('POST', '/contact')]['handler'] == 'createContact'
+
+
+def test_query_params_without_source():
+    assert query_params(None) == []
+    assert query_params("const { a, b = 2 } = req.query; req.query.c; req.query.a") == ['a', 'b', 'c']
+
+
+def test_route_class():
+    assert route_class({'method': 'GET', 'path': '/api/items'}) == 'read'
+    assert route_class({'method': 'POST', 'path': '/contact'}) == 'write'
+    assert route_class({'method': 'GET', 'path': '/admin/contacts'}) == 'admin'
+    assert route_class({'method': 'DELETE', 'path': '/company/team/cancel/:id'}) == 'admin write'
+
+
+def test_bundled_server_js():
+    if not os.path.exists(SERVER_JS):
+        pytest.skip(f"{SERVER_JS} not found")
+    routes = {(r['method'], r['path']): r for r in discover_routes()}
+    search = routes[('GET', '/api/universities/search')]
+    assert search['handler'] == 'searchUniversitiesByName'
+    assert 'query' in search['query_params']
@@ -0,0 +1,67 @@
+"""
+Unit tests for streaming_validator.py: the incremental JSON array parser
+
+Usage:
+    python -m pytest -q test_streaming_validator.py
+"""
+
+import json
+
+import pytest
+
+from streaming_validator import JsonArrayStreamer, StreamFormatError, iter_array_items, validate_university
+
+
+DOCUMENT = {'success': True, 'count': -12.5e3, 'data': [3.14159, {'a': [1, 2], 'b': "x]}"}, 2e10, None,
+                                                          "é", True], 'total': 7}
+
+
+def _parse(chunks):
+    streamer = JsonArrayStreamer()
+    return list(iter_array_items(chunks, streamer=streamer)), streamer.meta
+
+
+def test_whole_document():
+    items, meta = _parse([json.dumps(DOCUMENT).encode('utf-8')])
+    assert items == DOCUMENT['data']
+    assert meta == {'success': True, 'count': -12500.0, 'total': 7}
+
+
+def test_number_split_at_chunk_boundary():
+    # raw_decode would accept "3." as 3 and leave ".14159" behind
+    assert _parse([b'{"data": [3.', b'14159]}'])[0] == [3.14159]
+    assert _parse([b'{"data": [1e', b'3, 2]}'])[0] == [1000.0, 2]
+    assert _parse([b'{"count": 1', b'2, "data": []}'])[1] == {'count': 12}
+
+
+@pytest.mark.parametrize("separators", [(',', ':'), (', ', ': ')])
+def test_every_split_point(separators):
+    body = json.dumps(DOCUMENT, separators=separators).encode('utf-8')
+    for split in range(1, len(body)):
+        items, meta = _parse([body[:split], body[split:]])
+        assert items == DOCUMENT['data'], split
+        assert meta['count'] == -12500.0, split
+
+
+def test_byte_at_a_time():
+    body = json.dumps(DOCUMENT).encode('utf-8')
+    items, _ = _parse([body[i:i + 1] for i in range(len(body))])
+    assert items == DOCUMENT['data']
+
+
+def test_consumed_text_is_dropped():
+    streamer = JsonArrayStreamer()
+    streamer.feed('{"data": [{"a": 1}, {"a": 2}, {"a"')
+    assert streamer.buffer == '{"a"'
+
+
+@pytest.mark.parametrize("body", [b'[1, 2]', b'{"data" 1}', b'{"data": [1, 2]', b'{"data": [1, }'])
+def test_malformed_bodies(body):
+    with pytest.raises(StreamFormatError):
+        _parse([body])
+
+
+def test_validate_university():
+    assert validate_university([]) == [("<record>", "expected object, got list")]
+    problems = dict(validate_university({'title': 5}))
+    assert problems['title'] == "expected string, got int"
@@ -16,39 +16,110 @@ Author: DevOps Lab Project
 Date: December 2025
 """
 
+import argparse
+import asyncio
+import os
+import threading
 import time
-import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from http_client import PooledHttpClient, DEFAULT_POOL_CONNECTIONS, DEFAULT_POOL_MAXSIZE
+from latency_histogram import LatencyHistogram
+from perf_budgets import (DEFAULT_BUDGETS_PATH, BudgetMeasurement, budget_rows, budget_table_html,
+                          budget_violations, evaluate_budgets, load_budgets, print_budget_results)
+from response_cassette import (DEFAULT_BASELINE_TOLERANCE, DEFAULT_CASSETTE_PATH, CassetteRecorder,
+                               CassetteReplayClient, compare_to_cassette, conditions_mismatch, load_cassette)
+from results_store import DEFAULT_HISTORY_PATH, ResultsStore
 
-# Application URLs
-FRONTEND_URL = "http://4.213.223.12"
-BACKEND_URL = "http://135.235.246.98:5000"
+
+# Application URLs (override with env vars, e.g. BACKEND_URL=http://localhost:5000
+# to test a local docker-compose stack)
+FRONTEND_URL = os.environ.get("FRONTEND_URL", "http://4.213.223.12")
+BACKEND_URL = os.environ.get("BACKEND_URL", "http://135.235.246.98:5000")
+
+# Maximum number of API checks in flight at once in async mode
+DEFAULT_CONCURRENCY = 5
+
+# Percentiles shown in the latency section of the reports
+REPORT_PERCENTILES = (50, 90, 99)
 
 
 class AutomatedTestSuite:
     """API-Based Automated Test Suite for University Finder App"""
     
-    def __init__(self):
+    def __init__(self, pool_connections=DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=DEFAULT_POOL_MAXSIZE, keep_alive=True, streaming=False,
+                 budgets_path=DEFAULT_BUDGETS_PATH, history_path=DEFAULT_HISTORY_PATH,
+                 record_path=None, replay_path=None, replay_delay=True, baseline_path=None):
         """Initialize the test suite"""
         self.test_results = []
+        # Validate /api/universities record by record instead of response.json()
+        self.streaming = streaming
         self.passed = 0
         self.failed = 0
         self.start_time = datetime.now()
-        
-    def log_result(self, test_name, status, message, details=""):
-        """Log test result"""
-        self.test_results.append({
-            'test': test_name,
-            'status': status,
-            'message': message,
-            'details': details
-        })
-        if status == "PASSED":
-            self.passed += 1
+        self.keep_alive = keep_alive
+        # How this run is executed; set by run_all_tests / run_all_tests_async
+        self.conditions = {}
+        self._lock = threading.Lock()
+        
+        # Per-endpoint latency histograms, filled in by log_result
+        self.histograms = {}
+        
+        # Per-endpoint budget measurements and the endpoint budgets they are checked against
+        self.measurements = {}
+        budgets = load_budgets(budgets_path)
+        self.endpoint_budgets = budgets.get('endpoints', {}) if budgets else {}
+        self.budget_checks = []
+        
+        # Append-only SQLite history of every run's latency samples
+        self.history_path = history_path
+        
+        # One pooled keep-alive client shared by every check; with a cassette
+        # the responses are recorded to disk, or served from it instead
+        self.replaying = bool(replay_path)
+        if replay_path:
+            self.http = CassetteReplayClient(replay_path, delay=replay_delay)
         else:
-            self.failed += 1
+            self.http = PooledHttpClient(
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                keep_alive=keep_alive
+            )
+            if record_path:
+                self.http = CassetteRecorder(self.http, record_path, BACKEND_URL)
+        
+        # Recorded cassette whose latencies this run is compared against
+        self.baseline = load_cassette(baseline_path) if baseline_path else None
+        self.baseline_rows = []
+        self.baseline_skipped = None
+        
+    def log_result(self, test_name, status, message, details="", latency=None, endpoint=None, size=None):
+        """Log test result (safe to call from concurrent tests)"""
+        with self._lock:
+            self.test_results.append({
+                'test': test_name,
+                'status': status,
+                'message': message,
+                'details': details,
+                'latency': latency,
+                'endpoint': endpoint,
+                'size': size
+            })
+            if latency is not None and endpoint:
+                if endpoint not in self.histograms:
+                    self.histograms[endpoint] = LatencyHistogram()
+                self.histograms[endpoint].record(latency)
+            if endpoint:
+                if endpoint not in self.measurements:
+                    self.measurements[endpoint] = BudgetMeasurement()
+                self.measurements[endpoint].add(latency, size, status == "PASSED")
+            if status == "PASSED":
+                self.passed += 1
+            else:
+                self.failed += 1
     
     def test_01_backend_health_check(self):
         """
@@ -67,11 +138,11 @@ class AutomatedTestSuite:
         print("TEST CASE 1: Backend Health Check")
         print("=" * 70)
         
+        start_time = time.time()
         try:
-            start_time = time.time()
             print(f"📍 Testing URL: {BACKEND_URL}")
             
-            response = requests.get(BACKEND_URL, timeout=10)
+            response = self.http.get(BACKEND_URL, timeout=10)
             response_time = time.time() - start_time
             
             print(f"✅ Backend is reachable")
@@ -86,13 +157,17 @@ class AutomatedTestSuite:
                 "Backend Health Check", 
                 "PASSED", 
                 f"Backend is running",
-                f"Status: {response.status_code}, Response time: {response_time:.2f}s"
+                f"Status: {response.status_code}, Response time: {response_time:.2f}s",
+                latency=response_time,
+                size=len(response.content),
+                endpoint="/"
             )
             return True
             
         except Exception as e:
             print(f"\n❌ TEST 1 FAILED: {str(e)}\n")
-            self.log_result("Backend Health Check", "FAILED", str(e))
+            self.log_result("Backend Health Check", "FAILED", str(e), latency=time.time() - start_time,
+                            endpoint="/")
             return False
     
     def test_02_universities_api(self):
@@ -109,15 +184,20 @@ class AutomatedTestSuite:
         
         Expected Result: API returns list of universities
         """
+        if self.streaming:
+            return self.test_02_universities_api_streaming()
+        
         print("=" * 70)
         print("TEST CASE 2: Universities API Test")
         print("=" * 70)
         
+        start_time = time.time()
         try:
             api_url = f"{BACKEND_URL}/api/universities"
             print(f"📍 Testing API: {api_url}")
             
-            response = requests.get(api_url, timeout=10)
+            response = self.http.get(api_url, timeout=10)
+            response_time = time.time() - start_time
             
             print(f"✅ Status Code: {response.status_code}")
             assert response.status_code == 200, f"Expected 200, got {response.status_code}"
@@ -142,13 +222,82 @@ class AutomatedTestSuite:
                 "Universities API Test",
                 "PASSED",
                 f"Retrieved {count} universities",
-                f"Status: 200, Sample: {sample}"
+                f"Status: 200, Sample: {sample}",
+                latency=response_time,
+                size=len(response.content),
+                endpoint="/api/universities"
             )
             return True
             
         except Exception as e:
             print(f"\n❌ TEST 2 FAILED: {str(e)}\n")
-            self.log_result("Universities API Test", "FAILED", str(e))
+            self.log_result("Universities API Test", "FAILED", str(e), latency=time.time() - start_time,
+                            endpoint="/api/universities")
+            return False
+    
+    def test_02_universities_api_streaming(self):
+        """
+        Test Case 2 (streaming mode): Universities API Test
+        
+        Objective: Validate every university record without loading the
+        whole payload into memory
+        
+        Steps:
+        1. Send GET request to /api/universities and read the body in chunks
+        2. Parse the data array one record at a time as bytes arrive
+        3. Check each record against the UniversitySchema fields
+        4. Report records per second and peak memory
+        
+        Expected Result: All records match the schema
+        """
+        # Imported here because streaming_validator reads BACKEND_URL from this module
+        from streaming_validator import stream_validate
+        
+        print("=" * 70)
+        print("TEST CASE 2: Universities API Test (streaming)")
+        print("=" * 70)
+        
+        start_time = time.time()
+        try:
+            api_url = f"{BACKEND_URL}/api/universities"
+            print(f"📍 Testing API: {api_url}")
+            
+            # tracemalloc is process-wide: with other checks in flight it would count their allocations too
+            result = stream_validate(self.http, api_url,
+                                     track_memory=self.conditions.get('concurrency', 1) == 1)
+            # The untraced pass only; the memory pass downloads the payload again
+            response_time = result.elapsed
+            peak_memory = (f"{result.peak_memory / 1024:.1f} KB" if result.peak_memory is not None
+                           else "not measured (concurrent checks)")
+            
+            print(f"✅ Records Streamed: {result.records}")
+            print(f"✅ Throughput: {result.records_per_second:.0f} records/s")
+            print(f"✅ Peak Memory: {peak_memory}")
+            
+            assert result.records > 0, "No universities found"
+            assert result.count_matches, \
+                f"count field says {result.meta.get('count')}, streamed {result.records}"
+            assert result.invalid_records == 0, \
+                f"{result.invalid_records} records violate UniversitySchema: {result.field_problems}"
+            
+            print("\n✅ TEST 2 PASSED: All university records match the schema\n")
+            self.log_result(
+                "Universities API Test",
+                "PASSED",
+                f"Streamed and validated {result.records} universities",
+                f"Status: 200, {result.records_per_second:.0f} records/s, "
+                f"Peak memory: {peak_memory}, "
+                f"First record after {(result.time_to_first_record or 0) * 1000:.0f}ms",
+                latency=response_time,
+                size=result.bytes_read,
+                endpoint="/api/universities"
+            )
+            return True
+            
+        except Exception as e:
+            print(f"\n❌ TEST 2 FAILED: {str(e)}\n")
+            self.log_result("Universities API Test", "FAILED", str(e), latency=time.time() - start_time,
+                            endpoint="/api/universities")
             return False
     
     def test_03_search_api(self):
@@ -169,13 +318,15 @@ class AutomatedTestSuite:
         print("TEST CASE 3: Search API Test")
         print("=" * 70)
         
+        start_time = time.time()
         try:
             search_query = "NUST"
             api_url = f"{BACKEND_URL}/api/universities/search?query={search_query}"
             print(f"📍 Testing API: {api_url}")
             print(f"📍 Search Query: {search_query}")
             
-            response = requests.get(api_url, timeout=10)
+            response = self.http.get(api_url, timeout=10)
+            response_time = time.time() - start_time
             
             print(f"✅ Status Code: {response.status_code}")
             assert response.status_code == 200, f"Expected 200, got {response.status_code}"
@@ -198,13 +349,17 @@ class AutomatedTestSuite:
                 "Search API Test",
                 "PASSED",
                 f"Search returned {count} results for '{search_query}'",
-                f"Status: 200, Top result: {top_result if count > 0 else 'N/A'}"
+                f"Status: 200, Top result: {top_result if count > 0 else 'N/A'}",
+                latency=response_time,
+                size=len(response.content),
+                endpoint="/api/universities/search"
             )
             return True
             
         except Exception as e:
             print(f"\n❌ TEST 3 FAILED: {str(e)}\n")
-            self.log_result("Search API Test", "FAILED", str(e))
+            self.log_result("Search API Test", "FAILED", str(e), latency=time.time() - start_time,
+                            endpoint="/api/universities/search")
             return False
     
     def test_04_disciplines_api(self):
@@ -225,11 +380,13 @@ class AutomatedTestSuite:
         print("TEST CASE 4: Disciplines API Test")
         print("=" * 70)
         
+        start_time = time.time()
         try:
             api_url = f"{BACKEND_URL}/api/disciplines"
             print(f"📍 Testing API: {api_url}")
             
-            response = requests.get(api_url, timeout=10)
+            response = self.http.get(api_url, timeout=10)
+            response_time = time.time() - start_time
             
             print(f"✅ Status Code: {response.status_code}")
             assert response.status_code == 200, f"Expected 200, got {response.status_code}"
@@ -254,13 +411,17 @@ class AutomatedTestSuite:
                 "Disciplines API Test",
                 "PASSED",
                 f"Retrieved {count} disciplines",
-                f"Status: 200, Sample: {sample if count >= 3 else 'N/A'}"
+                f"Status: 200, Sample: {sample if count >= 3 else 'N/A'}",
+                latency=response_time,
+                size=len(response.content),
+                endpoint="/api/disciplines"
             )
             return True
             
         except Exception as e:
             print(f"\n❌ TEST 4 FAILED: {str(e)}\n")
-            self.log_result("Disciplines API Test", "FAILED", str(e))
+            self.log_result("Disciplines API Test", "FAILED", str(e), latency=time.time() - start_time,
+                            endpoint="/api/disciplines")
             return False
     
     def test_05_top_universities_api(self):
@@ -281,11 +442,13 @@ class AutomatedTestSuite:
         print("TEST CASE 5: Top Universities API Test")
         print("=" * 70)
         
+        start_time = time.time()
         try:
             api_url = f"{BACKEND_URL}/api/universities/top"
             print(f"📍 Testing API: {api_url}")
             
-            response = requests.get(api_url, timeout=10)
+            response = self.http.get(api_url, timeout=10)
+            response_time = time.time() - start_time
             
             print(f"✅ Status Code: {response.status_code}")
             assert response.status_code == 200, f"Expected 200, got {response.status_code}"
@@ -310,15 +473,38 @@ class AutomatedTestSuite:
                 "Top Universities API Test",
                 "PASSED",
                 f"Retrieved {count} top universities",
-                f"Status: 200, Top university: {top_uni if count > 0 else 'N/A'}"
+                f"Status: 200, Top university: {top_uni if count > 0 else 'N/A'}",
+                latency=response_time,
+                size=len(response.content),
+                endpoint="/api/universities/top"
             )
             return True
             
         except Exception as e:
             print(f"\n❌ TEST 5 FAILED: {str(e)}\n")
-            self.log_result("Top Universities API Test", "FAILED", str(e))
+            self.log_result("Top Universities API Test", "FAILED", str(e), latency=time.time() - start_time,
+                            endpoint="/api/universities/top")
             return False
     
+    def latency_summary(self):
+        """Per-endpoint latency percentiles, read from the histograms"""
+        rows = []
+        for endpoint, histogram in self.histograms.items():
+            rows.append({
+                'endpoint': endpoint,
+                'count': histogram.count,
+                'percentiles': histogram.percentiles(REPORT_PERCENTILES),
+                'max': histogram.max
+            })
+        return rows
+    
+    def save_histograms(self, path='test-latency-histograms.json'):
+        """Save the per-endpoint histograms so later runs can merge them"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({endpoint: histogram.to_dict()
+                       for endpoint, histogram in self.histograms.items()}, f, indent=2)
+        print(f"📄 Latency histograms saved to: {path}")
+    
     def generate_text_report(self):
         """Generate text test execution report"""
         print("\n" + "=" * 70)
@@ -332,6 +518,10 @@ class AutomatedTestSuite:
         print(f"✅ Passed: {self.passed}")
         print(f"❌ Failed: {self.failed}")
         print(f"📈 Success Rate: {success_rate:.1f}%")
+        print(f"🔌 Connections: {self.http.stats.summary()}")
+        for row in self.latency_summary():
+            pcts = ", ".join(f"p{p}={v * 1000:.0f}ms" for p, v in row['percentiles'].items())
+            print(f"⏱️ {row['endpoint']}: {pcts}")
         
         print("\n" + "=" * 70)
         print("DETAILED RESULTS")
@@ -344,6 +534,8 @@ class AutomatedTestSuite:
             print(f"   📝 Message: {result['message']}")
             if result['details']:
                 print(f"   📋 Details: {result['details']}")
+            if result['latency'] is not None:
+                print(f"   ⏱️ Latency: {result['latency']:.3f}s")
         
         # Save text report
         report_path = 'test-report.txt'
@@ -362,6 +554,36 @@ class AutomatedTestSuite:
             f.write(f"Failed: {self.failed}\n")
             f.write(f"Success Rate: {success_rate:.1f}%\n\n")
             
+            stats = self.http.stats
+            f.write("Connection Reuse:\n")
+            f.write(f"   Pool: {self.http.describe()}\n")
+            f.write(f"   Requests: {stats.requests}\n")
+            f.write(f"   New Connections: {stats.new_connections}\n")
+            f.write(f"   Reused Connections: {stats.reused_connections}\n")
+            f.write(f"   Reuse Rate: {stats.reuse_rate:.1f}%\n\n")
+            
+            f.write("Latency Percentiles:\n")
+            for row in self.latency_summary():
+                pcts = ", ".join(f"p{p}: {v * 1000:.1f}ms" for p, v in row['percentiles'].items())
+                f.write(f"   {row['endpoint']} ({row['count']} samples) - {pcts}, max: {row['max'] * 1000:.1f}ms\n")
+            f.write("\n")
+            
+            if self.budget_checks:
+                f.write(f"Performance Budgets ({len(budget_violations(self.budget_checks))} violations):\n")
+                for target, metric, measured, budget, verdict in budget_rows(self.budget_checks):
+                    f.write(f"   [{verdict}] {target} {metric}: {measured} (budget {budget})\n")
+                f.write("\n")
+            
+            if self.baseline_skipped:
+                f.write(f"Cassette Baseline: not compared, {self.baseline_skipped}\n\n")
+            if self.baseline_rows:
+                f.write(f"Cassette Baseline (recorded {self.baseline.get('recorded_at')}):\n")
+                for row in self.baseline_rows:
+                    f.write(f"   [{'SLOWER' if row['slower'] else 'OK'}] {row['endpoint']}: "
+                            f"{row['live'] * 1000:.1f}ms live vs {row['recorded'] * 1000:.1f}ms recorded "
+                            f"({row['ratio']:.2f}x)\n")
+                f.write("\n")
+            
             f.write("=" * 70 + "\n")
             f.write("DETAILED RESULTS\n")
             f.write("=" * 70 + "\n\n")
@@ -372,6 +594,8 @@ class AutomatedTestSuite:
                 f.write(f"   Message: {result['message']}\n")
                 if result['details']:
                     f.write(f"   Details: {result['details']}\n")
+                if result['latency'] is not None:
+                    f.write(f"   Latency: {result['latency']:.3f}s\n")
                 f.write("\n")
         
         print(f"\n📄 Text report saved to: {report_path}")
@@ -589,6 +813,23 @@ class AutomatedTestSuite:
             opacity: 0.9;
         }}
         
+        .latency-table {{
+            width: 100%;
+            border-collapse: collapse;
+        }}
+        
+        .latency-table th {{
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 12px;
+            text-align: left;
+        }}
+        
+        .latency-table td {{
+            padding: 10px 12px;
+            border-bottom: 1px solid #eee;
+        }}
+        
         @keyframes fadeIn {{
             from {{ opacity: 0; transform: translateY(20px); }}
             to {{ opacity: 1; transform: translateY(0); }}
@@ -649,13 +890,61 @@ class AutomatedTestSuite:
 """
             if result['details']:
                 html_content += f"""                <div class="test-details">📋 {result['details']}</div>
+"""
+            if result['latency'] is not None:
+                html_content += f"""                <div class="test-details">⏱️ Latency: {result['latency']:.3f}s</div>
 """
             html_content += """            </div>
 """
         
+        stats = self.http.stats
         html_content += f"""
         </div>
         
+        <div class="test-results">
+            <h2>🔌 Connection Reuse</h2>
+            <div class="test-message">Pool: {self.http.describe()}</div>
+        </div>
+        <div class="summary">
+            <div class="stat-card">
+                <h3>Requests</h3>
+                <div class="value">{stats.requests}</div>
+            </div>
+            <div class="stat-card failed">
+                <h3>New Connections</h3>
+                <div class="value">{stats.new_connections}</div>
+            </div>
+            <div class="stat-card success">
+                <h3>Reused Connections</h3>
+                <div class="value">{stats.reused_connections}</div>
+            </div>
+            <div class="stat-card">
+                <h3>Reuse Rate</h3>
+                <div class="value">{stats.reuse_rate:.1f}%</div>
+            </div>
+        </div>
+        
+        <div class="test-results">
+            <h2>⏱️ Latency Percentiles</h2>
+            <table class="latency-table">
+                <tr><th>Endpoint</th><th>Samples</th>{"".join(f"<th>p{p}</th>" for p in REPORT_PERCENTILES)}<th>Max</th></tr>
+"""
+        for row in self.latency_summary():
+            cells = "".join(f"<td>{v * 1000:.1f}ms</td>" for v in row['percentiles'].values())
+            html_content += f"""                <tr><td>{row['endpoint']}</td><td>{row['count']}</td>{cells}<td>{row['max'] * 1000:.1f}ms</td></tr>
+"""
+        html_content += """            </table>
+        </div>
+"""
+        if self.budget_checks:
+            html_content += f"""        
+        <div class="test-results">
+            <h2>🎯 Performance Budgets</h2>
+            <div class="test-message">{len(budget_violations(self.budget_checks))} of {len(self.budget_checks)} checks over budget</div>
+{budget_table_html(self.budget_checks, "latency-table")}
+        </div>
+"""
+        html_content += f"""        
         <div class="footer">
             <p><strong>Test Execution Details</strong></p>
             <p>Started: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}</p>
@@ -677,36 +966,193 @@ class AutomatedTestSuite:
         print(f"📄 HTML report saved to: {html_path}")
         print("=" * 70 + "\n")
     
-    def run_all_tests(self):
-        """Run all test cases"""
+    def check_budgets(self):
+        """Evaluate the endpoint budgets; returns True when none is exceeded"""
+        self.budget_checks = evaluate_budgets(self.endpoint_budgets, self.measurements)
+        if not self.budget_checks:
+            return True
+        return print_budget_results(self.budget_checks)
+    
+    def set_conditions(self, mode, concurrency):
+        """Note how the checks run, for the cassette being recorded and the baseline check"""
+        self.conditions = {'mode': mode, 'concurrency': concurrency, 'keep_alive': self.keep_alive}
+        if isinstance(self.http, CassetteRecorder):
+            self.http.conditions = self.conditions
+    
+    def compare_baseline(self, tolerance=DEFAULT_BASELINE_TOLERANCE):
+        """Compare each endpoint's median latency with the baseline cassette's"""
+        if self.baseline is None:
+            return True
+        print("\n" + "=" * 70)
+        print(f"CASSETTE BASELINE (recorded {self.baseline.get('recorded_at')})")
+        print("=" * 70)
+        # Latencies from a sequential recording say nothing about a concurrent run
+        self.baseline_skipped = conditions_mismatch(self.baseline, self.conditions)
+        if self.baseline_skipped:
+            print(f"⚠ Not compared: {self.baseline_skipped}")
+            return True
+        live = {}
+        for result in self.test_results:
+            if result['endpoint'] and result['latency'] is not None:
+                live.setdefault(result['endpoint'], []).append(result['latency'])
+        self.baseline_rows = compare_to_cassette(self.baseline, live, tolerance)
+        for row in self.baseline_rows:
+            icon = "⚠" if row['slower'] else "✅"
+            print(f"{icon} {row['endpoint']}: {row['live'] * 1000:.0f}ms live vs "
+                  f"{row['recorded'] * 1000:.0f}ms recorded ({row['ratio']:.2f}x)")
+        return not any(row['slower'] for row in self.baseline_rows)
+    
+    def save_history(self):
+        """Append this run's per-endpoint latency samples to the results store"""
+        if not self.history_path:
+            return None
+        if self.replaying:
+            print("🗄️ Replayed run not saved to history")
+            return None
+        samples = [(r['endpoint'], r['latency'], 1, r['status'] == "PASSED")
+                   for r in self.test_results if r['endpoint'] and r['latency'] is not None]
+        with ResultsStore(self.history_path) as store:
+            run_id = store.record_run("api", samples, FRONTEND_URL, BACKEND_URL, started_at=self.start_time)
+        print(f"🗄️ Run #{run_id} saved to history: {self.history_path}")
+        return run_id
+    
+    def generate_reports(self):
+        """Write the text, HTML and histogram reports"""
+        self.check_budgets()
+        self.compare_baseline()
+        self.generate_text_report()
+        self.generate_html_report()
+        self.save_histograms()
+        self.save_history()
+    
+    def get_tests(self):
+        """Return the independent API checks in execution order"""
+        return [
+            self.test_01_backend_health_check,
+            self.test_02_universities_api,
+            self.test_03_search_api,
+            self.test_04_disciplines_api,
+            self.test_05_top_universities_api,
+        ]
+    
+    def print_banner(self, mode):
+        """Print the suite header"""
         print("\n" + "=" * 70)
         print("AUTOMATED TESTING SUITE")
         print("University Finder Application - DevOps Lab Section E")
         print("=" * 70)
         print(f"\nFrontend URL: {FRONTEND_URL}")
         print(f"Backend URL: {BACKEND_URL}")
+        print(f"Execution Mode: {mode}")
         print(f"Test Date: {self.start_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+    
+    def run_all_tests(self):
+        """Run all test cases"""
+        self.print_banner("sequential")
+        self.set_conditions("sequential", 1)
         
         # Run all 5 tests
-        self.test_01_backend_health_check()
-        self.test_02_universities_api()
-        self.test_03_search_api()
-        self.test_04_disciplines_api()
-        self.test_05_top_universities_api()
+        for test in self.get_tests():
+            test()
         
         # Generate reports
-        self.generate_text_report()
-        self.generate_html_report()
+        self.generate_reports()
+        
+        return (self.passed == len(self.test_results) and not budget_violations(self.budget_checks)
+                and not any(row['slower'] for row in self.baseline_rows))
+    
+    async def _run_tests_concurrently(self, max_concurrency):
+        """
+        Schedule every API check on the event loop.
         
-        return self.passed == len(self.test_results)
+        The checks use blocking HTTP calls, so each one runs on a worker
+        thread while the semaphore caps how many are in flight at once.
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            async def run_one(test):
+                async with semaphore:
+                    return await loop.run_in_executor(executor, test)
+            
+            return await asyncio.gather(*(run_one(test) for test in self.get_tests()))
+    
+    def run_all_tests_async(self, max_concurrency=DEFAULT_CONCURRENCY):
+        """
+        Run all test cases concurrently on an asyncio event loop.
+        
+        Total runtime is bounded by the slowest single check instead of the
+        sum of all of them. Results are still recorded through log_result.
+        """
+        self.print_banner(f"async (concurrency {max_concurrency})")
+        self.set_conditions("async", max_concurrency)
+        
+        wall_start = time.time()
+        asyncio.run(self._run_tests_concurrently(max_concurrency))
+        wall_time = time.time() - wall_start
+        
+        slowest = max((r['latency'] or 0 for r in self.test_results), default=0)
+        print(f"⏱️ Wall time: {wall_time:.2f}s (slowest single check: {slowest:.2f}s)")
+        
+        # Generate reports
+        self.generate_reports()
+        
+        return (self.passed == len(self.test_results) and not budget_violations(self.budget_checks)
+                and not any(row['slower'] for row in self.baseline_rows))
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="University Finder API test suite")
+    parser.add_argument("--async", dest="async_mode", action="store_true",
+                        help="run the API checks concurrently on an event loop")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"max checks in flight in async mode (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--pool-connections", type=int, default=DEFAULT_POOL_CONNECTIONS,
+                        help="number of per-host connection pools to keep")
+    parser.add_argument("--pool-maxsize", type=int, default=DEFAULT_POOL_MAXSIZE,
+                        help="max keep-alive connections per host")
+    parser.add_argument("--no-keep-alive", action="store_true",
+                        help="close the connection after every request (comparison run)")
+    parser.add_argument("--stream-validate", action="store_true",
+                        help="validate /api/universities record by record with bounded memory")
+    parser.add_argument("--budgets", default=DEFAULT_BUDGETS_PATH,
+                        help="performance budgets file (\"\" to skip budget checks)")
+    parser.add_argument("--history", default=DEFAULT_HISTORY_PATH,
+                        help="SQLite results history to append to (\"\" to skip)")
+    parser.add_argument("--record", nargs="?", const=DEFAULT_CASSETTE_PATH, metavar="CASSETTE",
+                        help=f"save every response to a cassette (default: {DEFAULT_CASSETTE_PATH})")
+    parser.add_argument("--replay", nargs="?", const=DEFAULT_CASSETTE_PATH, metavar="CASSETTE",
+                        help="answer every request from a recorded cassette instead of the backend")
+    parser.add_argument("--no-delay", action="store_true",
+                        help="with --replay, answer immediately instead of with the recorded timing")
+    parser.add_argument("--baseline-cassette", metavar="CASSETTE",
+                        help="compare this run's latencies with the ones recorded in a cassette")
+    args = parser.parse_args()
+    if args.record and args.replay:
+        parser.error("--record and --replay cannot be combined")
+    
     # Create test suite instance
-    test_suite = AutomatedTestSuite()
+    test_suite = AutomatedTestSuite(
+        pool_connections=args.pool_connections,
+        pool_maxsize=args.pool_maxsize,
+        keep_alive=not args.no_keep_alive,
+        streaming=args.stream_validate,
+        budgets_path=args.budgets,
+        history_path=args.history,
+        record_path=args.record,
+        replay_path=args.replay,
+        replay_delay=not args.no_delay,
+        baseline_path=args.baseline_cassette
+    )
     
     # Run all tests
-    success = test_suite.run_all_tests()
+    if args.async_mode:
+        success = test_suite.run_all_tests_async(max(1, args.concurrency))
+    else:
+        success = test_suite.run_all_tests()
+    
+    test_suite.http.close()
     
     # Exit with appropriate code
     exit(0 if success else 1)
@@ -0,0 +1,187 @@
+"""
+Event-Driven Wait Engine for the Selenium Suite
+DevOps Lab - Section E
+
+Replaces fixed time.sleep() calls with waits that return as soon as the
+page is actually ready:
+
+- route:        the browser URL contains the expected path
+- React root:   document is complete and <div id="root"> has rendered children
+- network idle: no fetch/XHR in flight and no resource finished loading for
+                NETWORK_IDLE_MS (tracked with a script injected through the
+                Chrome DevTools protocol before any page script runs, with
+                the Resource Timing API as a fallback)
+- viewport:     the window has been resized and the browser painted twice
+
+Every wait is timed and attributed to the current test, so the report can
+show how long each test spent waiting.
+
+Author: DevOps Lab Project
+"""
+
+import time
+
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+# Wait defaults
+DEFAULT_TIMEOUT = 15        # Seconds
+POLL_INTERVAL = 0.05        # Seconds between condition checks
+NETWORK_IDLE_MS = 500       # Quiet period that counts as "network idle"
+REACT_ROOT_SELECTOR = "#root"
+
+# Counts in-flight fetch/XHR calls. Installed with
+# Page.addScriptToEvaluateOnNewDocument so it runs before the app's own code.
+NETWORK_TRACKER_JS = """
+(function () {
+    if (window.__pendingRequests !== undefined) { return; }
+    window.__pendingRequests = 0;
+    window.__lastNetworkActivity = performance.now();
+    var begin = function () {
+        window.__pendingRequests++;
+        window.__lastNetworkActivity = performance.now();
+    };
+    var done = function () {
+        window.__pendingRequests = Math.max(0, window.__pendingRequests - 1);
+        window.__lastNetworkActivity = performance.now();
+    };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            begin();
+            return originalFetch.apply(this, arguments).finally(done);
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        begin();
+        this.addEventListener('loadend', done);
+        return originalSend.apply(this, arguments);
+    };
+})();
+"""
+
+NETWORK_STATE_JS = """
+var entries = performance.getEntriesByType('resource');
+var lastResource = 0;
+for (var i = 0; i < entries.length; i++) {
+    lastResource = Math.max(lastResource, entries[i].responseEnd);
+}
+var lastActivity = Math.max(lastResource, window.__lastNetworkActivity || 0);
+return {
+    readyState: document.readyState,
+    pending: window.__pendingRequests || 0,
+    idleFor: performance.now() - lastActivity
+};
+"""
+
+REACT_RENDERED_JS = """
+var root = document.querySelector(arguments[0]);
+return document.readyState === 'complete' && !!root && root.childElementCount > 0;
+"""
+
+TWO_FRAMES_JS = """
+var callback = arguments[arguments.length - 1];
+requestAnimationFrame(function () { requestAnimationFrame(function () { callback(true); }); });
+"""
+
+
+class WaitEngine:
+    """Condition-based waits with per-test timeouts and wait-time accounting"""
+
+    def __init__(self, driver, timeout=DEFAULT_TIMEOUT, idle_ms=NETWORK_IDLE_MS,
+                 poll_interval=POLL_INTERVAL):
+        self.driver = driver
+        self.default_timeout = timeout
+        self.timeout = timeout
+        self.idle_ms = idle_ms
+        self.poll_interval = poll_interval
+        self.current_test = None
+        self.wait_times = {}
+        self.tracking_requests = self._install_network_tracker()
+
+    def _install_network_tracker(self):
+        """Inject the fetch/XHR counter into every new document (Chrome only)"""
+        try:
+            self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                                        {"source": NETWORK_TRACKER_JS})
+            return True
+        except (AttributeError, WebDriverException):
+            # Non-Chromium driver: fall back to Resource Timing entries only
+            return False
+
+    # ------------------------------------------------------------------
+    # Per-test bookkeeping
+    # ------------------------------------------------------------------
+
+    def start_test(self, test_name, timeout=None):
+        """Attribute subsequent waits to test_name and apply its timeout"""
+        self.current_test = test_name
+        self.timeout = timeout or self.default_timeout
+        self.wait_times.setdefault(test_name, 0.0)
+
+    def time_waited(self, test_name=None):
+        return self.wait_times.get(test_name or self.current_test, 0.0)
+
+    def _until(self, condition, description, timeout=None):
+        start = time.perf_counter()
+        try:
+            return WebDriverWait(self.driver, timeout or self.timeout,
+                                 poll_frequency=self.poll_interval).until(
+                condition, message=f"Timed out waiting for {description}")
+        finally:
+            if self.current_test is not None:
+                self.wait_times[self.current_test] += time.perf_counter() - start
+
+    # ------------------------------------------------------------------
+    # Conditions
+    # ------------------------------------------------------------------
+
+    def for_document_ready(self, timeout=None):
+        """document.readyState is 'complete'"""
+        return self._until(
+            lambda d: d.execute_script("return document.readyState") == "complete",
+            "document ready", timeout)
+
+    def for_route(self, fragment, timeout=None):
+        """The current URL contains fragment (case-insensitive)"""
+        fragment = fragment.lower()
+        return self._until(lambda d: fragment in d.current_url.lower(),
+                           f"route '{fragment}'", timeout)
+
+    def for_react_render(self, selector=REACT_ROOT_SELECTOR, timeout=None):
+        """The React root element has rendered at least one child"""
+        return self._until(lambda d: d.execute_script(REACT_RENDERED_JS, selector),
+                           f"React root {selector} to render", timeout)
+
+    def for_network_idle(self, idle_ms=None, timeout=None):
+        """No request in flight and nothing loaded for idle_ms milliseconds"""
+        idle_ms = self.idle_ms if idle_ms is None else idle_ms
+
+        def idle(driver):
+            state = driver.execute_script(NETWORK_STATE_JS)
+            return (state['readyState'] == 'complete' and state['pending'] == 0
+                    and state['idleFor'] >= idle_ms)
+
+        return self._until(idle, f"network idle ({idle_ms}ms)", timeout)
+
+    def for_page(self, route=None, timeout=None):
+        """Route (optional) + React render + network idle"""
+        if route:
+            self.for_route(route, timeout)
+        self.for_react_render(timeout=timeout)
+        self.for_network_idle(timeout=timeout)
+
+    def for_viewport(self, width, height, timeout=None):
+        """Window resized to width x height and two frames painted"""
+        self._until(
+            lambda d: d.execute_script("return [window.outerWidth, window.outerHeight]") == [width, height]
+            or d.get_window_size() == {'width': width, 'height': height},
+            f"viewport {width}x{height}", timeout)
+        start = time.perf_counter()
+        try:
+            self.driver.execute_async_script(TWO_FRAMES_JS)
+        finally:
+            if self.current_test is not None:
+                self.wait_times[self.current_test] += time.perf_counter() - start